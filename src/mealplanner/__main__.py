@@ -0,0 +1,23 @@
+"""
+Entry point for running the Smart Meal Planner as ``python -m mealplanner``.
+
+Answers a bare ``--version`` directly so the Typer application is only
+imported and built when a command or help text is actually requested.
+"""
+
+import sys
+
+
+def main() -> None:
+    """Run the command-line interface."""
+    if sys.argv[1:] == ["--version"]:
+        from . import __version__
+        print(f"Smart Meal Planner version {__version__}")
+        return
+
+    from .cli import cli_main
+    cli_main()
+
+
+if __name__ == "__main__":
+    main()
@@ -5,29 +5,139 @@ Provides the main CLI using Typer with global options and command management.
 """
 
 import logging
+import os
 import sys
-from pathlib import Path
-from typing import Optional
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Type, Union
 
 import typer
 from typer import Typer
+from typer.core import TyperGroup
 
 from . import __version__
-from .config import init_config, get_config
-from .health import run_health_check, create_missing_directories
-from .plugin_loader import load_plugins
 
 logger = logging.getLogger(__name__)
 
+# Separator lines shared by the listing and report commands
+_RULE_50 = "=" * 50
+_RULE_60 = "=" * 60
+_RULE_70 = "=" * 70
+_DIVIDER_40 = "-" * 40
+_DIVIDER_50 = "-" * 50
+
+# Context meta key holding the arguments that follow the subcommand name
+_SUBCOMMAND_ARGS = "mealplanner.subcommand_args"
+
+
+class _RootGroup(TyperGroup):
+    """Root command group that keeps the invoked subcommand's arguments on the context."""
+
+    def resolve_command(self, ctx, args):
+        # Click clears ctx.args before the root callback runs, so record them here
+        cmd_name, cmd, cmd_args = super().resolve_command(ctx, args)
+        ctx.meta[_SUBCOMMAND_ARGS] = list(cmd_args)
+        return cmd_name, cmd, cmd_args
+
+
 # Create the main Typer app
 app = Typer(
     name="mealplanner",
+    cls=_RootGroup,
     help="Smart Meal Planner - A command-line application for meal planning and recipe management",
     add_completion=False,
     rich_markup_mode="rich"
 )
 
 
+@contextmanager
+def _cli_error_boundary(
+    config,
+    operation: str,
+    expected: Optional[Dict[Type[Exception], str]] = None,
+    message: Optional[str] = None
+) -> Iterator[None]:
+    """
+    Report command errors and exit with a non-zero status.
+
+    Args:
+        config: Active configuration, consulted only when an error occurs
+        operation: Description of the failing operation, e.g. "listing recipes"
+        expected: Anticipated exception types mapped to the message shown and logged
+            for them, e.g. {RecipeImportError: "Import failed"}; these are logged
+            without a traceback
+        message: Message for unexpected errors; defaults to "Error <operation>"
+    """
+    expected = expected or {}
+    message = message or f"Error {operation}"
+    try:
+        yield
+    except typer.Exit:
+        raise
+    except tuple(expected) as e:
+        text = next(text for exc_type, text in expected.items() if isinstance(e, exc_type))
+        typer.echo(f"❌ {text}: {e}", err=True)
+        if config.debug:
+            logger.error(f"{text}: {e}")
+        raise typer.Exit(1)
+    except Exception as e:
+        typer.echo(f"❌ {message}: {e}", err=True)
+        if config.debug:
+            logger.exception(message)
+        raise typer.Exit(1)
+
+
+def _command_name(command_info) -> str:
+    """Return the CLI name Typer derives for a registered command."""
+    return command_info.name or command_info.callback.__name__.replace("_", "-")
+
+
+def _skip_health_check(func):
+    """Mark a read-only command as not needing health checks or plugins."""
+    func.needs_health_check = False
+    return func
+
+
+def _needs_health_check(command_name: Optional[str]) -> bool:
+    """
+    Check whether the named command wants pre-run health checks.
+
+    Args:
+        command_name: CLI name of the invoked subcommand
+
+    Returns:
+        False only for commands marked with _skip_health_check
+    """
+    for command_info in app.registered_commands:
+        if _command_name(command_info) == command_name:
+            return getattr(command_info.callback, "needs_health_check", True)
+    return True
+
+
+def _wants_subcommand_help(ctx: typer.Context) -> bool:
+    """
+    Check whether the invoked subcommand was asked for its help page.
+
+    The subcommand's own parser reads its arguments, so --help given as an
+    option value (e.g. list-recipes --search --help) does not count.
+
+    Args:
+        ctx: Context of the root callback
+
+    Returns:
+        True if the subcommand's help option was passed
+    """
+    name = ctx.invoked_subcommand
+    command = ctx.command.get_command(ctx, name) if name else None
+    if command is None:
+        return False
+    sub_ctx = command.context_class(command, parent=ctx, info_name=name, resilient_parsing=True)
+    help_option = command.get_help_option(sub_ctx)
+    if help_option is None:
+        return False
+    opts, _, _ = command.make_parser(sub_ctx).parse_args(list(ctx.meta.get(_SUBCOMMAND_ARGS, [])))
+    return bool(opts.get(help_option.name))
+
+
 def version_callback(value: bool):
     """Callback for --version flag."""
     if value:
@@ -35,15 +145,19 @@ def version_callback(value: bool):
         raise typer.Exit()
 
 
+# Config file extensions accepted by --config (no extension means .env)
+_VALID_CONFIG_SUFFIXES = frozenset({'.env', '.yaml', '.yml', ''})
+
+
 def validate_config_file(value: Optional[str]) -> Optional[str]:
     """Validate that config file exists if provided."""
     if value is not None:
-        config_path = Path(value)
-        if not config_path.exists():
+        if not os.path.exists(value):
             print(f"Error: Config file not found: {value}", file=sys.stderr)
             raise typer.Exit(1)
-        if config_path.suffix.lower() not in ['.env', '.yaml', '.yml', '']:
-            print(f"Error: Unsupported config file format: {config_path.suffix}", file=sys.stderr)
+        suffix = os.path.splitext(value)[1]
+        if suffix.lower() not in _VALID_CONFIG_SUFFIXES:
+            print(f"Error: Unsupported config file format: {suffix}", file=sys.stderr)
             raise typer.Exit(1)
     return value
 
@@ -76,6 +190,10 @@ def main(
     It offers ingredient-based search, nutritional analysis, shopping list export, and 
     automated email reminders.
     """
+    from .config import init_config
+    from .health import run_health_check, create_missing_directories
+    from .plugin_loader import load_plugins
+
     # Initialize configuration
     try:
         init_config(config_file=config, debug=debug)
@@ -83,14 +201,20 @@ def main(
     except Exception as e:
         typer.echo(f"Error initializing configuration: {e}", err=True)
         raise typer.Exit(1)
-    
+
+    # Subcommand help only renders usage, so skip health checks and plugins
+    if _wants_subcommand_help(ctx):
+        return
+
+    # Read-only commands need neither health checks nor plugins
+    if not _needs_health_check(ctx.invoked_subcommand):
+        return
+
     # Run health checks
     try:
         success, issues = run_health_check()
         if not success:
-            print("Health check failed:", file=sys.stderr)
-            for issue in issues:
-                print(f"  - {issue}", file=sys.stderr)
+            print("\n".join(["Health check failed:", *(f"  - {issue}" for issue in issues)]), file=sys.stderr)
 
             # Try to create missing directories
             try:
@@ -116,12 +240,15 @@ def main(
 
 
 @app.command()
+@_skip_health_check
 def hello():
     """
     A simple hello command to test the CLI setup.
     
     This is a placeholder command for Feature 1 testing.
     """
+    from .config import get_config
+
     config = get_config()
     typer.echo("Hello from Smart Meal Planner!")
     typer.echo(f"Version: {__version__}")
@@ -150,11 +277,15 @@ def init_db(
     Creates all necessary tables and sets up the database for first use.
     Use --force to drop existing tables and recreate them.
     """
+    from .config import get_config
     from .database import init_database, get_database_info, OperationalError
 
     config = get_config()
 
-    try:
+    with _cli_error_boundary(
+        config, "initializing database", {OperationalError: "Database initialization failed"},
+        message="Unexpected error during database initialization"
+    ):
         typer.echo("Initializing database...")
         if config.debug:
             logger.info(f"Database initialization started (force={force})")
@@ -172,30 +303,21 @@ def init_db(
         if config.debug:
             logger.info("Database initialization completed successfully")
 
-    except OperationalError as e:
-        typer.echo(f"❌ Database initialization failed: {e}", err=True)
-        if config.debug:
-            logger.error(f"Database initialization failed: {e}")
-        raise typer.Exit(1)
-    except Exception as e:
-        typer.echo(f"❌ Unexpected error during database initialization: {e}", err=True)
-        if config.debug:
-            logger.exception("Unexpected error during database initialization")
-        raise typer.Exit(1)
-
 
 @app.command()
+@_skip_health_check
 def db_info():
     """
     Show database connection and configuration information.
     """
-    from .database import get_database_info, check_database_connection
+    from .config import get_config
+    from .database import get_database_info
 
     config = get_config()
 
-    try:
+    with _cli_error_boundary(config, "retrieving database information"):
         typer.echo("Database Information:")
-        typer.echo("=" * 50)
+        typer.echo(_RULE_50)
 
         db_info = get_database_info()
 
@@ -218,11 +340,41 @@ def db_info():
         if config.debug:
             logger.info("Database info command completed")
 
-    except Exception as e:
-        typer.echo(f"❌ Error retrieving database information: {e}", err=True)
-        if config.debug:
-            logger.exception("Error retrieving database information")
-        raise typer.Exit(1)
+
+# Row errors shown after an import unless --debug asks for all of them
+_MAX_REPORTED_IMPORT_ERRORS = 20
+
+
+def _echo_import_errors(errors: List[str], show_all: bool = False) -> None:
+    """
+    Write import errors to stderr in a single call.
+
+    Args:
+        errors: Error messages collected during the import
+        show_all: Report every error instead of the first few
+    """
+    shown = errors if show_all else errors[:_MAX_REPORTED_IMPORT_ERRORS]
+    lines = [f"    - {error}" for error in shown]
+    hidden = len(errors) - len(shown)
+    if hidden:
+        lines.append(f"    ... and {hidden} more (use --debug to show all)")
+    typer.echo("\n".join(lines), err=True)
+
+
+def _import_progress() -> Optional[Callable[[int, int, int], None]]:
+    """
+    Build a progress callback that redraws one status line on an interactive stderr.
+
+    Returns:
+        Callback for RecipeImporter, or None when stderr is not a terminal
+    """
+    if not sys.stderr.isatty():
+        return None
+
+    def report(processed: int, imported: int, skipped: int) -> None:
+        typer.echo(f"\r  Processed {processed} ({imported} imported, {skipped} skipped)", nl=False, err=True)
+
+    return report
 
 
 @app.command()
@@ -241,15 +393,22 @@ def import_recipes(
     Required fields: title
     Optional fields: description, prep_time, cook_time, servings, cuisine, dietary_tags, etc.
     """
+    from .config import get_config
     from .recipe_import import RecipeImporter, RecipeImportError
 
     config = get_config()
 
-    try:
+    with _cli_error_boundary(
+        config, "importing recipes", {RecipeImportError: "Import failed"},
+        message="Unexpected error during import"
+    ):
         typer.echo(f"Importing recipes from: {file_path}")
 
         importer = RecipeImporter()
-        imported, skipped, errors = importer.import_from_json(file_path, skip_duplicates)
+        progress = _import_progress()
+        imported, skipped, errors = importer.import_from_json(file_path, skip_duplicates, progress=progress)
+        if progress:
+            typer.echo(err=True)
 
         # Report results
         typer.echo(f"✅ Import completed!")
@@ -259,23 +418,11 @@ def import_recipes(
 
         if errors:
             typer.echo(f"  Errors: {len(errors)}")
-            for error in errors:
-                typer.echo(f"    - {error}", err=True)
+            _echo_import_errors(errors, show_all=config.debug)
 
         if config.debug:
             logger.info(f"Recipe import completed: {imported} imported, {skipped} skipped, {len(errors)} errors")
 
-    except RecipeImportError as e:
-        typer.echo(f"❌ Import failed: {e}", err=True)
-        if config.debug:
-            logger.error(f"Recipe import failed: {e}")
-        raise typer.Exit(1)
-    except Exception as e:
-        typer.echo(f"❌ Unexpected error during import: {e}", err=True)
-        if config.debug:
-            logger.exception("Unexpected error during recipe import")
-        raise typer.Exit(1)
-
 
 @app.command()
 def import_csv(
@@ -293,15 +440,22 @@ def import_csv(
     Required columns: title
     Optional columns: description, prep_time, cook_time, servings, cuisine, dietary_tags, etc.
     """
+    from .config import get_config
     from .recipe_import import RecipeImporter, RecipeImportError
 
     config = get_config()
 
-    try:
+    with _cli_error_boundary(
+        config, "importing recipes from CSV", {RecipeImportError: "Import failed"},
+        message="Unexpected error during import"
+    ):
         typer.echo(f"Importing recipes from CSV: {file_path}")
 
         importer = RecipeImporter()
-        imported, skipped, errors = importer.import_from_csv(file_path, skip_duplicates)
+        progress = _import_progress()
+        imported, skipped, errors = importer.import_from_csv(file_path, skip_duplicates, progress=progress)
+        if progress:
+            typer.echo(err=True)
 
         # Report results
         typer.echo(f"✅ Import completed!")
@@ -311,23 +465,11 @@ def import_csv(
 
         if errors:
             typer.echo(f"  Errors: {len(errors)}")
-            for error in errors:
-                typer.echo(f"    - {error}", err=True)
+            _echo_import_errors(errors, show_all=config.debug)
 
         if config.debug:
             logger.info(f"CSV import completed: {imported} imported, {skipped} skipped, {len(errors)} errors")
 
-    except RecipeImportError as e:
-        typer.echo(f"❌ Import failed: {e}", err=True)
-        if config.debug:
-            logger.error(f"CSV import failed: {e}")
-        raise typer.Exit(1)
-    except Exception as e:
-        typer.echo(f"❌ Unexpected error during import: {e}", err=True)
-        if config.debug:
-            logger.exception("Unexpected error during CSV import")
-        raise typer.Exit(1)
-
 
 @app.command()
 def import_url(
@@ -348,15 +490,22 @@ def import_url(
 
     The URL should return either a single recipe object or an array of recipe objects in JSON format.
     """
+    from .config import get_config
     from .recipe_import import RecipeImporter, RecipeImportError
 
     config = get_config()
 
-    try:
+    with _cli_error_boundary(
+        config, "importing recipes from URL", {RecipeImportError: "Import failed"},
+        message="Unexpected error during import"
+    ):
         typer.echo(f"Importing recipes from URL: {url}")
 
         importer = RecipeImporter()
-        imported, skipped, errors = importer.import_from_url(url, skip_duplicates, timeout)
+        progress = _import_progress()
+        imported, skipped, errors = importer.import_from_url(url, skip_duplicates, timeout, progress=progress)
+        if progress:
+            typer.echo(err=True)
 
         # Report results
         typer.echo(f"✅ Import completed!")
@@ -366,28 +515,16 @@ def import_url(
 
         if errors:
             typer.echo(f"  Errors: {len(errors)}")
-            for error in errors:
-                typer.echo(f"    - {error}", err=True)
+            _echo_import_errors(errors, show_all=config.debug)
 
         if config.debug:
             logger.info(f"URL import completed: {imported} imported, {skipped} skipped, {len(errors)} errors")
 
-    except RecipeImportError as e:
-        typer.echo(f"❌ Import failed: {e}", err=True)
-        if config.debug:
-            logger.error(f"URL import failed: {e}")
-        raise typer.Exit(1)
-    except Exception as e:
-        typer.echo(f"❌ Unexpected error during import: {e}", err=True)
-        if config.debug:
-            logger.exception("Unexpected error during URL import")
-        raise typer.Exit(1)
-
 
 @app.command()
 def list_recipes(
-    page: int = typer.Option(1, "--page", help="Page number"),
-    per_page: int = typer.Option(10, "--per-page", help="Recipes per page"),
+    page: int = typer.Option(1, "--page", min=1, help="Page number"),
+    per_page: int = typer.Option(10, "--per-page", min=1, help="Recipes per page"),
     cuisine: Optional[str] = typer.Option(None, "--cuisine", help="Filter by cuisine"),
     max_time: Optional[int] = typer.Option(None, "--max-time", help="Maximum total time in minutes"),
     diet: Optional[str] = typer.Option(None, "--diet", help="Filter by dietary tag"),
@@ -398,123 +535,380 @@ def list_recipes(
     """
     List recipes with filtering, pagination, and sorting options.
     """
+    from .config import get_config
     from .recipe_management import RecipeManager, RecipeFormatter
 
     config = get_config()
 
-    try:
-        recipes, total_count, total_pages = RecipeManager.list_recipes(
-            page=page,
-            per_page=per_page,
+    with _cli_error_boundary(config, "listing recipes"):
+        total_count = RecipeManager.count_recipes(
             cuisine=cuisine,
             max_time=max_time,
             diet=diet,
-            search=search,
-            sort_by=sort_by
+            search=search
         )
+        total_pages = (total_count + per_page - 1) // per_page
 
-        if not recipes:
+        if page > total_pages:
             typer.echo("No recipes found.")
             return
 
         # Display header
-        typer.echo(f"Recipes (Page {page} of {total_pages}, {total_count} total)")
-        typer.echo("=" * 60)
+        typer.echo(f"Recipes (Page {page} of {total_pages}, {total_count} total)\n{_RULE_60}")
 
-        # Display recipes
-        for recipe in recipes:
+        # Stream recipes as they are fetched rather than materializing the page
+        format_recipe = RecipeFormatter.format_recipe_details if detailed else RecipeFormatter.format_recipe_summary
+        shown = 0
+        for recipe in RecipeManager.iter_recipes(
+            page=page,
+            per_page=per_page,
+            cuisine=cuisine,
+            max_time=max_time,
+            diet=diet,
+            search=search,
+            sort_by=sort_by
+        ):
             if detailed:
-                typer.echo(RecipeFormatter.format_recipe_details(recipe))
-                typer.echo("-" * 40)
+                typer.echo(f"{format_recipe(recipe)}\n{_DIVIDER_40}")
             else:
-                typer.echo(RecipeFormatter.format_recipe_summary(recipe))
+                typer.echo(format_recipe(recipe))
+            shown += 1
 
         # Display pagination info
         if total_pages > 1:
-            typer.echo(f"\nPage {page} of {total_pages}")
+            footer = f"\nPage {page} of {total_pages}"
             if page < total_pages:
-                typer.echo(f"Use --page {page + 1} to see more recipes")
+                footer += f"\nUse --page {page + 1} to see more recipes"
+            typer.echo(footer)
+
+        if config.debug:
+            logger.info(f"Listed {shown} recipes (page {page}/{total_pages})")
+
+
+# Fields accepted by `update-recipe --set` and `update-ingredient --set`, with their value types
+_RECIPE_SET_FIELDS = {
+    "title": str,
+    "description": str,
+    "cuisine": str,
+    "prep_time": int,
+    "cook_time": int,
+    "servings": int,
+}
+_INGREDIENT_SET_FIELDS = {
+    "name": str,
+    "category": str,
+    "calories_per_100g": float,
+    "protein_per_100g": float,
+    "carbs_per_100g": float,
+    "fat_per_100g": float,
+    "fiber_per_100g": float,
+    "sugar_per_100g": float,
+    "sodium_per_100g": float,
+    "common_unit": str,
+    "unit_weight_grams": float,
+}
+
+
+# Ingredient nutrition columns and their prompts in `update-ingredient`
+_NUTRITION_PROMPTS = (
+    ('calories_per_100g', 'Calories per 100g'),
+    ('protein_per_100g', 'Protein per 100g'),
+    ('carbs_per_100g', 'Carbs per 100g'),
+    ('fat_per_100g', 'Fat per 100g'),
+    ('fiber_per_100g', 'Fiber per 100g'),
+    ('sugar_per_100g', 'Sugar per 100g'),
+    ('sodium_per_100g', 'Sodium per 100g (mg)'),
+)
 
-        if config.debug:
-            logger.info(f"Listed {len(recipes)} recipes (page {page}/{total_pages})")
 
-    except Exception as e:
-        typer.echo(f"❌ Error listing recipes: {e}", err=True)
-        if config.debug:
-            logger.exception("Error listing recipes")
-        raise typer.Exit(1)
+def _check_json_value(field: str, value: Any, field_type: type, source: str) -> Any:
+    """
+    Check that a decoded JSON value already has a field's column type.
+
+    Args:
+        field: Field name, used in error messages
+        value: Non-empty decoded JSON value
+        field_type: Column type of the field
+        source: Where the value came from, used in error messages
+
+    Returns:
+        The value as field_type; integral numbers are accepted for int fields
+
+    Raises:
+        typer.BadParameter: If the value is of another type, a boolean, a
+            non-integral number for an int field, or an object or array
+    """
+    if field_type is str:
+        valid = isinstance(value, str)
+    else:
+        # bool is an int subclass, but true/false is never a quantity
+        valid = isinstance(value, (int, float)) and not isinstance(value, bool)
+        if valid and field_type is int:
+            valid = float(value).is_integer()
+    if not valid:
+        raise typer.BadParameter(
+            f"Invalid {field_type.__name__} for '{field}': {value!r}",
+            param_hint=source
+        )
+    return field_type(value)
+
+
+def _coerce_field_updates(
+    values: Dict[str, Any],
+    field_types: Dict[str, type],
+    required: Tuple[str, ...] = (),
+    source: str = "--set",
+    typed: bool = False
+) -> Dict[str, Any]:
+    """
+    Validate field updates and convert values to their column types.
+
+    Args:
+        values: Field names mapped to raw values
+        field_types: Allowed field names mapped to the type used to convert values
+        required: Fields that cannot be cleared with an empty value
+        source: Where the values came from, used in error messages
+        typed: Values are decoded JSON, so check their types instead of parsing strings
+
+    Returns:
+        Dictionary of field updates; empty values map to None
+
+    Raises:
+        typer.BadParameter: If a field is unknown or a value has the wrong type
+    """
+    updates = {}
+    for field, raw in values.items():
+        if field not in field_types:
+            raise typer.BadParameter(
+                f"Unknown field '{field}'. Choose from: {', '.join(field_types)}",
+                param_hint=source
+            )
+        if isinstance(raw, str):
+            raw = raw.strip()
+        if raw is None or raw == "":
+            if field in required:
+                raise typer.BadParameter(f"Field '{field}' cannot be empty", param_hint=source)
+            updates[field] = None
+            continue
+        if typed:
+            updates[field] = _check_json_value(field, raw, field_types[field], source)
+            continue
+        try:
+            updates[field] = field_types[field](raw)
+        except (TypeError, ValueError):
+            raise typer.BadParameter(
+                f"Invalid {field_types[field].__name__} for '{field}': {raw}",
+                param_hint=source
+            )
+    return updates
+
+
+def _parse_field_assignments(
+    values: List[str],
+    field_types: Dict[str, type],
+    required: Tuple[str, ...] = ()
+) -> Dict[str, Any]:
+    """
+    Parse --set FIELD=VALUE options into an updates dictionary.
+
+    Args:
+        values: Raw option values
+        field_types: Allowed field names mapped to the type used to convert values
+        required: Fields that cannot be cleared with an empty value
+
+    Returns:
+        Dictionary of field updates; empty values map to None
+
+    Raises:
+        typer.BadParameter: If a value is malformed, unknown or of the wrong type
+    """
+    raw_values = {}
+    for value in values:
+        field, sep, raw = value.partition("=")
+        if not sep:
+            raise typer.BadParameter(f"Expected FIELD=VALUE, got '{value}'", param_hint="--set")
+        raw_values[field.strip()] = raw
+    return _coerce_field_updates(raw_values, field_types, required)
+
+
+def _read_json_updates(
+    field_types: Dict[str, type],
+    required: Tuple[str, ...] = ()
+) -> Dict[str, Any]:
+    """
+    Read a JSON object of field updates from non-interactive stdin.
+
+    Args:
+        field_types: Allowed field names mapped to the type used to convert values
+        required: Fields that cannot be cleared with null or an empty string
+
+    Returns:
+        Dictionary of field updates; an empty object yields no updates
+
+    Raises:
+        typer.BadParameter: If stdin is empty or not a JSON object of known fields
+    """
+    import json
+
+    text = sys.stdin.read().strip()
+    if not text:
+        # Empty stdin (e.g. cron or CI with </dev/null) must not pass for "no changes"
+        raise typer.BadParameter(
+            "No JSON updates on stdin; pipe a JSON object or run in a terminal to be prompted",
+            param_hint="stdin"
+        )
+    try:
+        data = json.loads(text)
+    except json.JSONDecodeError as e:
+        raise typer.BadParameter(f"Invalid JSON: {e}", param_hint="stdin")
+    if not isinstance(data, dict):
+        raise typer.BadParameter("Expected a JSON object of field updates", param_hint="stdin")
+    return _coerce_field_updates(data, field_types, required, source="stdin", typed=True)
+
+
+def _edit_fields(current: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Open fields as JSON in the user's editor and read back the edited object.
+
+    Args:
+        current: Field names mapped to their current values
+
+    Returns:
+        The edited JSON object
+
+    Raises:
+        ValueError: If the editor exits with an error
+        typer.BadParameter: If the editor does not leave a JSON object behind
+    """
+    import json
+    import shlex
+    import subprocess
+    import tempfile
+
+    editor = os.getenv("VISUAL") or os.getenv("EDITOR") or ("notepad" if os.name == "nt" else "vi")
+    fd, path = tempfile.mkstemp(prefix="mealplanner-", suffix=".json")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(current, f, indent=2)
+            f.write("\n")
+        if subprocess.call([*shlex.split(editor), path]) != 0:
+            raise ValueError(f"Editor '{editor}' exited with an error")
+        with open(path, "r") as f:
+            text = f.read()
+    finally:
+        os.unlink(path)
+
+    try:
+        data = json.loads(text)
+    except json.JSONDecodeError as e:
+        raise typer.BadParameter(f"Invalid JSON: {e}", param_hint="--edit")
+    if not isinstance(data, dict):
+        raise typer.BadParameter("Expected a JSON object of fields", param_hint="--edit")
+    return data
 
 
 @app.command()
 def update_recipe(
-    recipe_id: int = typer.Argument(..., help="Recipe ID to update")
+    recipe_id: int = typer.Argument(..., help="Recipe ID to update"),
+    assignments: Optional[List[str]] = typer.Option(
+        None,
+        "--set",
+        help=f"Set FIELD=VALUE without prompting; repeatable, empty VALUE clears. Fields: {', '.join(_RECIPE_SET_FIELDS)}"
+    ),
+    edit: bool = typer.Option(False, "--edit", help="Edit all fields at once as JSON in $VISUAL/$EDITOR")
 ):
     """
     Interactively update a recipe's fields.
 
     This command will prompt you to update various fields of the recipe.
     Press Enter to keep the current value, or type a new value to change it.
+    Pass --set FIELD=VALUE one or more times to update without prompting, or
+    --edit to change every field in one editor session.
     """
+    from .config import get_config
     from .recipe_management import RecipeManager, RecipeFormatter
 
     config = get_config()
 
-    try:
+    if assignments and edit:
+        raise typer.BadParameter("--set and --edit cannot be combined", param_hint="--edit")
+
+    # Validate --set values before touching the database so mistakes are usage errors
+    set_updates = _parse_field_assignments(assignments, _RECIPE_SET_FIELDS, required=("title",)) if assignments else None
+
+    with _cli_error_boundary(config, "updating recipe"):
         # Get the recipe
         recipe = RecipeManager.get_recipe_by_id(recipe_id)
         if not recipe:
             typer.echo(f"❌ Recipe with ID {recipe_id} not found.", err=True)
             raise typer.Exit(1)
 
-        typer.echo("Current recipe:")
-        typer.echo(RecipeFormatter.format_recipe_details(recipe))
-        typer.echo("\nUpdate recipe (press Enter to keep current value):")
-
-        updates = {}
+    # Like --set, editor values are validated outside the boundary so mistakes are usage errors
+    if edit:
+        current = {field: getattr(recipe, field) for field in _RECIPE_SET_FIELDS}
+        try:
+            edited_fields = _edit_fields(current)
+        except (OSError, ValueError) as e:
+            typer.echo(f"❌ {e}", err=True)
+            raise typer.Exit(1)
+        edited = _coerce_field_updates(
+            edited_fields, _RECIPE_SET_FIELDS, required=("title",), source="--edit", typed=True
+        )
+        set_updates = {field: value for field, value in edited.items() if value != current[field]}
 
-        # Title
-        new_title = typer.prompt(f"Title", default=recipe.title)
-        if new_title != recipe.title:
-            updates['title'] = new_title
-
-        # Description
-        current_desc = recipe.description or ""
-        new_desc = typer.prompt(f"Description", default=current_desc)
-        if new_desc != current_desc:
-            updates['description'] = new_desc if new_desc else None
-
-        # Cuisine
-        current_cuisine = recipe.cuisine or ""
-        new_cuisine = typer.prompt(f"Cuisine", default=current_cuisine)
-        if new_cuisine != current_cuisine:
-            updates['cuisine'] = new_cuisine if new_cuisine else None
-
-        # Prep time
-        current_prep = str(recipe.prep_time) if recipe.prep_time else ""
-        new_prep = typer.prompt(f"Prep time (minutes)", default=current_prep)
-        if new_prep != current_prep:
-            try:
-                updates['prep_time'] = int(new_prep) if new_prep else None
-            except ValueError:
-                typer.echo("Invalid prep time, keeping current value")
+    with _cli_error_boundary(config, "updating recipe"):
+        if set_updates is not None:
+            updates = set_updates
+        else:
+            typer.echo("Current recipe:")
+            typer.echo(RecipeFormatter.format_recipe_details(recipe))
+            typer.echo("\nUpdate recipe (press Enter to keep current value):")
+
+            updates = {}
+
+            # Title
+            new_title = typer.prompt(f"Title", default=recipe.title)
+            if new_title != recipe.title:
+                updates['title'] = new_title
+
+            # Description
+            current_desc = recipe.description or ""
+            new_desc = typer.prompt(f"Description", default=current_desc)
+            if new_desc != current_desc:
+                updates['description'] = new_desc if new_desc else None
+
+            # Cuisine
+            current_cuisine = recipe.cuisine or ""
+            new_cuisine = typer.prompt(f"Cuisine", default=current_cuisine)
+            if new_cuisine != current_cuisine:
+                updates['cuisine'] = new_cuisine if new_cuisine else None
+
+            # Prep time
+            current_prep = str(recipe.prep_time) if recipe.prep_time else ""
+            new_prep = typer.prompt(f"Prep time (minutes)", default=current_prep)
+            if new_prep != current_prep:
+                try:
+                    updates['prep_time'] = int(new_prep) if new_prep else None
+                except ValueError:
+                    typer.echo("Invalid prep time, keeping current value")
 
-        # Cook time
-        current_cook = str(recipe.cook_time) if recipe.cook_time else ""
-        new_cook = typer.prompt(f"Cook time (minutes)", default=current_cook)
-        if new_cook != current_cook:
-            try:
-                updates['cook_time'] = int(new_cook) if new_cook else None
-            except ValueError:
-                typer.echo("Invalid cook time, keeping current value")
+            # Cook time
+            current_cook = str(recipe.cook_time) if recipe.cook_time else ""
+            new_cook = typer.prompt(f"Cook time (minutes)", default=current_cook)
+            if new_cook != current_cook:
+                try:
+                    updates['cook_time'] = int(new_cook) if new_cook else None
+                except ValueError:
+                    typer.echo("Invalid cook time, keeping current value")
 
-        # Servings
-        current_servings = str(recipe.servings) if recipe.servings else ""
-        new_servings = typer.prompt(f"Servings", default=current_servings)
-        if new_servings != current_servings:
-            try:
-                updates['servings'] = int(new_servings) if new_servings else None
-            except ValueError:
-                typer.echo("Invalid servings, keeping current value")
+            # Servings
+            current_servings = str(recipe.servings) if recipe.servings else ""
+            new_servings = typer.prompt(f"Servings", default=current_servings)
+            if new_servings != current_servings:
+                try:
+                    updates['servings'] = int(new_servings) if new_servings else None
+                except ValueError:
+                    typer.echo("Invalid servings, keeping current value")
 
         if not updates:
             typer.echo("No changes made.")
@@ -532,12 +926,6 @@ def update_recipe(
         if config.debug:
             logger.info(f"Updated recipe {recipe_id}: {list(updates.keys())}")
 
-    except Exception as e:
-        typer.echo(f"❌ Error updating recipe: {e}", err=True)
-        if config.debug:
-            logger.exception("Error updating recipe")
-        raise typer.Exit(1)
-
 
 @app.command()
 def delete_recipe(
@@ -550,11 +938,12 @@ def delete_recipe(
     This will permanently delete the recipe and remove it from any meal plans.
     Use --force to skip the confirmation prompt.
     """
+    from .config import get_config
     from .recipe_management import RecipeManager, RecipeFormatter
 
     config = get_config()
 
-    try:
+    with _cli_error_boundary(config, "deleting recipe"):
         # Get the recipe
         recipe = RecipeManager.get_recipe_by_id(recipe_id)
         if not recipe:
@@ -586,11 +975,43 @@ def delete_recipe(
         if config.debug:
             logger.info(f"Deleted recipe {recipe_id}: {recipe.title}")
 
-    except Exception as e:
-        typer.echo(f"❌ Error deleting recipe: {e}", err=True)
-        if config.debug:
-            logger.exception("Error deleting recipe")
-        raise typer.Exit(1)
+
+_RANGE_NUTRIENTS = ("calories", "protein", "carbs", "fat", "fiber")
+
+
+def _parse_nutrient_ranges(values: List[str]) -> Dict[str, Tuple[Optional[float], Optional[float]]]:
+    """
+    Parse --range values of the form NUTRIENT=MIN:MAX.
+
+    Args:
+        values: Raw option values; either bound may be left empty
+
+    Returns:
+        Mapping of nutrient name to (minimum, maximum)
+
+    Raises:
+        typer.BadParameter: If a value is malformed or names an unknown nutrient
+    """
+    ranges = {}
+    for value in values:
+        nutrient, sep, bounds = value.partition("=")
+        nutrient = nutrient.strip().lower()
+        low, colon, high = bounds.partition(":")
+        if not sep or not colon:
+            raise typer.BadParameter(f"Expected NUTRIENT=MIN:MAX, got '{value}'", param_hint="--range")
+        if nutrient not in _RANGE_NUTRIENTS:
+            raise typer.BadParameter(
+                f"Unknown nutrient '{nutrient}'. Choose from: {', '.join(_RANGE_NUTRIENTS)}",
+                param_hint="--range"
+            )
+        try:
+            ranges[nutrient] = (
+                float(low) if low.strip() else None,
+                float(high) if high.strip() else None,
+            )
+        except ValueError:
+            raise typer.BadParameter(f"Range bounds must be numbers, got '{value}'", param_hint="--range")
+    return ranges
 
 
 @app.command()
@@ -607,6 +1028,11 @@ def search_ingredients(
     max_fat: Optional[float] = typer.Option(None, "--max-fat", help="Maximum fat per 100g"),
     min_fiber: Optional[float] = typer.Option(None, "--min-fiber", help="Minimum fiber per 100g"),
     max_fiber: Optional[float] = typer.Option(None, "--max-fiber", help="Maximum fiber per 100g"),
+    nutrient_range: Optional[List[str]] = typer.Option(
+        None,
+        "--range",
+        help="Nutrient range per 100g as NUTRIENT=MIN:MAX, either bound optional (e.g. calories=10:300, protein=5:). Repeatable"
+    ),
     sort_by: str = typer.Option("name", "--sort-by", help="Sort by field (name, category, calories_per_100g, protein_per_100g)"),
     sort_order: str = typer.Option("asc", "--sort-order", help="Sort order (asc, desc)"),
     page: int = typer.Option(1, "--page", help="Page number"),
@@ -619,26 +1045,42 @@ def search_ingredients(
     Filter ingredients by nutritional content, category, and other criteria.
     Supports pagination and sorting for large result sets.
     """
+    from .config import get_config
     from .ingredient_search import IngredientSearchCriteria, IngredientSearcher
     from .ingredient_management import IngredientFormatter
 
     config = get_config()
 
-    try:
+    # Explicit --min-*/--max-* options take precedence over --range bounds
+    bounds = {
+        "calories": [min_calories, max_calories],
+        "protein": [min_protein, max_protein],
+        "carbs": [min_carbs, max_carbs],
+        "fat": [min_fat, max_fat],
+        "fiber": [min_fiber, max_fiber],
+    }
+    for nutrient, (low, high) in _parse_nutrient_ranges(nutrient_range or []).items():
+        current = bounds[nutrient]
+        if current[0] is None:
+            current[0] = low
+        if current[1] is None:
+            current[1] = high
+
+    with _cli_error_boundary(config, "searching ingredients"):
         # Create search criteria
         criteria = IngredientSearchCriteria(
             search_term=search_term,
             category=category,
-            min_calories=min_calories,
-            max_calories=max_calories,
-            min_protein=min_protein,
-            max_protein=max_protein,
-            min_carbs=min_carbs,
-            max_carbs=max_carbs,
-            min_fat=min_fat,
-            max_fat=max_fat,
-            min_fiber=min_fiber,
-            max_fiber=max_fiber,
+            min_calories=bounds["calories"][0],
+            max_calories=bounds["calories"][1],
+            min_protein=bounds["protein"][0],
+            max_protein=bounds["protein"][1],
+            min_carbs=bounds["carbs"][0],
+            max_carbs=bounds["carbs"][1],
+            min_fat=bounds["fat"][0],
+            max_fat=bounds["fat"][1],
+            min_fiber=bounds["fiber"][0],
+            max_fiber=bounds["fiber"][1],
             sort_by=sort_by,
             sort_order=sort_order
         )
@@ -651,32 +1093,29 @@ def search_ingredients(
             typer.echo("No ingredients found matching the criteria.")
             return
 
-        # Display header
-        typer.echo(f"Ingredients (Page {page} of {total_pages}, {total_count} total)")
-        typer.echo("=" * 70)
+        # Collect the page and echo it once instead of once per line
+        lines = [f"Ingredients (Page {page} of {total_pages}, {total_count} total)", _RULE_70]
 
         # Display ingredients
-        for ingredient in ingredients:
-            if detailed:
-                typer.echo(IngredientFormatter.format_ingredient_details(ingredient))
-                typer.echo("-" * 50)
-            else:
-                typer.echo(IngredientFormatter.format_ingredient_summary(ingredient))
+        if detailed:
+            iter_details = IngredientFormatter.iter_ingredient_details
+            for ingredient in ingredients:
+                lines.extend(iter_details(ingredient))
+                lines.append(_DIVIDER_50)
+        else:
+            format_summary = IngredientFormatter.format_ingredient_summary
+            lines.extend(format_summary(ingredient) for ingredient in ingredients)
 
         # Display pagination info
         if total_pages > 1:
-            typer.echo(f"\nPage {page} of {total_pages}")
+            lines.append(f"\nPage {page} of {total_pages}")
             if page < total_pages:
-                typer.echo(f"Use --page {page + 1} to see more ingredients")
+                lines.append(f"Use --page {page + 1} to see more ingredients")
 
-        if config.debug:
-            logger.info(f"Found {len(ingredients)} ingredients (page {page}/{total_pages})")
+        typer.echo("\n".join(lines))
 
-    except Exception as e:
-        typer.echo(f"❌ Error searching ingredients: {e}", err=True)
         if config.debug:
-            logger.exception("Error searching ingredients")
-        raise typer.Exit(1)
+            logger.info(f"Found {len(ingredients)} ingredients (page {page}/{total_pages})")
 
 
 @app.command()
@@ -692,11 +1131,12 @@ def list_ingredients(
     """
     List ingredients with filtering, pagination, and sorting options.
     """
+    from .config import get_config
     from .ingredient_management import IngredientManager, IngredientFormatter
 
     config = get_config()
 
-    try:
+    with _cli_error_boundary(config, "listing ingredients"):
         ingredients, total_count, total_pages = IngredientManager.list_ingredients(
             page=page,
             per_page=per_page,
@@ -710,32 +1150,29 @@ def list_ingredients(
             typer.echo("No ingredients found.")
             return
 
-        # Display header
-        typer.echo(f"Ingredients (Page {page} of {total_pages}, {total_count} total)")
-        typer.echo("=" * 70)
+        # Collect the page and echo it once instead of once per line
+        lines = [f"Ingredients (Page {page} of {total_pages}, {total_count} total)", _RULE_70]
 
         # Display ingredients
-        for ingredient in ingredients:
-            if detailed:
-                typer.echo(IngredientFormatter.format_ingredient_details(ingredient))
-                typer.echo("-" * 50)
-            else:
-                typer.echo(IngredientFormatter.format_ingredient_summary(ingredient))
+        if detailed:
+            iter_details = IngredientFormatter.iter_ingredient_details
+            for ingredient in ingredients:
+                lines.extend(iter_details(ingredient))
+                lines.append(_DIVIDER_50)
+        else:
+            format_summary = IngredientFormatter.format_ingredient_summary
+            lines.extend(format_summary(ingredient) for ingredient in ingredients)
 
         # Display pagination info
         if total_pages > 1:
-            typer.echo(f"\nPage {page} of {total_pages}")
+            lines.append(f"\nPage {page} of {total_pages}")
             if page < total_pages:
-                typer.echo(f"Use --page {page + 1} to see more ingredients")
+                lines.append(f"Use --page {page + 1} to see more ingredients")
 
-        if config.debug:
-            logger.info(f"Listed {len(ingredients)} ingredients (page {page}/{total_pages})")
+        typer.echo("\n".join(lines))
 
-    except Exception as e:
-        typer.echo(f"❌ Error listing ingredients: {e}", err=True)
         if config.debug:
-            logger.exception("Error listing ingredients")
-        raise typer.Exit(1)
+            logger.info(f"Listed {len(ingredients)} ingredients (page {page}/{total_pages})")
 
 
 @app.command()
@@ -757,11 +1194,12 @@ def add_ingredient(
 
     Specify nutritional information per 100g and optional unit conversions.
     """
+    from .config import get_config
     from .ingredient_management import IngredientManager, IngredientFormatter
 
     config = get_config()
 
-    try:
+    with _cli_error_boundary(config, "adding ingredient"):
         # Check if ingredient already exists
         existing = IngredientManager.get_ingredient_by_name(name)
         if existing:
@@ -789,85 +1227,96 @@ def add_ingredient(
         if config.debug:
             logger.info(f"Added ingredient: {ingredient.name} (ID: {ingredient.id})")
 
-    except Exception as e:
-        typer.echo(f"❌ Error adding ingredient: {e}", err=True)
-        if config.debug:
-            logger.exception("Error adding ingredient")
-        raise typer.Exit(1)
-
 
 @app.command()
 def update_ingredient(
-    ingredient_id: int = typer.Argument(..., help="Ingredient ID to update")
+    ingredient_id: int = typer.Argument(..., help="Ingredient ID to update"),
+    assignments: Optional[List[str]] = typer.Option(
+        None,
+        "--set",
+        help=f"Set FIELD=VALUE without prompting; repeatable, empty VALUE clears. Fields: {', '.join(_INGREDIENT_SET_FIELDS)}"
+    )
 ):
     """
     Interactively update an ingredient's fields.
 
     This command will prompt you to update various fields of the ingredient.
     Press Enter to keep the current value, or type a new value to change it.
+    Pass --set FIELD=VALUE one or more times to update without prompting.
+
+    When stdin is not a terminal, piped input is read as one JSON object of
+    updates such as {"calories_per_100g": 52}, not as answers to the prompts;
+    empty stdin is an error.
     """
+    from .config import get_config
     from .ingredient_management import IngredientManager, IngredientFormatter
 
     config = get_config()
 
-    try:
-        # Get the ingredient
-        ingredient = IngredientManager.get_ingredient_by_id(ingredient_id)
-        if not ingredient:
-            typer.echo(f"❌ Ingredient with ID {ingredient_id} not found.", err=True)
-            raise typer.Exit(1)
-
-        typer.echo("Current ingredient:")
-        typer.echo(IngredientFormatter.format_ingredient_details(ingredient))
-        typer.echo("\nUpdate ingredient (press Enter to keep current value):")
-
-        updates = {}
+    # Validate --set values (or piped JSON) before touching the database so mistakes are usage errors
+    set_updates = None
+    if assignments:
+        set_updates = _parse_field_assignments(assignments, _INGREDIENT_SET_FIELDS, required=("name",))
+    elif not sys.stdin.isatty():
+        set_updates = _read_json_updates(_INGREDIENT_SET_FIELDS, required=("name",))
+
+    with _cli_error_boundary(config, "updating ingredient"):
+        if set_updates is not None:
+            # Nothing to show, so let update_ingredient report a missing ID;
+            # an empty update never reaches it, so look that ID up here
+            updates = set_updates
+            if not updates and not IngredientManager.get_ingredient_by_id(ingredient_id):
+                typer.echo(f"❌ Ingredient with ID {ingredient_id} not found.", err=True)
+                raise typer.Exit(1)
+        else:
+            # Get the ingredient
+            ingredient = IngredientManager.get_ingredient_by_id(ingredient_id)
+            if not ingredient:
+                typer.echo(f"❌ Ingredient with ID {ingredient_id} not found.", err=True)
+                raise typer.Exit(1)
 
-        # Name
-        new_name = typer.prompt(f"Name", default=ingredient.name)
-        if new_name != ingredient.name:
-            updates['name'] = new_name
-
-        # Category
-        current_category = ingredient.category or ""
-        new_category = typer.prompt(f"Category", default=current_category)
-        if new_category != current_category:
-            updates['category'] = new_category if new_category else None
-
-        # Nutritional fields
-        nutrition_fields = [
-            ('calories_per_100g', 'Calories per 100g'),
-            ('protein_per_100g', 'Protein per 100g'),
-            ('carbs_per_100g', 'Carbs per 100g'),
-            ('fat_per_100g', 'Fat per 100g'),
-            ('fiber_per_100g', 'Fiber per 100g'),
-            ('sugar_per_100g', 'Sugar per 100g'),
-            ('sodium_per_100g', 'Sodium per 100g (mg)')
-        ]
-
-        for field, prompt_text in nutrition_fields:
-            current_value = str(getattr(ingredient, field)) if getattr(ingredient, field) else ""
-            new_value = typer.prompt(prompt_text, default=current_value)
-            if new_value != current_value:
+            typer.echo("Current ingredient:")
+            typer.echo(IngredientFormatter.format_ingredient_details(ingredient))
+            typer.echo("\nUpdate ingredient (press Enter to keep current value):")
+
+            updates = {}
+
+            # Name
+            new_name = typer.prompt(f"Name", default=ingredient.name)
+            if new_name != ingredient.name:
+                updates['name'] = new_name
+
+            # Category
+            current_category = ingredient.category or ""
+            new_category = typer.prompt(f"Category", default=current_category)
+            if new_category != current_category:
+                updates['category'] = new_category if new_category else None
+
+            # Nutritional fields
+            for field, prompt_text in _NUTRITION_PROMPTS:
+                value = getattr(ingredient, field)
+                current_value = str(value) if value else ""
+                new_value = typer.prompt(prompt_text, default=current_value)
+                if new_value != current_value:
+                    try:
+                        updates[field] = float(new_value) if new_value else None
+                    except ValueError:
+                        typer.echo(f"Invalid value for {prompt_text}, keeping current value")
+
+            # Common unit
+            current_unit = ingredient.common_unit or ""
+            new_unit = typer.prompt(f"Common unit", default=current_unit)
+            if new_unit != current_unit:
+                updates['common_unit'] = new_unit if new_unit else None
+
+            # Unit weight
+            current_weight = str(ingredient.unit_weight_grams) if ingredient.unit_weight_grams else ""
+            new_weight = typer.prompt(f"Unit weight (grams)", default=current_weight)
+            if new_weight != current_weight:
                 try:
-                    updates[field] = float(new_value) if new_value else None
+                    updates['unit_weight_grams'] = float(new_weight) if new_weight else None
                 except ValueError:
-                    typer.echo(f"Invalid value for {prompt_text}, keeping current value")
-
-        # Common unit
-        current_unit = ingredient.common_unit or ""
-        new_unit = typer.prompt(f"Common unit", default=current_unit)
-        if new_unit != current_unit:
-            updates['common_unit'] = new_unit if new_unit else None
-
-        # Unit weight
-        current_weight = str(ingredient.unit_weight_grams) if ingredient.unit_weight_grams else ""
-        new_weight = typer.prompt(f"Unit weight (grams)", default=current_weight)
-        if new_weight != current_weight:
-            try:
-                updates['unit_weight_grams'] = float(new_weight) if new_weight else None
-            except ValueError:
-                typer.echo("Invalid unit weight, keeping current value")
+                    typer.echo("Invalid unit weight, keeping current value")
 
         if not updates:
             typer.echo("No changes made.")
@@ -879,18 +1328,12 @@ def update_ingredient(
             typer.echo("✅ Ingredient updated successfully!")
             typer.echo(IngredientFormatter.format_ingredient_details(updated_ingredient))
         else:
-            typer.echo("❌ Failed to update ingredient.", err=True)
+            typer.echo(f"❌ Ingredient with ID {ingredient_id} not found.", err=True)
             raise typer.Exit(1)
 
         if config.debug:
             logger.info(f"Updated ingredient {ingredient_id}: {list(updates.keys())}")
 
-    except Exception as e:
-        typer.echo(f"❌ Error updating ingredient: {e}", err=True)
-        if config.debug:
-            logger.exception("Error updating ingredient")
-        raise typer.Exit(1)
-
 
 @app.command()
 def delete_ingredient(
@@ -903,11 +1346,23 @@ def delete_ingredient(
     This will permanently delete the ingredient and remove it from any recipes.
     Use --force to skip the confirmation prompt.
     """
+    from .config import get_config
     from .ingredient_management import IngredientManager, IngredientFormatter
 
     config = get_config()
 
-    try:
+    with _cli_error_boundary(config, "deleting ingredient"):
+        if force:
+            # No confirmation to show, so look up and delete in one session
+            name = IngredientManager.delete_ingredient_returning_name(ingredient_id)
+            if name is None:
+                typer.echo(f"❌ Ingredient with ID {ingredient_id} not found.", err=True)
+                raise typer.Exit(1)
+            typer.echo(f"✅ Ingredient '{name}' deleted successfully!")
+            if config.debug:
+                logger.info(f"Deleted ingredient {ingredient_id}: {name}")
+            return
+
         # Get the ingredient
         ingredient = IngredientManager.get_ingredient_by_id(ingredient_id)
         if not ingredient:
@@ -919,14 +1374,13 @@ def delete_ingredient(
         typer.echo(IngredientFormatter.format_ingredient_details(ingredient))
 
         # Confirmation
-        if not force:
-            confirm = typer.confirm(
-                f"\nAre you sure you want to delete '{ingredient.name}'? "
-                "This will also remove it from any recipes."
-            )
-            if not confirm:
-                typer.echo("Deletion cancelled.")
-                return
+        confirm = typer.confirm(
+            f"\nAre you sure you want to delete '{ingredient.name}'? "
+            "This will also remove it from any recipes."
+        )
+        if not confirm:
+            typer.echo("Deletion cancelled.")
+            return
 
         # Delete the ingredient
         success = IngredientManager.delete_ingredient(ingredient_id)
@@ -939,82 +1393,73 @@ def delete_ingredient(
         if config.debug:
             logger.info(f"Deleted ingredient {ingredient_id}: {ingredient.name}")
 
-    except Exception as e:
-        typer.echo(f"❌ Error deleting ingredient: {e}", err=True)
-        if config.debug:
-            logger.exception("Error deleting ingredient")
-        raise typer.Exit(1)
-
 
 @app.command()
-def ingredient_stats():
+def ingredient_stats(
+    json_output: bool = typer.Option(False, "--json", help="Print the statistics as compact JSON")
+):
     """
     Show ingredient database statistics and analytics.
 
     Displays information about ingredient categories, nutritional averages,
-    and most frequently used ingredients.
+    and most frequently used ingredients. Use --json for machine-readable output.
     """
+    from .config import get_config
     from .ingredient_management import IngredientManager
-    from .ingredient_search import IngredientSearcher
+    from .statistics_cache import cached_statistics
 
     config = get_config()
 
-    try:
-        stats = IngredientManager.get_ingredient_statistics()
+    with _cli_error_boundary(config, "generating ingredient statistics"):
+        stats = cached_statistics("stats", IngredientManager.get_ingredient_statistics)
+
+        # Nothing to analyse on an empty database, so skip the insight query
+        if not stats['total_ingredients'] and not json_output:
+            typer.echo("No ingredients in database.")
+            return
+
+        extended = cached_statistics("extended", IngredientManager.get_extended_statistics)
+
+        if json_output:
+            import json
+            typer.echo(json.dumps(dict(stats, insights=extended), separators=(",", ":")))
+            return
 
-        typer.echo("📊 Ingredient Database Statistics")
-        typer.echo("=" * 50)
+        # Build the whole report and echo it once
+        out = ["📊 Ingredient Database Statistics", _RULE_50]
 
         # Basic counts
-        typer.echo(f"Total ingredients: {stats['total_ingredients']}")
+        out.append(f"Total ingredients: {stats['total_ingredients']}")
 
         # Categories
         if stats['categories']:
-            typer.echo(f"\nIngredients by category:")
-            for category, count in sorted(stats['categories'].items()):
-                typer.echo(f"  {category}: {count}")
+            out.append("\nIngredients by category:")
+            out.extend(f"  {category}: {count}" for category, count in sorted(stats['categories'].items()))
 
         # Nutritional averages
-        typer.echo(f"\nNutritional averages (per 100g):")
+        out.append("\nNutritional averages (per 100g):")
         if stats['avg_calories_per_100g']:
-            typer.echo(f"  Average calories: {stats['avg_calories_per_100g']}")
+            out.append(f"  Average calories: {stats['avg_calories_per_100g']}")
         if stats['avg_protein_per_100g']:
-            typer.echo(f"  Average protein: {stats['avg_protein_per_100g']}g")
+            out.append(f"  Average protein: {stats['avg_protein_per_100g']}g")
 
         # Most used ingredients
         if stats['most_used']:
-            typer.echo(f"\nMost used ingredients in recipes:")
-            for name, count in stats['most_used']:
-                typer.echo(f"  {name}: used in {count} recipe(s)")
+            out.append("\nMost used ingredients in recipes:")
+            out.extend(f"  {name}: used in {count} recipe(s)" for name, count in stats['most_used'])
 
-        # Quick nutrition searches
-        typer.echo(f"\nQuick nutrition insights:")
+        # Quick nutrition insights
+        out.append("\nQuick nutrition insights:")
+        out.append(f"  High protein ingredients (≥15g): {extended['high_protein']}")
+        out.append(f"  Low calorie ingredients (≤50 cal): {extended['low_calorie']}")
+        out.append(f"  High fiber ingredients (≥5g): {extended['high_fiber']}")
+        out.append(f"  Available categories: {extended['categories']}")
 
-        # High protein ingredients
-        high_protein = IngredientSearcher.find_high_protein_ingredients(min_protein=15)
-        typer.echo(f"  High protein ingredients (≥15g): {len(high_protein)}")
-
-        # Low calorie ingredients
-        low_calorie = IngredientSearcher.find_low_calorie_ingredients(max_calories=50)
-        typer.echo(f"  Low calorie ingredients (≤50 cal): {len(low_calorie)}")
-
-        # High fiber ingredients
-        high_fiber = IngredientSearcher.find_high_fiber_ingredients(min_fiber=5)
-        typer.echo(f"  High fiber ingredients (≥5g): {len(high_fiber)}")
-
-        # Categories
-        categories = IngredientSearcher.get_ingredient_categories()
-        typer.echo(f"  Available categories: {len(categories)}")
+        typer.echo("\n".join(out))
 
         if config.debug:
             logger.info("Generated ingredient statistics")
 
-    except Exception as e:
-        typer.echo(f"❌ Error generating ingredient statistics: {e}", err=True)
-        if config.debug:
-            logger.exception("Error generating ingredient statistics")
-        raise typer.Exit(1)
-
 
 @app.command()
 def schedule_meal(
@@ -1031,13 +1476,14 @@ def schedule_meal(
     Schedule a recipe for breakfast, lunch, dinner, or snack on a specific date.
     By default, conflicts (multiple meals of same type on same date) are not allowed.
     """
+    from .config import get_config
     from datetime import datetime
     from .meal_planning import MealPlanner, MealPlanningError
     from .models import MealType
 
     config = get_config()
 
-    try:
+    with _cli_error_boundary(config, "scheduling meal", {MealPlanningError: "Scheduling failed"}):
         # Parse date
         try:
             parsed_date = datetime.strptime(target_date, "%Y-%m-%d").date()
@@ -1075,17 +1521,6 @@ def schedule_meal(
         if config.debug:
             logger.info(f"Scheduled meal plan {plan.id} for {parsed_date}")
 
-    except MealPlanningError as e:
-        typer.echo(f"❌ Scheduling failed: {e}", err=True)
-        if config.debug:
-            logger.error(f"Meal scheduling failed: {e}")
-        raise typer.Exit(1)
-    except Exception as e:
-        typer.echo(f"❌ Error scheduling meal: {e}", err=True)
-        if config.debug:
-            logger.exception("Error scheduling meal")
-        raise typer.Exit(1)
-
 
 @app.command()
 def view_calendar(
@@ -1100,12 +1535,13 @@ def view_calendar(
     Show weekly or monthly calendar with meal plans. Use --detailed to include
     recipe information in the calendar view.
     """
+    from .config import get_config
     from datetime import datetime, date
     from .calendar_management import CalendarManager
 
     config = get_config()
 
-    try:
+    with _cli_error_boundary(config, "displaying calendar"):
         # Parse target date
         if target_date:
             try:
@@ -1126,7 +1562,7 @@ def view_calendar(
             # Display weekly calendar
             typer.echo(f"📅 Weekly Calendar - Week {calendar_data['week_number']}")
             typer.echo(f"Week of {calendar_data['start_date']} to {calendar_data['end_date']}")
-            typer.echo("=" * 70)
+            typer.echo(_RULE_70)
 
             for day in calendar_data['days']:
                 day_header = f"{day['day_name']} {day['date']}"
@@ -1173,7 +1609,7 @@ def view_calendar(
 
             # Display monthly calendar
             typer.echo(f"📅 Monthly Calendar - {calendar_data['month_name']} {calendar_data['year']}")
-            typer.echo("=" * 70)
+            typer.echo(_RULE_70)
 
             # Group days by week for better display
             weeks = []
@@ -1206,12 +1642,6 @@ def view_calendar(
         if config.debug:
             logger.info(f"Displayed {view_type} calendar for {parsed_date}")
 
-    except Exception as e:
-        typer.echo(f"❌ Error displaying calendar: {e}", err=True)
-        if config.debug:
-            logger.exception("Error displaying calendar")
-        raise typer.Exit(1)
-
 
 @app.command()
 def list_plans(
@@ -1227,13 +1657,14 @@ def list_plans(
     Display meal plans for a date range with optional filtering by meal type
     and completion status.
     """
+    from .config import get_config
     from datetime import datetime, date
     from .meal_planning import MealPlanner
     from .models import MealType
 
     config = get_config()
 
-    try:
+    with _cli_error_boundary(config, "listing meal plans"):
         # Parse dates
         if start_date:
             try:
@@ -1280,7 +1711,7 @@ def list_plans(
         # Display header
         date_range = f"{parsed_start}" if parsed_start == parsed_end else f"{parsed_start} to {parsed_end}"
         typer.echo(f"Meal Plans ({date_range}) - {len(plans)} found")
-        typer.echo("=" * 70)
+        typer.echo(_RULE_70)
 
         # Get recipe details for display
         recipe_cache = {}
@@ -1341,12 +1772,6 @@ def list_plans(
         if config.debug:
             logger.info(f"Listed {len(plans)} meal plans for {date_range}")
 
-    except Exception as e:
-        typer.echo(f"❌ Error listing meal plans: {e}", err=True)
-        if config.debug:
-            logger.exception("Error listing meal plans")
-        raise typer.Exit(1)
-
 
 @app.command()
 def complete_meal(
@@ -1358,11 +1783,12 @@ def complete_meal(
 
     Use this command to track which meals you've actually prepared and eaten.
     """
+    from .config import get_config
     from .meal_planning import MealPlanner
 
     config = get_config()
 
-    try:
+    with _cli_error_boundary(config, "updating meal plan"):
         # Update completion status
         plan = MealPlanner.complete_meal(plan_id, completed=not uncomplete)
 
@@ -1379,12 +1805,6 @@ def complete_meal(
         if config.debug:
             logger.info(f"Marked meal plan {plan_id} as {status}")
 
-    except Exception as e:
-        typer.echo(f"❌ Error updating meal plan: {e}", err=True)
-        if config.debug:
-            logger.exception("Error updating meal plan completion")
-        raise typer.Exit(1)
-
 
 @app.command()
 def update_plan(
@@ -1396,13 +1816,14 @@ def update_plan(
     This command will prompt you to update various fields of the meal plan.
     Press Enter to keep the current value, or type a new value to change it.
     """
+    from .config import get_config
     from .meal_planning import MealPlanner
     from .models import MealType
     from datetime import datetime
 
     config = get_config()
 
-    try:
+    with _cli_error_boundary(config, "updating meal plan"):
         # Get the current plan
         plan = MealPlanner.get_meal_plan(plan_id)
         if not plan:
@@ -1492,12 +1913,6 @@ def update_plan(
         if config.debug:
             logger.info(f"Updated meal plan {plan_id}: {list(updates.keys())}")
 
-    except Exception as e:
-        typer.echo(f"❌ Error updating meal plan: {e}", err=True)
-        if config.debug:
-            logger.exception("Error updating meal plan")
-        raise typer.Exit(1)
-
 
 @app.command()
 def delete_plan(
@@ -1510,11 +1925,12 @@ def delete_plan(
     Permanently remove a meal plan from the schedule.
     Use --force to skip the confirmation prompt.
     """
+    from .config import get_config
     from .meal_planning import MealPlanner
 
     config = get_config()
 
-    try:
+    with _cli_error_boundary(config, "deleting meal plan"):
         # Get the plan for confirmation
         plan = MealPlanner.get_meal_plan(plan_id)
         if not plan:
@@ -1548,12 +1964,6 @@ def delete_plan(
         if config.debug:
             logger.info(f"Deleted meal plan {plan_id}")
 
-    except Exception as e:
-        typer.echo(f"❌ Error deleting meal plan: {e}", err=True)
-        if config.debug:
-            logger.exception("Error deleting meal plan")
-        raise typer.Exit(1)
-
 
 @app.command()
 def clear_schedule(
@@ -1568,13 +1978,14 @@ def clear_schedule(
     Remove all meal plans within the specified date range. Optionally filter
     by meal type to clear only specific types of meals.
     """
+    from .config import get_config
     from datetime import datetime
     from .meal_planning import MealPlanner
     from .models import MealType
 
     config = get_config()
 
-    try:
+    with _cli_error_boundary(config, "clearing schedule"):
         # Parse dates
         try:
             parsed_start = datetime.strptime(start_date, "%Y-%m-%d").date()
@@ -1626,12 +2037,6 @@ def clear_schedule(
         if config.debug:
             logger.info(f"Cleared {count} meal plans for {date_range}")
 
-    except Exception as e:
-        typer.echo(f"❌ Error clearing schedule: {e}", err=True)
-        if config.debug:
-            logger.exception("Error clearing schedule")
-        raise typer.Exit(1)
-
 
 @app.command()
 def plan_stats(
@@ -1645,13 +2050,14 @@ def plan_stats(
     Display statistics about meal plans including completion rates, most planned
     recipes, and meal type distribution for a specified period.
     """
+    from .config import get_config
     from datetime import datetime, date, timedelta
     from .meal_planning import MealPlanner
     from .calendar_management import CalendarManager
 
     config = get_config()
 
-    try:
+    with _cli_error_boundary(config, "generating statistics"):
         # Determine date range
         if start_date and end_date:
             # Use provided dates
@@ -1683,7 +2089,7 @@ def plan_stats(
         # Display statistics
         typer.echo(f"📊 Meal Planning Statistics")
         typer.echo(f"Period: {parsed_start} to {parsed_end}")
-        typer.echo("=" * 50)
+        typer.echo(_RULE_50)
 
         # Basic stats
         typer.echo(f"\n📅 Planning Overview:")
@@ -1723,12 +2129,6 @@ def plan_stats(
         if config.debug:
             logger.info(f"Generated meal planning statistics for {parsed_start} to {parsed_end}")
 
-    except Exception as e:
-        typer.echo(f"❌ Error generating statistics: {e}", err=True)
-        if config.debug:
-            logger.exception("Error generating meal planning statistics")
-        raise typer.Exit(1)
-
 
 @app.command()
 def analyze_recipe(
@@ -1741,11 +2141,12 @@ def analyze_recipe(
     Display detailed nutritional information including calories, macronutrients,
     and micronutrients for the specified number of servings.
     """
+    from .config import get_config
     from .nutritional_analysis import NutritionalAnalyzer
 
     config = get_config()
 
-    try:
+    with _cli_error_boundary(config, "analyzing recipe"):
         # Analyze the recipe
         nutrition = NutritionalAnalyzer.analyze_recipe(recipe_id, servings)
 
@@ -1765,7 +2166,7 @@ def analyze_recipe(
         typer.echo(f"🔬 Nutritional Analysis: {recipe_title}")
         if servings > 1:
             typer.echo(f"Servings: {servings}")
-        typer.echo("=" * 50)
+        typer.echo(_RULE_50)
 
         # Macronutrients
         typer.echo(f"\n📊 Macronutrients:")
@@ -1800,12 +2201,6 @@ def analyze_recipe(
         if config.debug:
             logger.info(f"Analyzed recipe {recipe_id} nutrition for {servings} servings")
 
-    except Exception as e:
-        typer.echo(f"❌ Error analyzing recipe: {e}", err=True)
-        if config.debug:
-            logger.exception("Error analyzing recipe nutrition")
-        raise typer.Exit(1)
-
 
 @app.command()
 def nutrition_summary(
@@ -1819,13 +2214,14 @@ def nutrition_summary(
     Analyze the nutritional content of all scheduled meals for the specified
     period and provide a comprehensive summary.
     """
+    from .config import get_config
     from datetime import datetime, date
     from .nutritional_analysis import NutritionalAnalyzer
     from .calendar_management import CalendarManager
 
     config = get_config()
 
-    try:
+    with _cli_error_boundary(config, "generating nutrition summary"):
         # Parse target date
         if target_date:
             try:
@@ -1841,7 +2237,7 @@ def nutrition_summary(
             analysis = NutritionalAnalyzer.analyze_daily_nutrition(parsed_date)
 
             typer.echo(f"🍽️ Daily Nutrition Summary - {analysis['date']}")
-            typer.echo("=" * 50)
+            typer.echo(_RULE_50)
 
             if analysis['meal_count'] == 0:
                 typer.echo("No meals scheduled for this date.")
@@ -1886,7 +2282,7 @@ def nutrition_summary(
 
             typer.echo(f"📅 Weekly Nutrition Summary")
             typer.echo(f"Week of {start_date} to {end_date}")
-            typer.echo("=" * 50)
+            typer.echo(_RULE_50)
 
             # Average daily nutrition
             avg = analysis['average_daily_nutrition']
@@ -1919,7 +2315,7 @@ def nutrition_summary(
 
             typer.echo(f"📅 Monthly Nutrition Summary")
             typer.echo(f"{parsed_date.strftime('%B %Y')}")
-            typer.echo("=" * 50)
+            typer.echo(_RULE_50)
 
             # Average daily nutrition
             avg = analysis['average_daily_nutrition']
@@ -1945,12 +2341,6 @@ def nutrition_summary(
         if config.debug:
             logger.info(f"Generated {period} nutrition summary for {parsed_date}")
 
-    except Exception as e:
-        typer.echo(f"❌ Error generating nutrition summary: {e}", err=True)
-        if config.debug:
-            logger.exception("Error generating nutrition summary")
-        raise typer.Exit(1)
-
 
 @app.command()
 def set_nutrition_goals(
@@ -1968,11 +2358,12 @@ def set_nutrition_goals(
     Define your daily nutritional targets based on your health and fitness goals.
     The system will use these goals to track your progress and provide recommendations.
     """
+    from .config import get_config
     from .nutritional_goals import GoalType, NutritionalGoalManager
 
     config = get_config()
 
-    try:
+    with _cli_error_boundary(config, "setting nutrition goals"):
         # Parse goal type
         try:
             parsed_goal_type = GoalType(goal_type.lower())
@@ -2019,7 +2410,7 @@ def set_nutrition_goals(
         # Display the goals
         typer.echo("✅ Nutritional goals set successfully!")
         typer.echo(f"\n🎯 Your {goals.goal_type.value.replace('_', ' ').title()} Goals:")
-        typer.echo("=" * 50)
+        typer.echo(_RULE_50)
 
         typer.echo(f"\n📊 Daily Targets:")
         typer.echo(f"  Calories: {goals.daily_calories:.0f}")
@@ -2037,12 +2428,6 @@ def set_nutrition_goals(
         if config.debug:
             logger.info(f"Set nutrition goals: {goals.goal_type.value}, {daily_calories} calories")
 
-    except Exception as e:
-        typer.echo(f"❌ Error setting nutrition goals: {e}", err=True)
-        if config.debug:
-            logger.exception("Error setting nutrition goals")
-        raise typer.Exit(1)
-
 
 @app.command()
 def nutrition_progress(
@@ -2055,6 +2440,7 @@ def nutrition_progress(
     Compare your actual nutrition intake against your set goals and get
     personalized recommendations for improvement.
     """
+    from .config import get_config
     from datetime import datetime, date
     from .nutritional_goals import NutritionalGoals, NutritionalGoalManager
     from .nutritional_analysis import NutritionalAnalyzer, NutritionData
@@ -2063,7 +2449,7 @@ def nutrition_progress(
 
     config = get_config()
 
-    try:
+    with _cli_error_boundary(config, "tracking nutrition progress"):
         # Load goals
         goals_file = Path("nutrition_goals.json")
         if not goals_file.exists():
@@ -2106,7 +2492,7 @@ def nutrition_progress(
 
             typer.echo(f"📈 Daily Nutrition Progress - {parsed_date}")
             typer.echo(f"Goal: {goals.goal_type.value.replace('_', ' ').title()}")
-            typer.echo("=" * 50)
+            typer.echo(_RULE_50)
 
             typer.echo(f"\n🎯 Overall Score: {progress['overall_score']:.1f}/100")
 
@@ -2132,7 +2518,7 @@ def nutrition_progress(
 
             typer.echo(f"📅 Weekly Nutrition Progress")
             typer.echo(f"Week of {weekly_progress['week_start']} to {weekly_progress['week_end']}")
-            typer.echo("=" * 50)
+            typer.echo(_RULE_50)
 
             typer.echo(f"\n🎯 Weekly Average Score: {weekly_progress['weekly_progress']['overall_score']:.1f}/100")
             typer.echo(f"📊 Consistency Score: {weekly_progress['consistency_score']:.1f}/100")
@@ -2161,12 +2547,6 @@ def nutrition_progress(
         if config.debug:
             logger.info(f"Generated nutrition progress for {parsed_date}")
 
-    except Exception as e:
-        typer.echo(f"❌ Error tracking nutrition progress: {e}", err=True)
-        if config.debug:
-            logger.exception("Error tracking nutrition progress")
-        raise typer.Exit(1)
-
 
 @app.command()
 def generate_shopping_list(
@@ -2185,13 +2565,14 @@ def generate_shopping_list(
     Create a comprehensive shopping list by aggregating ingredients from all
     scheduled meals within the specified date range.
     """
+    from .config import get_config
     from datetime import datetime
     from .shopping_list import ShoppingListGenerator
     from .shopping_list_export import ShoppingListExporter
 
     config = get_config()
 
-    try:
+    with _cli_error_boundary(config, "generating shopping list"):
         # Parse dates
         try:
             parsed_start_date = datetime.strptime(start_date, "%Y-%m-%d").date()
@@ -2276,12 +2657,6 @@ def generate_shopping_list(
         if config.debug:
             logger.info(f"Generated shopping list for {parsed_start_date} to {parsed_end_date}")
 
-    except Exception as e:
-        typer.echo(f"❌ Error generating shopping list: {e}", err=True)
-        if config.debug:
-            logger.exception("Error generating shopping list")
-        raise typer.Exit(1)
-
 
 @app.command()
 def shopping_list_from_recipes(
@@ -2297,12 +2672,13 @@ def shopping_list_from_recipes(
     Create a shopping list by aggregating ingredients from the specified recipes,
     useful for meal prep or cooking multiple recipes at once.
     """
+    from .config import get_config
     from .shopping_list import ShoppingListGenerator
     from .shopping_list_export import ShoppingListExporter
 
     config = get_config()
 
-    try:
+    with _cli_error_boundary(config, "generating shopping list from recipes"):
         # Parse recipe IDs
         try:
             recipe_id_list = [int(rid.strip()) for rid in recipe_ids.split(',')]
@@ -2379,12 +2755,6 @@ def shopping_list_from_recipes(
         if config.debug:
             logger.info(f"Generated shopping list from recipes: {recipe_id_list}")
 
-    except Exception as e:
-        typer.echo(f"❌ Error generating shopping list from recipes: {e}", err=True)
-        if config.debug:
-            logger.exception("Error generating shopping list from recipes")
-        raise typer.Exit(1)
-
 
 @app.command()
 def shopping_list_nutrition(
@@ -2398,12 +2768,13 @@ def shopping_list_nutrition(
     Calculate the approximate nutritional value of all ingredients in a
     shopping list generated from scheduled meals.
     """
+    from .config import get_config
     from datetime import datetime
     from .shopping_list import ShoppingListGenerator
 
     config = get_config()
 
-    try:
+    with _cli_error_boundary(config, "analyzing shopping list nutrition"):
         # Parse dates
         try:
             parsed_start_date = datetime.strptime(start_date, "%Y-%m-%d").date()
@@ -2442,7 +2813,7 @@ def shopping_list_nutrition(
 
         typer.echo(f"🛒 Shopping List Nutrition Analysis")
         typer.echo(f"📅 Date Range: {date_range}")
-        typer.echo("=" * 50)
+        typer.echo(_RULE_50)
 
         typer.echo(f"\n📊 Total Nutritional Content:")
         typer.echo(f"  Calories: {nutrition['calories']:.0f}")
@@ -2467,11 +2838,17 @@ def shopping_list_nutrition(
         if config.debug:
             logger.info(f"Analyzed shopping list nutrition for {parsed_start_date} to {parsed_end_date}")
 
-    except Exception as e:
-        typer.echo(f"❌ Error analyzing shopping list nutrition: {e}", err=True)
-        if config.debug:
-            logger.exception("Error analyzing shopping list nutrition")
-        raise typer.Exit(1)
+
+# Sorted CLI command names, built on first use
+_COMMANDS_SORTED: Optional[List[str]] = None
+
+
+def _get_commands() -> List[str]:
+    """Return the sorted names of all registered commands, computed once."""
+    global _COMMANDS_SORTED
+    if _COMMANDS_SORTED is None:
+        _COMMANDS_SORTED = sorted({_command_name(info) for info in app.registered_commands})
+    return _COMMANDS_SORTED
 
 
 def handle_unknown_command(command_name: str):
@@ -2481,31 +2858,10 @@ def handle_unknown_command(command_name: str):
     Args:
         command_name: The unknown command that was attempted
     """
-    typer.echo(f"Error: Unknown command '{command_name}'", err=True)
-    typer.echo("\nAvailable commands:", err=True)
-    
-    # Get available commands from the app
-    commands = []
-    if hasattr(app, 'registered_commands'):
-        if isinstance(app.registered_commands, dict):
-            for command in app.registered_commands.values():
-                commands.append(command.name)
-        elif isinstance(app.registered_commands, list):
-            for command in app.registered_commands:
-                if hasattr(command, 'name'):
-                    commands.append(command.name)
-
-    # Also check for commands in the app.commands list
-    if hasattr(app, 'commands') and isinstance(app.commands, dict):
-        commands.extend(app.commands.keys())
-
-    if commands:
-        for cmd in sorted(set(commands)):  # Remove duplicates
-            typer.echo(f"  {cmd}", err=True)
-    else:
-        typer.echo("  hello", err=True)  # At least show the hello command
-    
-    typer.echo("\nUse 'mealplanner --help' for more information.", err=True)
+    lines = [f"Error: Unknown command '{command_name}'", "\nAvailable commands:"]
+    lines.extend(f"  {cmd}" for cmd in _get_commands())
+    lines.append("\nUse 'mealplanner --help' for more information.")
+    typer.echo("\n".join(lines), err=True)
 
 
 @app.command()
@@ -2518,26 +2874,27 @@ def test_email(
     This command verifies that your SMTP settings are correctly configured
     by sending a simple test email to the specified address.
     """
+    from .config import get_config
     from .email_notifications import EmailNotificationManager, EmailConfigurationError, EmailSendError
 
     config = get_config()
 
-    try:
-        typer.echo("Testing email configuration...")
-
-        email_manager = EmailNotificationManager()
-
-        # Test SMTP connection
-        if not email_manager.test_connection():
-            typer.echo("❌ SMTP connection test failed", err=True)
-            typer.echo("Please check your email configuration in .env file:", err=True)
-            typer.echo("  SMTP_HOST, SMTP_PORT, SMTP_USERNAME, SMTP_PASSWORD", err=True)
-            raise typer.Exit(1)
+    with _cli_error_boundary(config, "testing email", {EmailSendError: "Failed to send email"}):
+        try:
+            typer.echo("Testing email configuration...")
+
+            with EmailNotificationManager() as email_manager:
+                # Test SMTP connection
+                if not email_manager.test_connection():
+                    typer.echo("❌ SMTP connection test failed", err=True)
+                    typer.echo("Please check your email configuration in .env file:", err=True)
+                    typer.echo("  SMTP_HOST, SMTP_PORT, SMTP_USERNAME, SMTP_PASSWORD", err=True)
+                    raise typer.Exit(1)
 
-        typer.echo("✅ SMTP connection successful")
+                typer.echo("✅ SMTP connection successful")
 
-        # Send test email
-        html_content = """
+                # Send test email
+                html_content = """
         <html>
         <body>
             <h2>🎉 Email Test Successful!</h2>
@@ -2549,7 +2906,7 @@ def test_email(
         </html>
         """
 
-        text_content = """
+                text_content = """
         EMAIL TEST SUCCESSFUL!
 
         Your Smart Meal Planner email configuration is working correctly.
@@ -2559,40 +2916,30 @@ def test_email(
         Smart Meal Planner - Making meal planning effortless
         """
 
-        success = email_manager.send_email(
-            to_email=to_email,
-            subject="Smart Meal Planner - Email Test",
-            html_content=html_content,
-            text_content=text_content
-        )
+                success = email_manager.send_email(
+                    to_email=to_email,
+                    subject="Smart Meal Planner - Email Test",
+                    html_content=html_content,
+                    text_content=text_content
+                )
 
-        if success:
-            typer.echo(f"✅ Test email sent successfully to {to_email}")
-            typer.echo("Check your inbox to confirm email delivery.")
-        else:
-            typer.echo(f"❌ Failed to send test email to {to_email}", err=True)
-            raise typer.Exit(1)
+                if success:
+                    typer.echo(f"✅ Test email sent successfully to {to_email}")
+                    typer.echo("Check your inbox to confirm email delivery.")
+                else:
+                    typer.echo(f"❌ Failed to send test email to {to_email}", err=True)
+                    raise typer.Exit(1)
 
-        if config.debug:
-            logger.info(f"Email test completed successfully for {to_email}")
+                if config.debug:
+                    logger.info(f"Email test completed successfully for {to_email}")
 
-    except EmailConfigurationError as e:
-        typer.echo(f"❌ Email configuration error: {e}", err=True)
-        typer.echo("Please check your .env file for required email settings:", err=True)
-        typer.echo("  SMTP_HOST, SMTP_PORT, SMTP_USERNAME, SMTP_PASSWORD", err=True)
-        if config.debug:
-            logger.error(f"Email configuration error: {e}")
-        raise typer.Exit(1)
-    except EmailSendError as e:
-        typer.echo(f"❌ Failed to send email: {e}", err=True)
-        if config.debug:
-            logger.error(f"Email send error: {e}")
-        raise typer.Exit(1)
-    except Exception as e:
-        typer.echo(f"❌ Error testing email: {e}", err=True)
-        if config.debug:
-            logger.exception("Error testing email")
-        raise typer.Exit(1)
+        except EmailConfigurationError as e:
+            typer.echo(f"❌ Email configuration error: {e}", err=True)
+            typer.echo("Please check your .env file for required email settings:", err=True)
+            typer.echo("  SMTP_HOST, SMTP_PORT, SMTP_USERNAME, SMTP_PASSWORD", err=True)
+            if config.debug:
+                logger.error(f"Email configuration error: {e}")
+            raise typer.Exit(1)
 
 
 @app.command()
@@ -2606,12 +2953,16 @@ def send_meal_reminder(
     This command sends an email containing all scheduled meals for the specified date,
     helping you stay on track with your meal planning.
     """
+    from .config import get_config
     from datetime import datetime
     from .email_notifications import EmailNotificationManager, EmailConfigurationError, EmailSendError
 
     config = get_config()
 
-    try:
+    with _cli_error_boundary(
+        config, "sending meal reminder",
+        {EmailConfigurationError: "Email configuration error", EmailSendError: "Failed to send email"}
+    ):
         # Parse date
         try:
             parsed_date = datetime.strptime(date, '%Y-%m-%d').date()
@@ -2621,37 +2972,20 @@ def send_meal_reminder(
 
         typer.echo(f"Sending meal reminder for {parsed_date} to {to_email}...")
 
-        email_manager = EmailNotificationManager()
-
-        success = email_manager.send_meal_reminder(
-            to_email=to_email,
-            target_date=parsed_date
-        )
-
-        if success:
-            typer.echo(f"✅ Meal reminder sent successfully to {to_email}")
-        else:
-            typer.echo(f"❌ Failed to send meal reminder to {to_email}", err=True)
-            raise typer.Exit(1)
+        with EmailNotificationManager() as email_manager:
+            success = email_manager.send_meal_reminder(
+                to_email=to_email,
+                target_date=parsed_date
+            )
 
-        if config.debug:
-            logger.info(f"Meal reminder sent successfully for {parsed_date} to {to_email}")
+            if success:
+                typer.echo(f"✅ Meal reminder sent successfully to {to_email}")
+            else:
+                typer.echo(f"❌ Failed to send meal reminder to {to_email}", err=True)
+                raise typer.Exit(1)
 
-    except EmailConfigurationError as e:
-        typer.echo(f"❌ Email configuration error: {e}", err=True)
-        if config.debug:
-            logger.error(f"Email configuration error: {e}")
-        raise typer.Exit(1)
-    except EmailSendError as e:
-        typer.echo(f"❌ Failed to send email: {e}", err=True)
-        if config.debug:
-            logger.error(f"Email send error: {e}")
-        raise typer.Exit(1)
-    except Exception as e:
-        typer.echo(f"❌ Error sending meal reminder: {e}", err=True)
-        if config.debug:
-            logger.exception("Error sending meal reminder")
-        raise typer.Exit(1)
+            if config.debug:
+                logger.info(f"Meal reminder sent successfully for {parsed_date} to {to_email}")
 
 
 @app.command()
@@ -2667,12 +3001,16 @@ def send_shopping_list_email(
     This command generates a shopping list from scheduled meals and sends it via email
     with optional file attachments in multiple formats.
     """
+    from .config import get_config
     from datetime import datetime
     from .email_notifications import EmailNotificationManager, EmailConfigurationError, EmailSendError
 
     config = get_config()
 
-    try:
+    with _cli_error_boundary(
+        config, "sending shopping list",
+        {EmailConfigurationError: "Email configuration error", EmailSendError: "Failed to send email"}
+    ):
         # Parse dates
         try:
             parsed_start_date = datetime.strptime(start_date, '%Y-%m-%d').date()
@@ -2691,41 +3029,24 @@ def send_shopping_list_email(
 
         typer.echo(f"Sending shopping list for {date_range} to {to_email}...")
 
-        email_manager = EmailNotificationManager()
-
-        success = email_manager.send_shopping_list(
-            to_email=to_email,
-            start_date=parsed_start_date,
-            end_date=parsed_end_date,
-            include_attachment=include_attachments
-        )
-
-        if success:
-            typer.echo(f"✅ Shopping list sent successfully to {to_email}")
-            if include_attachments:
-                typer.echo("📎 Included attachments: shopping_list.txt, shopping_list.csv")
-        else:
-            typer.echo(f"❌ Failed to send shopping list to {to_email}", err=True)
-            raise typer.Exit(1)
+        with EmailNotificationManager() as email_manager:
+            success = email_manager.send_shopping_list(
+                to_email=to_email,
+                start_date=parsed_start_date,
+                end_date=parsed_end_date,
+                include_attachment=include_attachments
+            )
 
-        if config.debug:
-            logger.info(f"Shopping list sent successfully for {date_range} to {to_email}")
+            if success:
+                typer.echo(f"✅ Shopping list sent successfully to {to_email}")
+                if include_attachments:
+                    typer.echo("📎 Included attachments: shopping_list.txt, shopping_list.csv")
+            else:
+                typer.echo(f"❌ Failed to send shopping list to {to_email}", err=True)
+                raise typer.Exit(1)
 
-    except EmailConfigurationError as e:
-        typer.echo(f"❌ Email configuration error: {e}", err=True)
-        if config.debug:
-            logger.error(f"Email configuration error: {e}")
-        raise typer.Exit(1)
-    except EmailSendError as e:
-        typer.echo(f"❌ Failed to send email: {e}", err=True)
-        if config.debug:
-            logger.error(f"Email send error: {e}")
-        raise typer.Exit(1)
-    except Exception as e:
-        typer.echo(f"❌ Error sending shopping list: {e}", err=True)
-        if config.debug:
-            logger.exception("Error sending shopping list")
-        raise typer.Exit(1)
+            if config.debug:
+                logger.info(f"Shopping list sent successfully for {date_range} to {to_email}")
 
 
 @app.command()
@@ -2740,12 +3061,16 @@ def send_nutrition_summary_email(
     This command calculates and sends nutritional information for scheduled meals
     over the specified period (day, week, or month).
     """
+    from .config import get_config
     from datetime import datetime
     from .email_notifications import EmailNotificationManager, EmailConfigurationError, EmailSendError
 
     config = get_config()
 
-    try:
+    with _cli_error_boundary(
+        config, "sending nutrition summary",
+        {EmailConfigurationError: "Email configuration error", EmailSendError: "Failed to send email"}
+    ):
         # Validate period
         if period not in ['day', 'week', 'month']:
             typer.echo("❌ Invalid period. Use: day, week, or month", err=True)
@@ -2760,38 +3085,21 @@ def send_nutrition_summary_email(
 
         typer.echo(f"Sending nutrition summary ({period}) for {parsed_date} to {to_email}...")
 
-        email_manager = EmailNotificationManager()
-
-        success = email_manager.send_nutrition_summary(
-            to_email=to_email,
-            target_date=parsed_date,
-            period=period
-        )
-
-        if success:
-            typer.echo(f"✅ Nutrition summary sent successfully to {to_email}")
-        else:
-            typer.echo(f"❌ Failed to send nutrition summary to {to_email}", err=True)
-            raise typer.Exit(1)
+        with EmailNotificationManager() as email_manager:
+            success = email_manager.send_nutrition_summary(
+                to_email=to_email,
+                target_date=parsed_date,
+                period=period
+            )
 
-        if config.debug:
-            logger.info(f"Nutrition summary ({period}) sent successfully for {parsed_date} to {to_email}")
+            if success:
+                typer.echo(f"✅ Nutrition summary sent successfully to {to_email}")
+            else:
+                typer.echo(f"❌ Failed to send nutrition summary to {to_email}", err=True)
+                raise typer.Exit(1)
 
-    except EmailConfigurationError as e:
-        typer.echo(f"❌ Email configuration error: {e}", err=True)
-        if config.debug:
-            logger.error(f"Email configuration error: {e}")
-        raise typer.Exit(1)
-    except EmailSendError as e:
-        typer.echo(f"❌ Failed to send email: {e}", err=True)
-        if config.debug:
-            logger.error(f"Email send error: {e}")
-        raise typer.Exit(1)
-    except Exception as e:
-        typer.echo(f"❌ Error sending nutrition summary: {e}", err=True)
-        if config.debug:
-            logger.exception("Error sending nutrition summary")
-        raise typer.Exit(1)
+            if config.debug:
+                logger.info(f"Nutrition summary ({period}) sent successfully for {parsed_date} to {to_email}")
 
 
 @app.command()
@@ -2806,12 +3114,16 @@ def send_weekly_meal_plan_email(
     This command sends a comprehensive weekly meal plan email including all scheduled
     meals for the week and optionally a shopping list for the ingredients needed.
     """
+    from .config import get_config
     from datetime import datetime
     from .email_notifications import EmailNotificationManager, EmailConfigurationError, EmailSendError
 
     config = get_config()
 
-    try:
+    with _cli_error_boundary(
+        config, "sending weekly meal plan",
+        {EmailConfigurationError: "Email configuration error", EmailSendError: "Failed to send email"}
+    ):
         # Parse date
         try:
             parsed_start_date = datetime.strptime(start_date, '%Y-%m-%d').date()
@@ -2821,40 +3133,68 @@ def send_weekly_meal_plan_email(
 
         typer.echo(f"Sending weekly meal plan starting {parsed_start_date} to {to_email}...")
 
-        email_manager = EmailNotificationManager()
+        with EmailNotificationManager() as email_manager:
+            success = email_manager.send_weekly_meal_plan(
+                to_email=to_email,
+                start_date=parsed_start_date,
+                include_shopping_list=include_shopping_list
+            )
 
-        success = email_manager.send_weekly_meal_plan(
-            to_email=to_email,
-            start_date=parsed_start_date,
-            include_shopping_list=include_shopping_list
-        )
+            if success:
+                typer.echo(f"✅ Weekly meal plan sent successfully to {to_email}")
+                if include_shopping_list:
+                    typer.echo("📎 Included shopping list attachment")
+            else:
+                typer.echo(f"❌ Failed to send weekly meal plan to {to_email}", err=True)
+                raise typer.Exit(1)
 
-        if success:
-            typer.echo(f"✅ Weekly meal plan sent successfully to {to_email}")
-            if include_shopping_list:
-                typer.echo("📎 Included shopping list attachment")
-        else:
-            typer.echo(f"❌ Failed to send weekly meal plan to {to_email}", err=True)
-            raise typer.Exit(1)
+            if config.debug:
+                logger.info(f"Weekly meal plan sent successfully for week of {parsed_start_date} to {to_email}")
 
-        if config.debug:
-            logger.info(f"Weekly meal plan sent successfully for week of {parsed_start_date} to {to_email}")
 
-    except EmailConfigurationError as e:
-        typer.echo(f"❌ Email configuration error: {e}", err=True)
-        if config.debug:
-            logger.error(f"Email configuration error: {e}")
-        raise typer.Exit(1)
-    except EmailSendError as e:
-        typer.echo(f"❌ Failed to send email: {e}", err=True)
-        if config.debug:
-            logger.error(f"Email send error: {e}")
-        raise typer.Exit(1)
-    except Exception as e:
-        typer.echo(f"❌ Error sending weekly meal plan: {e}", err=True)
-        if config.debug:
-            logger.exception("Error sending weekly meal plan")
-        raise typer.Exit(1)
+# Global options of the root callback that consume the following argument
+_OPTIONS_WITH_VALUE = {"--config"}
+
+
+def _sniff_subcommand(args: List[str]) -> Optional[str]:
+    """
+    Find the subcommand name in raw command-line arguments.
+
+    Args:
+        args: Arguments following the program name
+
+    Returns:
+        The first positional argument after the global options, or None
+    """
+    skip_next = False
+    for arg in args:
+        if skip_next:
+            skip_next = False
+        elif arg in _OPTIONS_WITH_VALUE:
+            skip_next = True
+        elif not arg.startswith("-"):
+            return arg
+    return None
+
+
+def _single_command_app(command_info) -> Typer:
+    """
+    Build a throwaway app holding only one subcommand and the root callback.
+
+    The module-level app is left untouched, so code that inspects its
+    registered commands during the run still sees all of them.
+
+    Args:
+        command_info: Registered command to expose
+
+    Returns:
+        A Typer app sharing the root app's name, help and global options
+    """
+    single = Typer(add_completion=False, rich_markup_mode=app.rich_markup_mode)
+    single.info = app.info
+    single.registered_callback = app.registered_callback
+    single.registered_commands = [command_info]
+    return single
 
 
 def cli_main():
@@ -2862,9 +3202,19 @@ def cli_main():
     Main entry point for the CLI application.
     
     This function handles unknown commands gracefully and provides helpful error messages.
-    """
+    Only the invoked subcommand is handed to Typer so Click parameters are not
+    built for every command on each run; help and unknown commands still see
+    the full command list.
+    """
+    command_name = _sniff_subcommand(sys.argv[1:])
+    selected = next(
+        (info for info in app.registered_commands if _command_name(info) == command_name),
+        None
+    )
+    runner = _single_command_app(selected) if selected is not None else app
+
     try:
-        app()
+        runner()
     except typer.Exit as e:
         # Re-raise typer exits
         raise e
@@ -9,20 +9,41 @@ import logging
 import os
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Union
 
-from dotenv import load_dotenv
 
-# Optional yaml import - will be available if PyYAML is installed
-try:
-    import yaml
-    YAML_AVAILABLE = True
-except ImportError:
-    YAML_AVAILABLE = False
+def _load_dotenv(path: Union[str, Path]) -> None:
+    """Load a dotenv file, importing python-dotenv only when one is present."""
+    from dotenv import load_dotenv
+    load_dotenv(path)
+
+
+class JSONFormatter(logging.Formatter):
+    """Render each log record as a single compact JSON object."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        log_entry = {
+            "timestamp": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "module": record.module,
+            "function": record.funcName,
+            "line": record.lineno
+        }
+        if record.exc_info:
+            log_entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(log_entry, separators=(",", ":"))
+
+
+# JSON console handler shared by every Config built against the same stderr
+_console_handler: Optional[logging.StreamHandler] = None
 
 
 class Config:
     """Configuration manager for the application."""
+
+    __slots__ = ("debug", "config_file", "_env_cache")
     
     def __init__(self, config_file: Optional[str] = None, debug: bool = False):
         """
@@ -34,15 +55,16 @@ class Config:
         """
         self.debug = debug
         self.config_file = config_file
+        # Environment lookups memoized by get(); None records an unset variable
+        self._env_cache: Dict[str, Optional[str]] = {}
         self._load_config()
         self._setup_logging()
     
     def _load_config(self):
         """Load configuration from environment variables and config files."""
         # Load default .env file if it exists
-        env_file = Path(".env")
-        if env_file.exists():
-            load_dotenv(env_file)
+        if os.path.isfile(".env"):
+            _load_dotenv(".env")
         
         # Load custom config file if specified
         if self.config_file:
@@ -52,9 +74,12 @@ class Config:
             
             if config_path.suffix.lower() in ['.env'] or config_path.suffix == '':
                 # Treat files without extension as .env files
-                load_dotenv(config_path)
+                _load_dotenv(config_path)
             elif config_path.suffix.lower() in ['.yaml', '.yml']:
-                if not YAML_AVAILABLE:
+                # Optional dependency, imported only when a YAML file is actually used
+                try:
+                    import yaml
+                except ImportError:
                     raise ImportError("PyYAML is required for YAML config files. Install with: pip install PyYAML")
                 with open(config_path, 'r') as f:
                     config_data = yaml.safe_load(f)
@@ -68,56 +93,71 @@ class Config:
         """Setup JSON-formatted logging with adjustable verbosity."""
         log_level = logging.DEBUG if self.debug else logging.INFO
         
-        # Create custom formatter for JSON output
-        class JSONFormatter(logging.Formatter):
-            def format(self, record):
-                log_entry = {
-                    "timestamp": self.formatTime(record),
-                    "level": record.levelname,
-                    "logger": record.name,
-                    "message": record.getMessage(),
-                    "module": record.module,
-                    "function": record.funcName,
-                    "line": record.lineno
-                }
-                if record.exc_info:
-                    log_entry["exception"] = self.formatException(record.exc_info)
-                return json.dumps(log_entry)
-        
         # Configure root logger
         root_logger = logging.getLogger()
         root_logger.setLevel(log_level)
         
-        # Remove existing handlers
-        for handler in root_logger.handlers[:]:
-            root_logger.removeHandler(handler)
+        # Reuse the console handler from an earlier Config unless stderr was swapped
+        global _console_handler
+        if _console_handler is None or _console_handler.stream is not sys.stderr:
+            _console_handler = logging.StreamHandler(sys.stderr)
+            _console_handler.setFormatter(JSONFormatter())
         
-        # Add console handler with JSON formatter
-        console_handler = logging.StreamHandler(sys.stderr)
-        console_handler.setFormatter(JSONFormatter())
-        root_logger.addHandler(console_handler)
+        # Remove any other handlers and install the JSON console handler
+        for handler in root_logger.handlers[:]:
+            if handler is not _console_handler:
+                root_logger.removeHandler(handler)
+        if _console_handler not in root_logger.handlers:
+            root_logger.addHandler(_console_handler)
         
         # Set specific logger levels
         logging.getLogger("mealplanner").setLevel(log_level)
     
     def get(self, key: str, default: Optional[str] = None) -> Optional[str]:
-        """Get configuration value from environment variables."""
-        return os.getenv(key, default)
+        """
+        Get configuration value from environment variables.
+
+        Each variable is read from the environment once and then served from a
+        per-instance cache; call invalidate() after changing os.environ.
+        """
+        try:
+            value = self._env_cache[key]
+        except KeyError:
+            value = self._env_cache[key] = os.getenv(key)
+        return default if value is None else value
     
     def get_required(self, key: str) -> str:
         """Get required configuration value, raise error if not found."""
-        value = os.getenv(key)
+        value = self.get(key)
         if value is None:
             raise ValueError(f"Required environment variable not set: {key}")
         return value
 
+    def invalidate(self, key: Optional[str] = None) -> None:
+        """
+        Forget cached environment values so the next get() re-reads them.
+
+        Args:
+            key: Variable to forget; all cached variables when omitted
+        """
+        if key is None:
+            self._env_cache.clear()
+        else:
+            self._env_cache.pop(key, None)
+
 
 # Global configuration instance
 _config: Optional[Config] = None
 
 
 def get_config() -> Config:
-    """Get the global configuration instance."""
+    """
+    Get the global configuration instance.
+
+    Environment and config files are read once by init_config(); this accessor
+    is a plain module-global lookup and performs no I/O, so callers do not need
+    to cache its result.
+    """
     if _config is None:
         raise RuntimeError("Configuration not initialized. Call init_config() first.")
     return _config
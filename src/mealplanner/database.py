@@ -7,10 +7,10 @@ Handles SQLite and PostgreSQL connections, session management, and database init
 import logging
 import os
 from contextlib import contextmanager
-from pathlib import Path
-from typing import Generator, Optional
+from typing import Callable, Dict, Generator, Optional
 
-from sqlalchemy import create_engine, Engine, event
+from sqlalchemy import create_engine, Engine, event, inspect
+from sqlalchemy.engine import make_url
 from sqlalchemy.exc import OperationalError, SQLAlchemyError
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import StaticPool
@@ -46,72 +46,123 @@ def get_database_url() -> str:
     return database_url
 
 
-def create_database_engine(database_url: Optional[str] = None) -> Engine:
+# Applied to every new SQLite connection: enforce foreign keys, and let WAL with
+# synchronous=NORMAL skip the per-commit fsync of the rollback journal. WAL keeps
+# -wal/-shm files beside the database while it is open and removes them when the
+# last connection closes.
+_SQLITE_PRAGMAS = (
+    "PRAGMA foreign_keys=ON;"
+    "PRAGMA journal_mode=WAL;"
+    "PRAGMA synchronous=NORMAL;"
+    "PRAGMA cache_size=-64000;"
+    "PRAGMA temp_store=MEMORY;"
+    "PRAGMA mmap_size=268435456;"
+)
+
+
+def _set_sqlite_pragma(dbapi_connection, connection_record) -> None:
+    """Configure each new SQLite connection with _SQLITE_PRAGMAS."""
+    cursor = dbapi_connection.cursor()
+    cursor.executescript(_SQLITE_PRAGMAS)
+    cursor.close()
+
+
+def _build_sqlite_engine(database_url: str, echo: bool) -> Engine:
+    """Create a SQLite engine with a shared connection and per-connection PRAGMAs."""
+    engine = create_engine(
+        database_url,
+        echo=echo,
+        poolclass=StaticPool,
+        connect_args={
+            'check_same_thread': False,  # Allow multiple threads
+            'timeout': 30  # 30 second timeout
+        }
+    )
+    # Enable foreign key constraints and WAL journaling for SQLite
+    event.listen(engine, "connect", _set_sqlite_pragma)
+    return engine
+
+
+def _build_postgresql_engine(database_url: str, echo: bool) -> Engine:
+    """Create a pooled PostgreSQL engine."""
+    return create_engine(
+        database_url,
+        echo=echo,
+        pool_size=5,
+        max_overflow=10,
+        pool_pre_ping=True,  # Verify connections before use
+        pool_recycle=3600    # Recycle connections after 1 hour
+    )
+
+
+def _build_default_engine(database_url: str, echo: bool) -> Engine:
+    """Create an engine with SQLAlchemy defaults for other databases."""
+    return create_engine(
+        database_url,
+        echo=echo
+    )
+
+
+# Engine factories keyed on the URL's backend name (the part before any "+driver")
+_ENGINE_BUILDERS: Dict[str, Callable[[str, bool], Engine]] = {
+    'sqlite': _build_sqlite_engine,
+    'postgresql': _build_postgresql_engine,
+}
+
+
+def _probe_connection(engine: Engine, success_level: int = logging.INFO) -> None:
+    """
+    Open and close one connection to verify the database is reachable.
+    
+    Args:
+        engine: Engine to probe
+        success_level: Logging level for the success message
+        
+    Raises:
+        OperationalError: If database connection fails
+    """
+    try:
+        with engine.connect():
+            logger.log(success_level, "Database connection successful")
+    except OperationalError as e:
+        logger.error(f"Failed to connect to database: {e}")
+        raise OperationalError(
+            f"Cannot connect to database. Please check your DATABASE_URL configuration.",
+            None, None
+        ) from e
+
+
+def create_database_engine(database_url: Optional[str] = None, validate: bool = False) -> Engine:
     """
     Create and configure database engine.
     
+    Engines connect lazily, so a bad URL otherwise surfaces on first use;
+    pass validate=True to fail fast with a clear error instead.
+    
     Args:
         database_url: Optional database URL override
+        validate: Open a test connection before returning the engine
         
     Returns:
         Configured SQLAlchemy engine
         
     Raises:
         ValueError: If database URL is invalid
-        OperationalError: If database connection fails
+        OperationalError: If validate is set and database connection fails
     """
     if database_url is None:
         database_url = get_database_url()
     
     logger.info(f"Creating database engine for: {database_url}")
+    echo = get_config().debug  # Log SQL queries in debug mode
     
     # Configure engine based on database type
-    if database_url.startswith('sqlite'):
-        # SQLite-specific configuration
-        engine = create_engine(
-            database_url,
-            echo=get_config().debug,  # Log SQL queries in debug mode
-            poolclass=StaticPool,
-            connect_args={
-                'check_same_thread': False,  # Allow multiple threads
-                'timeout': 30  # 30 second timeout
-            }
-        )
-        
-        # Enable foreign key constraints for SQLite
-        @event.listens_for(engine, "connect")
-        def set_sqlite_pragma(dbapi_connection, connection_record):
-            cursor = dbapi_connection.cursor()
-            cursor.execute("PRAGMA foreign_keys=ON")
-            cursor.close()
-            
-    elif database_url.startswith('postgresql'):
-        # PostgreSQL-specific configuration
-        engine = create_engine(
-            database_url,
-            echo=get_config().debug,
-            pool_size=5,
-            max_overflow=10,
-            pool_pre_ping=True,  # Verify connections before use
-            pool_recycle=3600    # Recycle connections after 1 hour
-        )
-    else:
-        # Generic configuration for other databases
-        engine = create_engine(
-            database_url,
-            echo=get_config().debug
-        )
+    backend = make_url(database_url).get_backend_name()
+    builder = _ENGINE_BUILDERS.get(backend, _build_default_engine)
+    engine = builder(database_url, echo)
     
-    # Test the connection
-    try:
-        with engine.connect() as conn:
-            logger.info("Database connection successful")
-    except OperationalError as e:
-        logger.error(f"Failed to connect to database: {e}")
-        raise OperationalError(
-            f"Cannot connect to database. Please check your DATABASE_URL configuration.",
-            None, None
-        ) from e
+    if validate:
+        _probe_connection(engine)
     
     return engine
 
@@ -234,7 +285,7 @@ def init_database(database_url: Optional[str] = None, force: bool = False) -> No
     try:
         if database_url:
             # Create a new engine for the specified URL
-            engine = create_database_engine(database_url)
+            engine = create_database_engine(database_url, validate=True)
         else:
             engine = get_engine()
         
@@ -244,15 +295,14 @@ def init_database(database_url: Optional[str] = None, force: bool = False) -> No
         
         # Check if tables already exist
         try:
-            from sqlalchemy import inspect
             inspector = inspect(engine)
             existing_tables = inspector.get_table_names()
 
             if existing_tables and not force:
                 logger.info(f"Database already initialized with tables: {existing_tables}")
                 return
-        except (ImportError, Exception):
-            # If inspect is not available or fails, just try to create tables
+        except OperationalError:
+            # If the schema cannot be read yet, just try to create tables
             logger.debug("Could not inspect existing tables, proceeding with table creation")
         
         create_tables(engine)
@@ -274,12 +324,9 @@ def check_database_connection() -> bool:
         True if connection is successful, False otherwise
     """
     try:
-        engine = get_engine()
-        with engine.connect():
-            logger.debug("Database connection check successful")
-            return True
-    except Exception as e:
-        logger.error(f"Database connection check failed: {e}")
+        _probe_connection(get_engine(), success_level=logging.DEBUG)
+        return True
+    except OperationalError:
         return False
 
 
@@ -292,17 +339,8 @@ def get_database_info() -> dict:
     """
     try:
         engine = get_engine()
-        database_url = str(engine.url)
-        
         # Hide password in URL for logging
-        safe_url = database_url
-        if '@' in database_url:
-            parts = database_url.split('@')
-            if len(parts) == 2:
-                user_pass = parts[0].split('://')[-1]
-                if ':' in user_pass:
-                    user = user_pass.split(':')[0]
-                    safe_url = database_url.replace(user_pass, f"{user}:***")
+        safe_url = engine.url.render_as_string(hide_password=True)
         
         info = {
             'database_url': safe_url,
@@ -312,11 +350,15 @@ def get_database_info() -> dict:
         
         # Add SQLite-specific info
         if engine.dialect.name == 'sqlite':
-            db_path = database_url.replace('sqlite:///', '')
+            db_path = engine.url.database or ':memory:'
             info['database_file'] = db_path
-            info['file_exists'] = Path(db_path).exists()
-            if Path(db_path).exists():
-                info['file_size'] = Path(db_path).stat().st_size
+            try:
+                file_stat = os.stat(db_path)
+            except OSError:
+                info['file_exists'] = False
+            else:
+                info['file_exists'] = True
+                info['file_size'] = file_stat.st_size
         
         return info
         
@@ -11,16 +11,15 @@ Provides SMTP configuration, email sending, and template rendering for:
 import logging
 import smtplib
 from datetime import date, datetime, timedelta
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
-from email.mime.base import MIMEBase
-from email import encoders
+from email.message import EmailMessage
+from email.policy import SMTP as SMTP_POLICY
 from pathlib import Path
 from typing import Dict, List, Optional, Union, Any
 import tempfile
 import os
 
 from .config import get_config
+from .email_templates import EmailTemplateManager
 from .shopping_list import ShoppingListGenerator
 from .shopping_list_export import ShoppingListExporter
 from .nutritional_analysis import NutritionalAnalyzer
@@ -28,6 +27,9 @@ from .meal_planning import MealPlanner
 
 logger = logging.getLogger(__name__)
 
+# Recipe attributes totalled by nutrition summary emails, in display order
+_SUMMARY_NUTRIENTS = ('calories', 'protein', 'carbs', 'fat', 'fiber', 'sodium')
+
 
 class EmailConfigurationError(Exception):
     """Raised when email configuration is invalid or missing."""
@@ -46,8 +48,17 @@ class EmailNotificationManager:
         """Initialize email notification manager."""
         self.config = get_config()
         self._smtp_config = None
+        self._template_manager: Optional[EmailTemplateManager] = None
+        # Authenticated connection kept open between sends; see _get_smtp()
+        self._smtp: Optional[smtplib.SMTP] = None
         self._validate_config()
     
+    def __enter__(self) -> "EmailNotificationManager":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+    
     def _validate_config(self) -> None:
         """Validate email configuration."""
         required_settings = ['SMTP_HOST', 'SMTP_PORT', 'SMTP_USERNAME', 'SMTP_PASSWORD']
@@ -75,6 +86,61 @@ class EmailNotificationManager:
             }
         return self._smtp_config
     
+    def _get_template_manager(self) -> EmailTemplateManager:
+        """Get the template manager shared by all sends from this manager."""
+        if self._template_manager is None:
+            self._template_manager = EmailTemplateManager()
+        return self._template_manager
+    
+    def _get_smtp(self) -> smtplib.SMTP:
+        """
+        Return a live, authenticated SMTP connection, opening one if needed.
+        
+        A connection left over from an earlier send is reused after an RSET,
+        which both clears any half-finished transaction and confirms that the
+        server is still there; a dropped connection is replaced transparently.
+        
+        Returns:
+            Connected and logged-in SMTP client
+        """
+        if self._smtp is not None:
+            try:
+                self._smtp.rset()
+                return self._smtp
+            except (smtplib.SMTPException, OSError) as e:
+                logger.debug(f"Discarding stale SMTP connection: {e}")
+                self._discard_smtp()
+        
+        smtp_config = self._get_smtp_config()
+        server = smtplib.SMTP(smtp_config['host'], smtp_config['port'])
+        try:
+            if smtp_config['use_tls']:
+                server.starttls()
+            server.login(smtp_config['username'], smtp_config['password'])
+        except Exception:
+            server.close()
+            raise
+        self._smtp = server
+        return server
+    
+    def _discard_smtp(self) -> None:
+        """Drop the cached SMTP connection without a QUIT handshake."""
+        if self._smtp is not None:
+            try:
+                self._smtp.close()
+            finally:
+                self._smtp = None
+    
+    def close(self) -> None:
+        """Close the cached SMTP connection, if any, with a polite QUIT."""
+        if self._smtp is not None:
+            try:
+                self._smtp.quit()
+            except (smtplib.SMTPException, OSError):
+                self._smtp.close()
+            finally:
+                self._smtp = None
+    
     def test_connection(self) -> bool:
         """
         Test SMTP connection and authentication.
@@ -89,12 +155,10 @@ class EmailNotificationManager:
                 logger.error("Missing required SMTP configuration")
                 return False
             
-            with smtplib.SMTP(smtp_config['host'], smtp_config['port']) as server:
-                if smtp_config['use_tls']:
-                    server.starttls()
-                server.login(smtp_config['username'], smtp_config['password'])
-                logger.info("SMTP connection test successful")
-                return True
+            # Keep the verified connection so a following send can reuse it
+            self._get_smtp()
+            logger.info("SMTP connection test successful")
+            return True
                 
         except Exception as e:
             logger.error(f"SMTP connection test failed: {e}")
@@ -136,7 +200,7 @@ class EmailNotificationManager:
                 raise EmailConfigurationError("Missing required SMTP configuration")
             
             # Create message
-            msg = MIMEMultipart('alternative')
+            msg = EmailMessage(policy=SMTP_POLICY)
             msg['Subject'] = subject
             msg['From'] = f"{smtp_config['from_name']} <{smtp_config['from_email']}>"
             msg['To'] = to_email
@@ -144,26 +208,22 @@ class EmailNotificationManager:
             if cc_emails:
                 msg['Cc'] = ', '.join(cc_emails)
             
-            # Add text content
+            # Plain text first with an HTML alternative, or HTML alone
             if text_content:
-                text_part = MIMEText(text_content, 'plain', 'utf-8')
-                msg.attach(text_part)
-            
-            # Add HTML content
-            html_part = MIMEText(html_content, 'html', 'utf-8')
-            msg.attach(html_part)
+                msg.set_content(text_content)
+                msg.add_alternative(html_content, subtype='html')
+            else:
+                msg.set_content(html_content, subtype='html')
             
-            # Add attachments
+            # Add attachments (the message becomes multipart/mixed around the body)
             if attachments:
                 for attachment in attachments:
-                    part = MIMEBase('application', 'octet-stream')
-                    part.set_payload(attachment['content'])
-                    encoders.encode_base64(part)
-                    part.add_header(
-                        'Content-Disposition',
-                        f'attachment; filename= {attachment["filename"]}'
+                    msg.add_attachment(
+                        attachment['content'],
+                        maintype='application',
+                        subtype='octet-stream',
+                        filename=attachment['filename']
                     )
-                    msg.attach(part)
             
             # Send email
             recipients = [to_email]
@@ -172,11 +232,13 @@ class EmailNotificationManager:
             if bcc_emails:
                 recipients.extend(bcc_emails)
             
-            with smtplib.SMTP(smtp_config['host'], smtp_config['port']) as server:
-                if smtp_config['use_tls']:
-                    server.starttls()
-                server.login(smtp_config['username'], smtp_config['password'])
+            server = self._get_smtp()
+            try:
                 server.send_message(msg, to_addrs=recipients)
+            except smtplib.SMTPServerDisconnected:
+                # The server hung up mid-send; never reuse that connection
+                self._discard_smtp()
+                raise
             
             logger.info(f"Email sent successfully to {to_email}")
             return True
@@ -202,8 +264,6 @@ class EmailNotificationManager:
         Returns:
             True if email sent successfully
         """
-        from .email_templates import EmailTemplateManager
-        
         try:
             # Get meal plans if not provided
             if meal_plans is None:
@@ -212,7 +272,7 @@ class EmailNotificationManager:
                     end_date=target_date
                 )
             
-            template_manager = EmailTemplateManager()
+            template_manager = self._get_template_manager()
             html_content, text_content = template_manager.render_meal_reminder(
                 target_date=target_date,
                 meal_plans=meal_plans
@@ -237,7 +297,8 @@ class EmailNotificationManager:
         start_date: date,
         end_date: Optional[date] = None,
         format_type: str = "html",
-        include_attachment: bool = True
+        include_attachment: bool = True,
+        shopping_list: Optional[Any] = None
     ) -> bool:
         """
         Send a shopping list email for a date range.
@@ -248,27 +309,27 @@ class EmailNotificationManager:
             end_date: End date for shopping list (defaults to start_date)
             format_type: Format for email content ('html' or 'text')
             include_attachment: Whether to include shopping list as attachment
+            shopping_list: Optional pre-generated shopping list (will generate if not provided)
             
         Returns:
             True if email sent successfully
         """
-        from .email_templates import EmailTemplateManager
-        
         try:
             if end_date is None:
                 end_date = start_date
             
-            # Generate shopping list
-            shopping_list = ShoppingListGenerator.generate_from_date_range(
-                start_date=start_date,
-                end_date=end_date
-            )
+            # Generate shopping list if not provided
+            if shopping_list is None:
+                shopping_list = ShoppingListGenerator.generate_from_date_range(
+                    start_date=start_date,
+                    end_date=end_date
+                )
             
             if not shopping_list.items:
                 logger.warning(f"No shopping list items found for {start_date} to {end_date}")
                 return False
             
-            template_manager = EmailTemplateManager()
+            template_manager = self._get_template_manager()
             html_content, text_content = template_manager.render_shopping_list(
                 shopping_list=shopping_list
             )
@@ -314,7 +375,9 @@ class EmailNotificationManager:
         self,
         to_email: str,
         target_date: date,
-        period: str = "day"
+        period: str = "day",
+        meal_plans: Optional[List[Any]] = None,
+        nutrition_data: Optional[Dict[str, Any]] = None
     ) -> bool:
         """
         Send a nutrition summary email for a specific date or period.
@@ -323,12 +386,12 @@ class EmailNotificationManager:
             to_email: Recipient email address
             target_date: Date for nutrition summary
             period: Period type ('day', 'week', 'month')
+            meal_plans: Optional meal plans for the period (will fetch if not provided)
+            nutrition_data: Optional precomputed summary of meal_plans (will calculate if not provided)
 
         Returns:
             True if email sent successfully
         """
-        from .email_templates import EmailTemplateManager
-
         try:
             # Calculate date range based on period
             if period == "day":
@@ -347,20 +410,22 @@ class EmailNotificationManager:
             else:
                 raise ValueError(f"Invalid period: {period}")
 
-            # Get meal plans for the period
-            meal_plans = MealPlanner.get_plans_for_date_range(
-                start_date=start_date,
-                end_date=end_date
-            )
+            # Get meal plans for the period if not provided
+            if meal_plans is None:
+                meal_plans = MealPlanner.get_plans_for_date_range(
+                    start_date=start_date,
+                    end_date=end_date
+                )
 
             if not meal_plans:
                 logger.warning(f"No meal plans found for {period} starting {target_date}")
                 return False
 
-            # Calculate nutrition summary
-            nutrition_data = self._calculate_nutrition_summary(meal_plans)
+            # Calculate nutrition summary if not provided
+            if nutrition_data is None:
+                nutrition_data = self._calculate_nutrition_summary(meal_plans)
 
-            template_manager = EmailTemplateManager()
+            template_manager = self._get_template_manager()
             html_content, text_content = template_manager.render_nutrition_summary(
                 start_date=start_date,
                 end_date=end_date,
@@ -407,8 +472,6 @@ class EmailNotificationManager:
         Returns:
             True if email sent successfully
         """
-        from .email_templates import EmailTemplateManager
-
         try:
             # Ensure start_date is Monday
             days_since_monday = start_date.weekday()
@@ -431,7 +494,7 @@ class EmailNotificationManager:
                     end_date=end_date
                 )
 
-            template_manager = EmailTemplateManager()
+            template_manager = self._get_template_manager()
             html_content, text_content = template_manager.render_weekly_meal_plan(
                 start_date=start_date,
                 end_date=end_date,
@@ -474,36 +537,20 @@ class EmailNotificationManager:
             Dictionary containing nutrition summary data
         """
         try:
-            total_nutrition = {
-                'calories': 0,
-                'protein': 0,
-                'carbs': 0,
-                'fat': 0,
-                'fiber': 0,
-                'sodium': 0
-            }
+            total_nutrition = dict.fromkeys(_SUMMARY_NUTRIENTS, 0)
 
             recipe_count = 0
             meal_count = len(meal_plans)
 
             for plan in meal_plans:
-                if hasattr(plan, 'recipe') and plan.recipe:
+                recipe = getattr(plan, 'recipe', None)
+                if recipe:
                     recipe_count += 1
                     servings = getattr(plan, 'servings', 1)
 
-                    # Get recipe nutrition (this would integrate with nutritional analysis)
-                    recipe_nutrition = {
-                        'calories': getattr(plan.recipe, 'calories', 0) or 0,
-                        'protein': getattr(plan.recipe, 'protein', 0) or 0,
-                        'carbs': getattr(plan.recipe, 'carbs', 0) or 0,
-                        'fat': getattr(plan.recipe, 'fat', 0) or 0,
-                        'fiber': getattr(plan.recipe, 'fiber', 0) or 0,
-                        'sodium': getattr(plan.recipe, 'sodium', 0) or 0
-                    }
-
-                    # Add to total (scaled by servings)
-                    for nutrient in total_nutrition:
-                        total_nutrition[nutrient] += recipe_nutrition[nutrient] * servings
+                    # Add recipe nutrition to the total (scaled by servings)
+                    for nutrient in _SUMMARY_NUTRIENTS:
+                        total_nutrition[nutrient] += (getattr(recipe, nutrient, 0) or 0) * servings
 
             # Calculate averages
             avg_nutrition = {}
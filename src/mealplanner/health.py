@@ -11,6 +11,9 @@ from typing import List, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Directories that must exist relative to the working directory
+REQUIRED_DIRECTORIES = ("plugins", "src/mealplanner", "tests")
+
 
 class HealthCheckError(Exception):
     """Raised when health checks fail."""
@@ -24,14 +27,8 @@ def check_required_directories() -> List[str]:
     Returns:
         List of missing directories
     """
-    required_dirs = [
-        "plugins",
-        "src/mealplanner",
-        "tests"
-    ]
-    
     missing_dirs = []
-    for dir_path in required_dirs:
+    for dir_path in REQUIRED_DIRECTORIES:
         if not Path(dir_path).exists():
             missing_dirs.append(dir_path)
             logger.warning(f"Required directory missing: {dir_path}")
@@ -181,13 +178,7 @@ def run_health_check() -> Tuple[bool, List[str]]:
 
 def create_missing_directories() -> None:
     """Create any missing required directories."""
-    required_dirs = [
-        "plugins",
-        "src/mealplanner", 
-        "tests"
-    ]
-    
-    for dir_path in required_dirs:
+    for dir_path in REQUIRED_DIRECTORIES:
         path = Path(dir_path)
         if not path.exists():
             logger.info(f"Creating missing directory: {dir_path}")
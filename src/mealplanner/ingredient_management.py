@@ -5,12 +5,13 @@ Handles CRUD operations, bulk management, and nutritional data management for in
 """
 
 import logging
-from typing import List, Optional, Dict, Any, Tuple
+from typing import List, Optional, Dict, Any, Iterator, Tuple
 from sqlalchemy.orm import Session
-from sqlalchemy import func, desc
+from sqlalchemy import case, desc, distinct, func
 
 from .database import get_db_session
 from .models import Ingredient, Recipe, recipe_ingredients, create_ingredient
+from .statistics_cache import invalidate_statistics_cache
 
 logger = logging.getLogger(__name__)
 
@@ -160,6 +161,7 @@ class IngredientManager:
                 unit_weight_grams=unit_weight_grams
             )
             session.commit()
+            invalidate_statistics_cache()
             # Refresh to get the ID and then expunge
             session.refresh(ingredient)
             session.expunge(ingredient)
@@ -189,6 +191,7 @@ class IngredientManager:
                     setattr(ingredient, field, value)
             
             session.commit()
+            invalidate_statistics_cache()
             session.refresh(ingredient)
             session.expunge(ingredient)
             logger.info(f"Updated ingredient: {ingredient.name}")
@@ -205,11 +208,27 @@ class IngredientManager:
         Returns:
             True if ingredient was deleted, False if not found
         """
+        return IngredientManager.delete_ingredient_returning_name(ingredient_id) is not None
+    
+    @staticmethod
+    def delete_ingredient_returning_name(ingredient_id: int) -> Optional[str]:
+        """
+        Delete an ingredient and report the name it had.
+
+        The lookup and delete share one session, so callers that only need the
+        name for a confirmation message avoid a separate fetch.
+        
+        Args:
+            ingredient_id: Ingredient ID to delete
+            
+        Returns:
+            Name of the deleted ingredient, or None if not found
+        """
         with get_db_session() as session:
             ingredient = session.query(Ingredient).filter(Ingredient.id == ingredient_id).first()
             
             if not ingredient:
-                return False
+                return None
             
             # Check for recipe associations
             recipe_count = session.query(recipe_ingredients).filter(
@@ -219,9 +238,10 @@ class IngredientManager:
             ingredient_name = ingredient.name
             session.delete(ingredient)
             session.commit()
+            invalidate_statistics_cache()
             
             logger.info(f"Deleted ingredient: {ingredient_name} (was used in {recipe_count} recipes)")
-            return True
+            return ingredient_name
     
     @staticmethod
     def get_ingredient_statistics() -> Dict[str, Any]:
@@ -267,6 +287,38 @@ class IngredientManager:
                 'most_used': [(name, count) for name, count in most_used]
             }
     
+    @staticmethod
+    def get_extended_statistics(
+        min_protein: float = 15,
+        max_calories: float = 50,
+        min_fiber: float = 5
+    ) -> Dict[str, int]:
+        """
+        Count ingredients in the quick nutrition groups with a single aggregate query.
+
+        Args:
+            min_protein: Protein per 100g at or above which an ingredient is high protein
+            max_calories: Calories per 100g at or below which an ingredient is low calorie
+            min_fiber: Fiber per 100g at or above which an ingredient is high fiber
+
+        Returns:
+            Dictionary with high_protein, low_calorie, high_fiber and category counts
+        """
+        with get_db_session() as session:
+            high_protein, low_calorie, high_fiber, categories = session.query(
+                func.count(case((Ingredient.protein_per_100g >= min_protein, Ingredient.id))),
+                func.count(case((Ingredient.calories_per_100g <= max_calories, Ingredient.id))),
+                func.count(case((Ingredient.fiber_per_100g >= min_fiber, Ingredient.id))),
+                func.count(distinct(case((Ingredient.category != '', Ingredient.category))))
+            ).one()
+
+            return {
+                'high_protein': high_protein,
+                'low_calorie': low_calorie,
+                'high_fiber': high_fiber,
+                'categories': categories
+            }
+
     @staticmethod
     def bulk_import_ingredients(ingredients_data: List[Dict[str, Any]]) -> Tuple[int, List[str]]:
         """
@@ -309,6 +361,8 @@ class IngredientManager:
             
             session.commit()
         
+        if imported_count:
+            invalidate_statistics_cache()
         return imported_count, errors
 
 
@@ -328,11 +382,15 @@ class IngredientFormatter:
         """
         category_info = f" ({ingredient.category})" if ingredient.category else ""
         
+        # Read each instrumented attribute once
+        calories = ingredient.calories_per_100g
+        protein = ingredient.protein_per_100g
+
         nutrition_parts = []
-        if ingredient.calories_per_100g:
-            nutrition_parts.append(f"{ingredient.calories_per_100g:.0f} cal")
-        if ingredient.protein_per_100g:
-            nutrition_parts.append(f"{ingredient.protein_per_100g:.1f}g protein")
+        if calories:
+            nutrition_parts.append(f"{calories:.0f} cal")
+        if protein:
+            nutrition_parts.append(f"{protein:.1f}g protein")
         
         nutrition_info = f" - {', '.join(nutrition_parts)}" if nutrition_parts else ""
         
@@ -349,13 +407,27 @@ class IngredientFormatter:
         Returns:
             Formatted string
         """
-        lines = [
-            f"Ingredient: {ingredient.name}",
-            f"ID: {ingredient.id}",
-        ]
+        return "\n".join(IngredientFormatter.iter_ingredient_details(ingredient))
+    
+    @staticmethod
+    def iter_ingredient_details(ingredient: Ingredient) -> Iterator[str]:
+        """
+        Yield the lines of an ingredient's detailed display.
+
+        Bulk callers can extend their own output list with these lines rather
+        than joining each ingredient into a string first.
+        
+        Args:
+            ingredient: Ingredient object
+            
+        Yields:
+            Formatted lines, without trailing newlines
+        """
+        yield f"Ingredient: {ingredient.name}"
+        yield f"ID: {ingredient.id}"
         
         if ingredient.category:
-            lines.append(f"Category: {ingredient.category}")
+            yield f"Category: {ingredient.category}"
         
         # Nutritional information per 100g
         nutrition_lines = []
@@ -375,14 +447,12 @@ class IngredientFormatter:
             nutrition_lines.append(f"  Sodium: {ingredient.sodium_per_100g:.1f}mg")
         
         if nutrition_lines:
-            lines.append("Nutrition (per 100g):")
-            lines.extend(nutrition_lines)
+            yield "Nutrition (per 100g):"
+            yield from nutrition_lines
         
         # Unit information
         if ingredient.common_unit:
             unit_info = f"Common unit: {ingredient.common_unit}"
             if ingredient.unit_weight_grams:
                 unit_info += f" ({ingredient.unit_weight_grams}g)"
-            lines.append(unit_info)
-        
-        return "\n".join(lines)
+            yield unit_info
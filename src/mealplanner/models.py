@@ -48,7 +48,8 @@ recipe_ingredients = Table(
     'recipe_ingredients',
     Base.metadata,
     Column('recipe_id', Integer, ForeignKey('recipes.id'), primary_key=True),
-    Column('ingredient_id', Integer, ForeignKey('ingredients.id'), primary_key=True),
+    # Indexed separately: the composite primary key leads with recipe_id
+    Column('ingredient_id', Integer, ForeignKey('ingredients.id'), primary_key=True, index=True),
     Column('quantity', Float, nullable=False, default=1.0),
     Column('unit', String(50), nullable=True),
     Column('notes', String(255), nullable=True)
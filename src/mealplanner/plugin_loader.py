@@ -7,8 +7,9 @@ Discovers and loads Python modules from the plugins/ directory at runtime.
 import importlib.util
 import logging
 import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -155,6 +156,28 @@ def get_plugin_loader() -> PluginLoader:
     return _plugin_loader
 
 
+@lru_cache(maxsize=1)
+def _load_plugins_cached(loader: PluginLoader, plugins_dir: Path, mtime_ns: Optional[int]) -> Dict[str, Any]:
+    """Load plugins once per (loader, directory, modification time) key."""
+    return loader.load_all_plugins()
+
+
 def load_plugins() -> Dict[str, Any]:
-    """Load all plugins using the global plugin loader."""
-    return _plugin_loader.load_all_plugins()
+    """
+    Load all plugins using the global plugin loader.
+
+    Results are memoized on the plugins directory and its modification time, so
+    repeated calls in one process skip rescanning until files are added to or
+    removed from the directory. Call clear_plugin_cache() to force a reload.
+    """
+    plugins_dir = _plugin_loader.plugins_dir
+    try:
+        mtime_ns = plugins_dir.stat().st_mtime_ns
+    except OSError:
+        mtime_ns = None
+    return _load_plugins_cached(_plugin_loader, plugins_dir, mtime_ns)
+
+
+def clear_plugin_cache() -> None:
+    """Forget memoized plugin loads so the next load_plugins() call rescans."""
+    _load_plugins_cached.cache_clear()
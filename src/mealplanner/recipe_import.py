@@ -8,7 +8,7 @@ import csv
 import json
 import logging
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple, Union
+from typing import Callable, Dict, List, Optional, Any, Tuple, Union
 from urllib.parse import urlparse
 
 import requests
@@ -16,15 +16,41 @@ from sqlalchemy.orm import Session
 
 from .database import get_db_session
 from .models import Recipe, Ingredient, create_recipe, create_ingredient
+from .statistics_cache import invalidate_statistics_cache
+
+# Optional orjson import - parses large recipe files faster if installed
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Rows processed between progress callbacks during an import
+PROGRESS_INTERVAL = 1000
+
+# Progress callback: (rows processed, imported so far, skipped so far)
+ProgressCallback = Callable[[int, int, int], None]
+
 
 class RecipeImportError(Exception):
     """Raised when recipe import fails."""
     pass
 
 
+def _loads(data: bytes) -> Any:
+    """
+    Parse JSON bytes, using orjson when it is available.
+
+    Raises:
+        json.JSONDecodeError: If the data is not valid JSON (orjson's error subclasses it)
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 class RecipeValidator:
     """Validates recipe data before import."""
     
@@ -191,13 +217,19 @@ class RecipeImporter:
         self.validator = RecipeValidator()
         self.deduplicator = RecipeDeduplicator()
     
-    def import_from_json(self, file_path: Union[str, Path], skip_duplicates: bool = True) -> Tuple[int, int, List[str]]:
+    def import_from_json(
+        self,
+        file_path: Union[str, Path],
+        skip_duplicates: bool = True,
+        progress: Optional[ProgressCallback] = None
+    ) -> Tuple[int, int, List[str]]:
         """
         Import recipes from a JSON file.
         
         Args:
             file_path: Path to JSON file
             skip_duplicates: Whether to skip duplicate recipes
+            progress: Optional callback invoked every PROGRESS_INTERVAL rows and at the end
             
         Returns:
             Tuple of (imported_count, skipped_count, errors)
@@ -208,8 +240,8 @@ class RecipeImporter:
             raise RecipeImportError(f"File not found: {file_path}")
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(file_path, 'rb') as f:
+                data = _loads(f.read())
         except json.JSONDecodeError as e:
             raise RecipeImportError(f"Invalid JSON file: {e}")
         except Exception as e:
@@ -223,15 +255,21 @@ class RecipeImporter:
         else:
             raise RecipeImportError("JSON file must contain a recipe object or array of recipes")
         
-        return self._import_recipes(recipes_data, skip_duplicates)
+        return self._import_recipes(recipes_data, skip_duplicates, progress)
     
-    def import_from_csv(self, file_path: Union[str, Path], skip_duplicates: bool = True) -> Tuple[int, int, List[str]]:
+    def import_from_csv(
+        self,
+        file_path: Union[str, Path],
+        skip_duplicates: bool = True,
+        progress: Optional[ProgressCallback] = None
+    ) -> Tuple[int, int, List[str]]:
         """
         Import recipes from a CSV file.
         
         Args:
             file_path: Path to CSV file
             skip_duplicates: Whether to skip duplicate recipes
+            progress: Optional callback invoked every PROGRESS_INTERVAL rows and at the end
             
         Returns:
             Tuple of (imported_count, skipped_count, errors)
@@ -269,12 +307,18 @@ class RecipeImporter:
         except Exception as e:
             raise RecipeImportError(f"Error reading CSV file: {e}")
         
-        imported, skipped, import_errors = self._import_recipes(recipes_data, skip_duplicates)
+        imported, skipped, import_errors = self._import_recipes(recipes_data, skip_duplicates, progress)
         errors.extend(import_errors)
         
         return imported, skipped, errors
     
-    def import_from_url(self, url: str, skip_duplicates: bool = True, timeout: int = 30) -> Tuple[int, int, List[str]]:
+    def import_from_url(
+        self,
+        url: str,
+        skip_duplicates: bool = True,
+        timeout: int = 30,
+        progress: Optional[ProgressCallback] = None
+    ) -> Tuple[int, int, List[str]]:
         """
         Import recipes from a URL.
         
@@ -282,6 +326,7 @@ class RecipeImporter:
             url: URL to fetch recipe data from
             skip_duplicates: Whether to skip duplicate recipes
             timeout: Request timeout in seconds
+            progress: Optional callback invoked every PROGRESS_INTERVAL rows and at the end
             
         Returns:
             Tuple of (imported_count, skipped_count, errors)
@@ -310,15 +355,21 @@ class RecipeImporter:
         else:
             raise RecipeImportError("URL must return a recipe object or array of recipes")
         
-        return self._import_recipes(recipes_data, skip_duplicates)
+        return self._import_recipes(recipes_data, skip_duplicates, progress)
     
-    def _import_recipes(self, recipes_data: List[Dict[str, Any]], skip_duplicates: bool) -> Tuple[int, int, List[str]]:
+    def _import_recipes(
+        self,
+        recipes_data: List[Dict[str, Any]],
+        skip_duplicates: bool,
+        progress: Optional[ProgressCallback] = None
+    ) -> Tuple[int, int, List[str]]:
         """
         Import a list of recipe data.
         
         Args:
             recipes_data: List of recipe dictionaries
             skip_duplicates: Whether to skip duplicate recipes
+            progress: Optional callback invoked every PROGRESS_INTERVAL rows and at the end
             
         Returns:
             Tuple of (imported_count, skipped_count, errors)
@@ -329,6 +380,8 @@ class RecipeImporter:
         
         with get_db_session() as session:
             for i, recipe_data in enumerate(recipes_data, start=1):
+                if progress is not None and i > 1 and (i - 1) % PROGRESS_INTERVAL == 0:
+                    progress(i - 1, imported_count, skipped_count)
                 try:
                     # Validate recipe data
                     is_valid, validation_errors = self.validator.validate_recipe(recipe_data, i)
@@ -354,4 +407,8 @@ class RecipeImporter:
                     errors.append(f"Recipe {i}: Error importing recipe: {e}")
                     logger.error(f"Error importing recipe {i}: {e}")
         
+        if imported_count:
+            invalidate_statistics_cache()
+        if progress is not None:
+            progress(len(recipes_data), imported_count, skipped_count)
         return imported_count, skipped_count, errors
@@ -5,12 +5,13 @@ Handles CRUD operations, searching, filtering, and pagination for recipes.
 """
 
 import logging
-from typing import List, Optional, Dict, Any, Tuple
+from typing import Iterator, List, Optional, Dict, Any, Tuple
 from sqlalchemy.orm import Session
 from sqlalchemy import or_, and_, func
 
 from .database import get_db_session
 from .models import Recipe, Plan
+from .statistics_cache import invalidate_statistics_cache
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +36,71 @@ class RecipeManager:
                 session.expunge(recipe)
             return recipe
     
+    @staticmethod
+    def _build_list_query(
+        session: Session,
+        cuisine: Optional[str] = None,
+        max_time: Optional[int] = None,
+        diet: Optional[str] = None,
+        search: Optional[str] = None,
+        sort_by: str = 'title'
+    ):
+        """
+        Build the filtered and sorted recipe query shared by the listing methods.
+
+        Args:
+            session: Active database session
+            cuisine: Filter by cuisine
+            max_time: Maximum total cooking time in minutes
+            diet: Filter by dietary tag
+            search: Search term for title and description
+            sort_by: Sort field ('title', 'prep_time', 'created_at')
+
+        Returns:
+            SQLAlchemy query over Recipe
+        """
+        query = session.query(Recipe)
+
+        # Apply filters
+        if cuisine:
+            query = query.filter(Recipe.cuisine.ilike(f"%{cuisine}%"))
+
+        if max_time:
+            # Filter by total time (prep_time + cook_time)
+            query = query.filter(
+                or_(
+                    and_(Recipe.prep_time.isnot(None), Recipe.cook_time.isnot(None),
+                         Recipe.prep_time + Recipe.cook_time <= max_time),
+                    and_(Recipe.prep_time.isnot(None), Recipe.cook_time.is_(None),
+                         Recipe.prep_time <= max_time),
+                    and_(Recipe.prep_time.is_(None), Recipe.cook_time.isnot(None),
+                         Recipe.cook_time <= max_time)
+                )
+            )
+
+        if diet:
+            query = query.filter(Recipe.dietary_tags.ilike(f"%{diet}%"))
+
+        if search:
+            search_term = f"%{search}%"
+            query = query.filter(
+                or_(
+                    Recipe.title.ilike(search_term),
+                    Recipe.description.ilike(search_term),
+                    Recipe.instructions.ilike(search_term)
+                )
+            )
+
+        # Apply sorting
+        if sort_by == 'prep_time':
+            query = query.order_by(Recipe.prep_time.asc().nulls_last())
+        elif sort_by == 'created_at':
+            query = query.order_by(Recipe.created_at.desc())
+        else:  # Default to title
+            query = query.order_by(Recipe.title.asc())
+
+        return query
+
     @staticmethod
     def list_recipes(
         page: int = 1,
@@ -61,45 +127,7 @@ class RecipeManager:
             Tuple of (recipes, total_count, total_pages)
         """
         with get_db_session() as session:
-            query = session.query(Recipe)
-
-            # Apply filters
-            if cuisine:
-                query = query.filter(Recipe.cuisine.ilike(f"%{cuisine}%"))
-
-            if max_time:
-                # Filter by total time (prep_time + cook_time)
-                query = query.filter(
-                    or_(
-                        and_(Recipe.prep_time.isnot(None), Recipe.cook_time.isnot(None),
-                             Recipe.prep_time + Recipe.cook_time <= max_time),
-                        and_(Recipe.prep_time.isnot(None), Recipe.cook_time.is_(None),
-                             Recipe.prep_time <= max_time),
-                        and_(Recipe.prep_time.is_(None), Recipe.cook_time.isnot(None),
-                             Recipe.cook_time <= max_time)
-                    )
-                )
-
-            if diet:
-                query = query.filter(Recipe.dietary_tags.ilike(f"%{diet}%"))
-
-            if search:
-                search_term = f"%{search}%"
-                query = query.filter(
-                    or_(
-                        Recipe.title.ilike(search_term),
-                        Recipe.description.ilike(search_term),
-                        Recipe.instructions.ilike(search_term)
-                    )
-                )
-
-            # Apply sorting
-            if sort_by == 'prep_time':
-                query = query.order_by(Recipe.prep_time.asc().nulls_last())
-            elif sort_by == 'created_at':
-                query = query.order_by(Recipe.created_at.desc())
-            else:  # Default to title
-                query = query.order_by(Recipe.title.asc())
+            query = RecipeManager._build_list_query(session, cuisine, max_time, diet, search, sort_by)
 
             # Get total count
             total_count = query.count()
@@ -116,6 +144,54 @@ class RecipeManager:
                 session.expunge(recipe)
 
             return recipes, total_count, total_pages
+
+    @staticmethod
+    def count_recipes(
+        cuisine: Optional[str] = None,
+        max_time: Optional[int] = None,
+        diet: Optional[str] = None,
+        search: Optional[str] = None
+    ) -> int:
+        """
+        Count recipes matching the listing filters.
+
+        Args:
+            cuisine: Filter by cuisine
+            max_time: Maximum total cooking time in minutes
+            diet: Filter by dietary tag
+            search: Search term for title and description
+
+        Returns:
+            Number of matching recipes
+        """
+        with get_db_session() as session:
+            return RecipeManager._build_list_query(session, cuisine, max_time, diet, search).count()
+
+    @staticmethod
+    def iter_recipes(
+        page: int = 1,
+        per_page: int = 10,
+        cuisine: Optional[str] = None,
+        max_time: Optional[int] = None,
+        diet: Optional[str] = None,
+        search: Optional[str] = None,
+        sort_by: str = 'title'
+    ) -> Iterator[Recipe]:
+        """
+        Yield one page of recipes without loading the whole page into memory.
+
+        Takes the same arguments as list_recipes. Rows are fetched in batches and
+        each recipe is detached before it is yielded.
+
+        Yields:
+            Recipe objects in the requested order
+        """
+        with get_db_session() as session:
+            query = RecipeManager._build_list_query(session, cuisine, max_time, diet, search, sort_by)
+            offset = (page - 1) * per_page
+            for recipe in query.offset(offset).limit(per_page).yield_per(100):
+                session.expunge(recipe)
+                yield recipe
     
     @staticmethod
     def search_recipes(
@@ -167,6 +243,9 @@ class RecipeManager:
                         setattr(recipe, field, value)
             
             session.commit()
+            invalidate_statistics_cache()
+            session.refresh(recipe)
+            session.expunge(recipe)
             logger.info(f"Updated recipe: {recipe.title}")
             return recipe
     
@@ -193,6 +272,7 @@ class RecipeManager:
             recipe_title = recipe.title
             session.delete(recipe)
             session.commit()
+            invalidate_statistics_cache()
             
             logger.info(f"Deleted recipe: {recipe_title} (had {plan_count} associated plans)")
             return True
@@ -0,0 +1,44 @@
+"""
+In-process cache of statistics for the Smart Meal Planner application.
+
+Ingredient and recipe managers clear it after every committed write, since
+ingredient usage counts depend on both.
+"""
+
+import time
+from typing import Any, Callable, Dict, Tuple
+
+from .database import get_engine
+
+# Seconds that statistics stay cached within one process
+STATS_TTL = 300
+
+# Cached statistics keyed by (database URL, name): (monotonic timestamp, value)
+_stats_cache: Dict[Tuple[str, str], Tuple[float, Any]] = {}
+
+
+def invalidate_statistics_cache() -> None:
+    """Drop cached statistics after ingredients or recipes change."""
+    _stats_cache.clear()
+
+
+def cached_statistics(name: str, fn: Callable[[], Any], ttl: float = STATS_TTL) -> Any:
+    """
+    Return cached statistics for name, calling fn when missing or expired.
+    
+    Args:
+        name: Name of the statistics within the current database
+        fn: Zero-argument callable that computes the statistics
+        ttl: Maximum age of a cached value in seconds
+        
+    Returns:
+        The cached or freshly computed statistics
+    """
+    key = (str(get_engine().url), name)
+    now = time.monotonic()
+    entry = _stats_cache.get(key)
+    if entry is not None and now - entry[0] < ttl:
+        return entry[1]
+    value = fn()
+    _stats_cache[key] = (now, value)
+    return value
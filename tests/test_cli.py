@@ -4,6 +4,7 @@ Tests for the CLI module.
 
 import pytest
 import sys
+from typer import Typer
 from typer.testing import CliRunner
 from unittest.mock import patch, MagicMock
 
@@ -20,8 +21,8 @@ def runner():
 @pytest.fixture
 def mock_config():
     """Mock configuration for testing."""
-    with patch('mealplanner.cli.init_config') as mock_init, \
-         patch('mealplanner.cli.get_config') as mock_get:
+    with patch('mealplanner.config.init_config') as mock_init, \
+         patch('mealplanner.config.get_config') as mock_get:
         
         mock_config_obj = MagicMock()
         mock_config_obj.debug = False
@@ -33,7 +34,7 @@ def mock_config():
 @pytest.fixture
 def mock_health_check():
     """Mock health check for testing."""
-    with patch('mealplanner.cli.run_health_check') as mock_check:
+    with patch('mealplanner.health.run_health_check') as mock_check:
         mock_check.return_value = (True, [])  # Success, no issues
         yield mock_check
 
@@ -41,11 +42,32 @@ def mock_health_check():
 @pytest.fixture
 def mock_plugins():
     """Mock plugin loading for testing."""
-    with patch('mealplanner.cli.load_plugins') as mock_load:
+    with patch('mealplanner.plugin_loader.load_plugins') as mock_load:
         mock_load.return_value = {}
         yield mock_load
 
 
+@pytest.fixture
+def sqlite_recipe(tmp_path, monkeypatch):
+    """Point the real database layer at a fresh SQLite file holding one recipe."""
+    from mealplanner.config import Config
+    from mealplanner.database import get_db_session, init_database, reset_database_globals
+    from mealplanner.models import Recipe
+
+    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{tmp_path / 'cli.db'}")
+    config = Config()
+    monkeypatch.setattr("mealplanner.database.get_config", lambda: config)
+    reset_database_globals()
+    init_database()
+    with get_db_session() as session:
+        recipe = Recipe(title="Pancakes", prep_time=10, servings=2)
+        session.add(recipe)
+        session.flush()
+        recipe_id = recipe.id
+    yield recipe_id
+    reset_database_globals()
+
+
 class TestCLIBasics:
     """Test basic CLI functionality."""
     
@@ -76,8 +98,8 @@ class TestCLIOptions:
     
     def test_debug_flag(self, runner, mock_health_check, mock_plugins):
         """Test that --debug flag is passed to configuration."""
-        with patch('mealplanner.cli.init_config') as mock_init, \
-             patch('mealplanner.cli.get_config') as mock_get:
+        with patch('mealplanner.config.init_config') as mock_init, \
+             patch('mealplanner.config.get_config') as mock_get:
             
             mock_config_obj = MagicMock()
             mock_config_obj.debug = True
@@ -92,8 +114,8 @@ class TestCLIOptions:
         config_file = tmp_path / "test.env"
         config_file.write_text("TEST_VAR=test_value")
         
-        with patch('mealplanner.cli.init_config') as mock_init, \
-             patch('mealplanner.cli.get_config') as mock_get:
+        with patch('mealplanner.config.init_config') as mock_init, \
+             patch('mealplanner.config.get_config') as mock_get:
             
             mock_config_obj = MagicMock()
             mock_config_obj.debug = False
@@ -124,23 +146,59 @@ class TestHealthChecks:
     
     def test_health_check_failure(self, runner, mock_config, mock_plugins):
         """Test behavior when health checks fail."""
-        with patch('mealplanner.cli.run_health_check') as mock_check, \
-             patch('mealplanner.cli.create_missing_directories') as mock_create:
+        with patch('mealplanner.health.run_health_check') as mock_check, \
+             patch('mealplanner.health.create_missing_directories') as mock_create:
 
             mock_check.return_value = (False, ["Missing directory: tests"])
 
-            result = runner.invoke(app, ["hello"])
+            result = runner.invoke(app, ["list-recipes"])
             assert result.exit_code == 1
             assert "Health check failed" in result.stderr
             assert "Missing directory: tests" in result.stderr
             mock_create.assert_called_once()
     
+    def test_subcommand_help_skips_health_check(self, runner, mock_config, mock_health_check, mock_plugins):
+        """Test that subcommand --help does not run health checks or load plugins."""
+        result = runner.invoke(app, ["list-recipes", "--help"])
+
+        assert result.exit_code == 0
+        mock_health_check.assert_not_called()
+        mock_plugins.assert_not_called()
+
+    def test_help_as_option_value_runs_health_check(self, runner, mock_config, mock_health_check, mock_plugins):
+        """Test that --help consumed as an option value is not treated as a help request."""
+        with patch('mealplanner.recipe_management.RecipeManager') as mock_manager:
+            mock_manager.count_recipes.return_value = 0
+            mock_manager.iter_recipes.return_value = iter([])
+            runner.invoke(app, ["list-recipes", "--search", "--help"])
+
+        mock_health_check.assert_called_once()
+        assert mock_manager.count_recipes.call_args.kwargs["search"] == "--help"
+
+    def test_subcommand_help_ignores_host_argv(self, runner, mock_config, mock_health_check, mock_plugins):
+        """Test that in-process calls decide from their own arguments, not sys.argv."""
+        with patch.object(sys, 'argv', ['pytest', '--help']), \
+             patch('mealplanner.recipe_management.RecipeManager') as mock_manager:
+            mock_manager.count_recipes.return_value = 0
+            runner.invoke(app, ["list-recipes"])
+
+        mock_health_check.assert_called_once()
+
+    @pytest.mark.parametrize("command", ["hello", "db-info"])
+    def test_read_only_commands_skip_health_check(self, runner, mock_config, mock_health_check, mock_plugins, command):
+        """Test that read-only commands run without health checks or plugin loading."""
+        with patch('mealplanner.database.get_database_info', return_value={}):
+            runner.invoke(app, [command])
+
+        mock_health_check.assert_not_called()
+        mock_plugins.assert_not_called()
+
     def test_health_check_exception(self, runner, mock_config, mock_plugins):
         """Test behavior when health check raises exception."""
-        with patch('mealplanner.cli.run_health_check') as mock_check:
+        with patch('mealplanner.health.run_health_check') as mock_check:
             mock_check.side_effect = Exception("Health check error")
 
-            result = runner.invoke(app, ["hello"])
+            result = runner.invoke(app, ["list-recipes"])
             assert result.exit_code == 1
             assert "Error during health check" in result.stderr
 
@@ -154,6 +212,8 @@ class TestErrorHandling:
         captured = capsys.readouterr()
         assert "Unknown command 'nonexistent'" in captured.err
         assert "Available commands:" in captured.err
+        assert "  list-recipes\n" in captured.err
+        assert "None" not in captured.err
         assert "Use 'mealplanner --help'" in captured.err
 
     def test_cli_main_with_exception(self, runner, mock_config, mock_health_check, mock_plugins):
@@ -166,6 +226,58 @@ class TestErrorHandling:
                 cli_main()
 
 
+class TestLazyCommandRegistration:
+    """Test that cli_main only builds the invoked subcommand."""
+
+    def test_sniff_subcommand_skips_global_options(self):
+        """Test that global options and their values are not taken as the command."""
+        from mealplanner.cli import _sniff_subcommand
+        assert _sniff_subcommand(["--debug", "--config", "app.env", "hello"]) == "hello"
+        assert _sniff_subcommand(["--help"]) is None
+        assert _sniff_subcommand([]) is None
+
+    def test_cli_main_registers_only_invoked_command(self):
+        """Test that only the sniffed command is built and the app is left intact."""
+        from mealplanner.cli import cli_main, _command_name
+        total = len(app.registered_commands)
+        seen = []
+
+        def fake_call(typer_app):
+            seen.append([_command_name(info) for info in typer_app.registered_commands])
+            seen.append(len(app.registered_commands))
+            assert typer_app is not app
+            assert typer_app.registered_callback is app.registered_callback
+
+        with patch.object(sys, 'argv', ['mealplanner', 'db-info']), \
+             patch.object(Typer, '__call__', autospec=True, side_effect=fake_call):
+            cli_main()
+
+        assert seen == [["db-info"], total]
+        assert len(app.registered_commands) == total
+
+    def test_cli_main_runs_full_app_for_unknown_command(self):
+        """Test that help and unknown commands run against the full app."""
+        from mealplanner.cli import cli_main
+        called = []
+
+        with patch.object(sys, 'argv', ['mealplanner', '--help']), \
+             patch.object(Typer, '__call__', autospec=True,
+                          side_effect=lambda typer_app: called.append(typer_app)):
+            cli_main()
+
+        assert called == [app]
+
+    def test_single_command_app_runs_invoked_command(self, runner, mock_config, mock_health_check, mock_plugins):
+        """Test that the throwaway app keeps the root callback and global options."""
+        from mealplanner.cli import _single_command_app, _command_name
+        info = next(i for i in app.registered_commands if _command_name(i) == "hello")
+
+        result = runner.invoke(_single_command_app(info), ["--debug", "hello"])
+
+        assert result.exit_code == 0
+        assert "Hello from Smart Meal Planner!" in result.stdout
+
+
 class TestConfigValidation:
     """Test configuration validation."""
 
@@ -193,6 +305,17 @@ class TestConfigValidation:
         result = validate_config_file(str(config_file))
         assert result == str(config_file)
 
+    def test_validate_config_file_unsupported_suffix(self, tmp_path, capsys):
+        """Test config file validation rejects unsupported extensions."""
+        import typer
+        from mealplanner.cli import validate_config_file
+        config_file = tmp_path / "config.toml"
+        config_file.write_text("TEST = 'value'")
+
+        with pytest.raises(typer.Exit):
+            validate_config_file(str(config_file))
+        assert "Unsupported config file format: .toml" in capsys.readouterr().err
+
 
 class TestDatabaseCommands:
     """Test database-related CLI commands."""
@@ -324,7 +447,8 @@ class TestRecipeCommands:
         ]
 
         with patch('mealplanner.recipe_management.RecipeManager') as mock_manager:
-            mock_manager.list_recipes.return_value = (mock_recipes, 2, 1)
+            mock_manager.count_recipes.return_value = 2
+            mock_manager.iter_recipes.return_value = iter(mock_recipes)
 
             with patch('mealplanner.recipe_management.RecipeFormatter') as mock_formatter:
                 mock_formatter.format_recipe_summary.side_effect = [
@@ -338,3 +462,442 @@ class TestRecipeCommands:
                 assert "Recipes (Page 1 of 1, 2 total)" in result.stdout
                 assert "Test Recipe 1" in result.stdout
                 assert "Test Recipe 2" in result.stdout
+
+    def test_list_recipes_detailed_layout(self, runner, mock_config, mock_health_check, mock_plugins):
+        """Test that detailed listings keep one separator after each recipe."""
+        from mealplanner.models import Recipe
+
+        mock_recipes = [Recipe(id=1, title="One"), Recipe(id=2, title="Two")]
+
+        with patch('mealplanner.recipe_management.RecipeManager') as mock_manager:
+            mock_manager.count_recipes.return_value = 2
+            mock_manager.iter_recipes.return_value = iter(mock_recipes)
+
+            with patch('mealplanner.recipe_management.RecipeFormatter') as mock_formatter:
+                mock_formatter.format_recipe_details.side_effect = ["Details One", "Details Two"]
+
+                result = runner.invoke(app, ["list-recipes", "--detailed"])
+
+                assert result.exit_code == 0
+                separator = "-" * 40
+                assert f"Details One\n{separator}\nDetails Two\n{separator}\n" in result.stdout
+
+    @pytest.mark.parametrize("option", ["--page", "--per-page"])
+    def test_list_recipes_rejects_non_positive_paging(self, runner, mock_config, mock_health_check, mock_plugins, option):
+        """Test that a zero page or page size is a usage error before any query runs."""
+        with patch('mealplanner.recipe_management.RecipeManager') as mock_manager:
+            result = runner.invoke(app, ["list-recipes", option, "0"])
+
+        assert result.exit_code == 2
+        mock_manager.count_recipes.assert_not_called()
+
+
+class TestIngredientStatsCache:
+    """Test in-process caching of ingredient statistics."""
+
+    @pytest.fixture(autouse=True)
+    def clear_stats_cache(self):
+        """Start and finish each test with an empty statistics cache."""
+        from mealplanner.statistics_cache import invalidate_statistics_cache
+        invalidate_statistics_cache()
+        with patch('mealplanner.statistics_cache.get_engine') as mock_engine:
+            mock_engine.return_value.url = "sqlite:///test.db"
+            yield
+        invalidate_statistics_cache()
+
+    def test_stats_reused_within_process(self, runner, mock_config, mock_health_check, mock_plugins):
+        """Test that repeated stats calls in one process hit the cache."""
+        stats = {
+            'total_ingredients': 2, 'categories': {}, 'avg_calories_per_100g': None,
+            'avg_protein_per_100g': None, 'most_used': []
+        }
+        with patch('mealplanner.ingredient_management.IngredientManager') as mock_manager, \
+             patch('mealplanner.ingredient_management.IngredientFormatter'):
+            mock_manager.get_ingredient_statistics.return_value = stats
+            mock_manager.get_extended_statistics.return_value = {
+                'high_protein': 1, 'low_calorie': 0, 'high_fiber': 0, 'categories': 3
+            }
+
+            first = runner.invoke(app, ["ingredient-stats"])
+            assert first.exit_code == 0
+            assert "Total ingredients: 2\n" in first.stdout
+            assert "  Available categories: 3\n" in first.stdout
+            assert runner.invoke(app, ["ingredient-stats"]).exit_code == 0
+            assert mock_manager.get_ingredient_statistics.call_count == 1
+            assert mock_manager.get_extended_statistics.call_count == 1
+
+    def test_stats_json_output(self, runner, mock_config, mock_health_check, mock_plugins):
+        """Test that --json prints the statistics as one JSON document."""
+        import json
+        stats = {
+            'total_ingredients': 2, 'categories': {'Meat': 1}, 'avg_calories_per_100g': 120.5,
+            'avg_protein_per_100g': None, 'most_used': [('Chicken', 3)]
+        }
+        extended = {'high_protein': 1, 'low_calorie': 0, 'high_fiber': 0, 'categories': 1}
+        with patch('mealplanner.ingredient_management.IngredientManager') as mock_manager:
+            mock_manager.get_ingredient_statistics.return_value = stats
+            mock_manager.get_extended_statistics.return_value = extended
+
+            result = runner.invoke(app, ["ingredient-stats", "--json"])
+
+            assert result.exit_code == 0
+            assert result.stdout.count("\n") == 1
+            data = json.loads(result.stdout)
+            assert data['total_ingredients'] == 2
+            assert data['most_used'] == [['Chicken', 3]]
+            assert data['insights'] == extended
+
+    def test_stats_on_empty_database(self, runner, mock_config, mock_health_check, mock_plugins):
+        """Test that an empty database short-circuits before the insight query."""
+        with patch('mealplanner.ingredient_management.IngredientManager') as mock_manager:
+            mock_manager.get_ingredient_statistics.return_value = {
+                'total_ingredients': 0, 'categories': {}, 'avg_calories_per_100g': None,
+                'avg_protein_per_100g': None, 'most_used': []
+            }
+
+            result = runner.invoke(app, ["ingredient-stats"])
+
+            assert result.exit_code == 0
+            assert result.stdout == "No ingredients in database.\n"
+            mock_manager.get_extended_statistics.assert_not_called()
+
+
+class TestImportErrorReporting:
+    """Test how import row errors are reported."""
+
+    def test_long_error_lists_are_truncated(self, capsys):
+        """Test that only the first errors are shown unless show_all is set."""
+        from mealplanner.cli import _echo_import_errors, _MAX_REPORTED_IMPORT_ERRORS
+        errors = [f"Row {i}: missing title" for i in range(_MAX_REPORTED_IMPORT_ERRORS + 5)]
+
+        _echo_import_errors(errors)
+        err = capsys.readouterr().err
+        assert "Row 0: missing title" in err
+        assert f"Row {_MAX_REPORTED_IMPORT_ERRORS}: missing title" not in err
+        assert "... and 5 more (use --debug to show all)" in err
+
+        _echo_import_errors(errors, show_all=True)
+        err = capsys.readouterr().err
+        assert err.count("missing title") == len(errors)
+        assert "more" not in err
+
+
+class TestNonInteractiveUpdates:
+    """Test --set FIELD=VALUE updates that skip prompting."""
+
+    def test_update_recipe_with_set(self, runner, mock_config, mock_health_check, mock_plugins):
+        """Test that --set applies typed updates without prompting."""
+        from mealplanner.models import Recipe
+
+        with patch('mealplanner.recipe_management.RecipeManager') as mock_manager, \
+             patch('mealplanner.recipe_management.RecipeFormatter') as mock_formatter, \
+             patch('typer.prompt') as mock_prompt:
+            mock_manager.get_recipe_by_id.return_value = Recipe(id=1, title="Old")
+            mock_manager.update_recipe.return_value = Recipe(id=1, title="New")
+            mock_formatter.format_recipe_details.return_value = "New"
+
+            result = runner.invoke(app, [
+                "update-recipe", "1", "--set", "title=New", "--set", "prep_time=15", "--set", "cuisine="
+            ])
+
+            assert result.exit_code == 0
+            mock_prompt.assert_not_called()
+            mock_manager.update_recipe.assert_called_once_with(
+                1, {"title": "New", "prep_time": 15, "cuisine": None}
+            )
+
+    def test_update_recipe_with_editor(self, runner, mock_config, mock_health_check, mock_plugins, monkeypatch):
+        """Test that --edit applies the fields changed in one editor session."""
+        from mealplanner.models import Recipe
+
+        monkeypatch.setenv("VISUAL", "fake-editor --wait")
+        with patch('mealplanner.recipe_management.RecipeManager') as mock_manager, \
+             patch('mealplanner.recipe_management.RecipeFormatter') as mock_formatter, \
+             patch('subprocess.call', side_effect=self._editor_setting(title="New", servings=4)) as mock_call, \
+             patch('typer.prompt') as mock_prompt:
+            mock_manager.get_recipe_by_id.return_value = Recipe(id=1, title="Old", servings=2)
+            mock_manager.update_recipe.return_value = Recipe(id=1, title="New", servings=4)
+            mock_formatter.format_recipe_details.return_value = "New"
+
+            result = runner.invoke(app, ["update-recipe", "1", "--edit"])
+
+            assert result.exit_code == 0
+            assert mock_call.call_args[0][0][:2] == ["fake-editor", "--wait"]
+            mock_prompt.assert_not_called()
+            mock_manager.update_recipe.assert_called_once_with(1, {"title": "New", "servings": 4})
+
+    def test_update_recipe_with_set_on_real_database(self, runner, mock_config, mock_health_check, mock_plugins, sqlite_recipe):
+        """Test that a scripted update prints the saved recipe and exits cleanly."""
+        from mealplanner.recipe_management import RecipeManager
+
+        result = runner.invoke(app, ["update-recipe", str(sqlite_recipe), "--set", "prep_time=12"])
+
+        assert result.exit_code == 0, result.output
+        assert "✅ Recipe updated successfully!" in result.stdout
+        assert "Prep: 12 min" in result.stdout
+        assert RecipeManager.get_recipe_by_id(sqlite_recipe).prep_time == 12
+
+    @staticmethod
+    def _editor_setting(**changes):
+        """Build a subprocess.call stand-in that applies changes to the edited JSON file."""
+        import json
+
+        def fake_editor(argv):
+            path = argv[-1]
+            with open(path) as f:
+                fields = json.load(f)
+            fields.update(changes)
+            with open(path, "w") as f:
+                json.dump(fields, f)
+            return 0
+        return fake_editor
+
+    def test_update_recipe_with_editor_on_real_database(self, runner, mock_config, mock_health_check, mock_plugins,
+                                                        sqlite_recipe, monkeypatch):
+        """Test that a successful editor session saves the recipe and exits cleanly."""
+        from mealplanner.recipe_management import RecipeManager
+
+        monkeypatch.setenv("VISUAL", "fake-editor")
+        with patch('subprocess.call', side_effect=self._editor_setting(title="Crepes", servings=4)):
+            result = runner.invoke(app, ["update-recipe", str(sqlite_recipe), "--edit"])
+
+        assert result.exit_code == 0, result.output
+        assert "Recipe: Crepes" in result.stdout
+        recipe = RecipeManager.get_recipe_by_id(sqlite_recipe)
+        assert (recipe.title, recipe.servings) == ("Crepes", 4)
+
+    def test_update_recipe_editor_bad_value_is_usage_error(self, runner, mock_config, mock_health_check, mock_plugins,
+                                                           sqlite_recipe, monkeypatch):
+        """Test that an invalid value typed in the editor exits 2 like --set and changes nothing."""
+        from mealplanner.recipe_management import RecipeManager
+
+        monkeypatch.setenv("VISUAL", "fake-editor")
+        for servings in ("many", "4", 2.7, True):
+            with patch('subprocess.call', side_effect=self._editor_setting(servings=servings)):
+                result = runner.invoke(app, ["update-recipe", str(sqlite_recipe), "--edit"])
+
+            assert result.exit_code == 2
+            assert "Error updating recipe" not in result.output
+        assert RecipeManager.get_recipe_by_id(sqlite_recipe).servings == 2
+
+    def test_update_recipe_rejects_set_with_edit(self, runner, mock_config, mock_health_check, mock_plugins):
+        """Test that --set and --edit together are a usage error rather than --edit being ignored."""
+        with patch('mealplanner.recipe_management.RecipeManager') as mock_manager, \
+             patch('subprocess.call') as mock_call:
+            result = runner.invoke(app, ["update-recipe", "1", "--set", "title=X", "--edit"])
+
+            assert result.exit_code == 2
+            mock_call.assert_not_called()
+            mock_manager.update_recipe.assert_not_called()
+
+    @pytest.mark.parametrize("assignment", ["title", "color=red", "servings=many", "title="])
+    def test_update_recipe_rejects_bad_set(self, runner, mock_config, mock_health_check, mock_plugins, assignment):
+        """Test that malformed --set values are usage errors and nothing is updated."""
+        with patch('mealplanner.recipe_management.RecipeManager') as mock_manager:
+            result = runner.invoke(app, ["update-recipe", "1", "--set", assignment])
+
+            assert result.exit_code == 2
+            mock_manager.update_recipe.assert_not_called()
+
+    def test_update_ingredient_with_set(self, runner, mock_config, mock_health_check, mock_plugins):
+        """Test that update-ingredient accepts --set for nutrition fields."""
+        with patch('mealplanner.ingredient_management.IngredientManager') as mock_manager, \
+             patch('mealplanner.ingredient_management.IngredientFormatter'), \
+             patch('typer.prompt') as mock_prompt:
+            mock_manager.get_ingredient_by_id.return_value = MagicMock(name="ingredient")
+
+            result = runner.invoke(app, ["update-ingredient", "3", "--set", "calories_per_100g=52.5"])
+
+            assert result.exit_code == 0
+            mock_prompt.assert_not_called()
+            mock_manager.update_ingredient.assert_called_once_with(3, {"calories_per_100g": 52.5})
+
+    def test_update_ingredient_reads_json_from_piped_stdin(self, runner, mock_config, mock_health_check, mock_plugins):
+        """Test that non-interactive stdin supplies a JSON object of updates."""
+        with patch('mealplanner.ingredient_management.IngredientManager') as mock_manager, \
+             patch('mealplanner.ingredient_management.IngredientFormatter'), \
+             patch('typer.prompt') as mock_prompt:
+            mock_manager.get_ingredient_by_id.return_value = MagicMock(name="ingredient")
+
+            result = runner.invoke(
+                app, ["update-ingredient", "3"], input='{"calories_per_100g": 52, "category": null}'
+            )
+
+            assert result.exit_code == 0
+            mock_prompt.assert_not_called()
+            mock_manager.update_ingredient.assert_called_once_with(
+                3, {"calories_per_100g": 52.0, "category": None}
+            )
+
+    def test_update_ingredient_with_set_skips_lookup(self, runner, mock_config, mock_health_check, mock_plugins):
+        """Test that non-interactive updates rely on update_ingredient to detect a missing ID."""
+        with patch('mealplanner.ingredient_management.IngredientManager') as mock_manager, \
+             patch('mealplanner.ingredient_management.IngredientFormatter'):
+            mock_manager.update_ingredient.return_value = None
+
+            result = runner.invoke(app, ["update-ingredient", "3", "--set", "category=Fruit"])
+
+            assert result.exit_code == 1
+            assert "Ingredient with ID 3 not found" in result.stderr
+            mock_manager.get_ingredient_by_id.assert_not_called()
+
+    def test_update_ingredient_rejects_empty_stdin(self, runner, mock_config, mock_health_check, mock_plugins):
+        """Test that empty non-interactive stdin fails instead of reporting no changes."""
+        with patch('mealplanner.ingredient_management.IngredientManager') as mock_manager:
+            result = runner.invoke(app, ["update-ingredient", "3"], input="")
+
+            assert result.exit_code != 0
+            assert "No JSON updates on stdin" in result.output
+            assert "No changes made" not in result.output
+            mock_manager.update_ingredient.assert_not_called()
+
+    @pytest.mark.parametrize("payload", [
+        "not json", "[1, 2]", '{"colour": "red"}', '{"name": null}',
+        '{"calories_per_100g": true}', '{"calories_per_100g": "52"}', '{"name": {"a": 1}}', '{"category": ["x"]}'
+    ])
+    def test_update_ingredient_rejects_bad_json(self, runner, mock_config, mock_health_check, mock_plugins, payload):
+        """Test that malformed piped updates are usage errors."""
+        with patch('mealplanner.ingredient_management.IngredientManager') as mock_manager:
+            result = runner.invoke(app, ["update-ingredient", "3"], input=payload)
+
+            assert result.exit_code == 2
+            mock_manager.update_ingredient.assert_not_called()
+
+    def test_json_updates_are_type_checked_not_converted(self):
+        """Test that decoded JSON keeps its types and only integral numbers fill int fields."""
+        import typer
+        from mealplanner.cli import _coerce_field_updates, _RECIPE_SET_FIELDS
+
+        assert _coerce_field_updates(
+            {"servings": 2.0, "prep_time": 15, "title": " Soup "}, _RECIPE_SET_FIELDS, typed=True
+        ) == {"servings": 2, "prep_time": 15, "title": "Soup"}
+        for values in ({"servings": 2.7}, {"prep_time": True}, {"title": {"a": 1}}, {"cuisine": ["x"]}):
+            with pytest.raises(typer.BadParameter):
+                _coerce_field_updates(values, _RECIPE_SET_FIELDS, typed=True)
+
+    def test_update_ingredient_empty_json_on_missing_id(self, runner, mock_config, mock_health_check, mock_plugins):
+        """Test that an empty JSON object still reports an unknown ingredient ID."""
+        with patch('mealplanner.ingredient_management.IngredientManager') as mock_manager:
+            mock_manager.get_ingredient_by_id.return_value = None
+
+            result = runner.invoke(app, ["update-ingredient", "999"], input="{}")
+
+            assert result.exit_code == 1
+            assert "Ingredient with ID 999 not found" in result.stderr
+            assert "No changes made" not in result.output
+
+    def test_force_delete_skips_lookup(self, runner, mock_config, mock_health_check, mock_plugins):
+        """Test that --force deletes without a separate pre-fetch."""
+        with patch('mealplanner.ingredient_management.IngredientManager') as mock_manager, \
+             patch('mealplanner.ingredient_management.IngredientFormatter'):
+            mock_manager.delete_ingredient_returning_name.return_value = "Chicken Breast"
+
+            result = runner.invoke(app, ["delete-ingredient", "7", "--force"])
+
+            assert result.exit_code == 0
+            assert "Ingredient 'Chicken Breast' deleted successfully!" in result.stdout
+            mock_manager.get_ingredient_by_id.assert_not_called()
+            mock_manager.delete_ingredient_returning_name.assert_called_once_with(7)
+
+    def test_force_delete_missing_ingredient(self, runner, mock_config, mock_health_check, mock_plugins):
+        """Test that --force on an unknown ID reports not found."""
+        with patch('mealplanner.ingredient_management.IngredientManager') as mock_manager, \
+             patch('mealplanner.ingredient_management.IngredientFormatter'):
+            mock_manager.delete_ingredient_returning_name.return_value = None
+
+            result = runner.invoke(app, ["delete-ingredient", "7", "--force"])
+
+            assert result.exit_code == 1
+            assert "not found" in result.stderr
+
+
+class TestIngredientSearchRanges:
+    """Test the --range shorthand for search-ingredients."""
+
+    def test_parse_nutrient_ranges(self):
+        """Test parsing open and closed ranges."""
+        from mealplanner.cli import _parse_nutrient_ranges
+        ranges = _parse_nutrient_ranges(["calories=10:300", "Protein=5:"])
+        assert ranges == {"calories": (10.0, 300.0), "protein": (5.0, None)}
+
+    @pytest.mark.parametrize("value", ["calories", "calories=10", "sugar=1:2", "fat=a:b"])
+    def test_parse_nutrient_ranges_invalid(self, value):
+        """Test that malformed ranges are rejected."""
+        import typer
+        from mealplanner.cli import _parse_nutrient_ranges
+        with pytest.raises(typer.BadParameter):
+            _parse_nutrient_ranges([value])
+
+    def test_explicit_options_take_precedence(self, runner, mock_config, mock_health_check, mock_plugins):
+        """Test that --min-*/--max-* override the matching --range bound."""
+        with patch('mealplanner.ingredient_search.IngredientSearcher') as mock_searcher, \
+             patch('mealplanner.ingredient_search.IngredientSearchCriteria') as mock_criteria:
+            mock_searcher.search_ingredients.return_value = ([], 0, 0)
+
+            result = runner.invoke(app, [
+                "search-ingredients", "--range", "calories=10:300", "--max-calories", "200"
+            ])
+
+            assert result.exit_code == 0
+            kwargs = mock_criteria.call_args.kwargs
+            assert kwargs["min_calories"] == 10.0
+            assert kwargs["max_calories"] == 200.0
+
+
+class TestErrorBoundary:
+    """Test the shared command error boundary."""
+
+    def test_unexpected_error_exits_with_message(self, runner, mock_config, mock_health_check, mock_plugins):
+        """Test that unexpected errors are reported once and exit with status 1."""
+        with patch('mealplanner.recipe_management.RecipeManager') as mock_manager:
+            mock_manager.count_recipes.side_effect = Exception("boom")
+
+            result = runner.invoke(app, ["list-recipes"])
+
+            assert result.exit_code == 1
+            assert "Error listing recipes: boom" in result.stderr
+
+    def test_explicit_exit_is_not_reported_as_error(self, runner, mock_config, mock_health_check, mock_plugins):
+        """Test that typer.Exit raised inside a command passes through untouched."""
+        with patch('mealplanner.recipe_management.RecipeManager') as mock_manager:
+            mock_manager.get_recipe_by_id.return_value = None
+
+            result = runner.invoke(app, ["delete-recipe", "42"])
+
+            assert result.exit_code == 1
+            assert "Recipe with ID 42 not found" in result.stderr
+            assert "Error deleting recipe" not in result.stderr
+
+    def test_expected_errors_use_their_own_message(self, runner, mock_config, mock_health_check, mock_plugins, tmp_path):
+        """Test that anticipated exception types get their mapped message, others the generic one."""
+        from mealplanner.recipe_import import RecipeImportError
+
+        json_file = tmp_path / "recipes.json"
+        json_file.write_text("[]")
+        with patch('mealplanner.recipe_import.RecipeImporter') as mock_importer_class:
+            mock_importer_class.return_value.import_from_json.side_effect = RecipeImportError("bad file")
+            result = runner.invoke(app, ["import-recipes", str(json_file)])
+
+            assert result.exit_code == 1
+            assert "❌ Import failed: bad file" in result.stderr
+
+            mock_importer_class.return_value.import_from_json.side_effect = RuntimeError("disk gone")
+            result = runner.invoke(app, ["import-recipes", str(json_file)])
+
+            assert result.exit_code == 1
+            assert "❌ Unexpected error during import: disk gone" in result.stderr
+
+    def test_expected_errors_logged_with_their_message(self, capsys, caplog):
+        """Test that expected errors are shown and debug-logged with the same message."""
+        import logging
+        import typer
+        from mealplanner.cli import _cli_error_boundary
+
+        config = MagicMock(debug=True)
+        with caplog.at_level(logging.ERROR, logger="mealplanner.cli"), pytest.raises(typer.Exit):
+            with _cli_error_boundary(config, "importing recipes", {ValueError: "Import failed"}):
+                raise ValueError("bad file")
+
+        assert "❌ Import failed: bad file" in capsys.readouterr().err
+        assert "Import failed: bad file" in caplog.text
+        assert "Traceback" not in caplog.text
@@ -5,6 +5,7 @@ Tests for the configuration module.
 import json
 import logging
 import os
+import sys
 import pytest
 from pathlib import Path
 from unittest.mock import patch, mock_open
@@ -60,6 +61,13 @@ class TestConfig:
         config = Config(debug=True)
         assert config.debug is True
     
+    def test_attributes_are_slotted(self, clean_env):
+        """Test that Config stores only its declared attributes."""
+        config = Config()
+        assert not hasattr(config, "__dict__")
+        with pytest.raises(AttributeError):
+            config.unexpected = True
+    
     def test_load_env_file(self, clean_env, temp_env_file):
         """Test loading from .env file."""
         # Change to the directory containing the .env file
@@ -78,7 +86,6 @@ class TestConfig:
         assert os.getenv('TEST_VAR') == 'test_value'
         assert os.getenv('ANOTHER_VAR') == 'another_value'
     
-    @patch('mealplanner.config.YAML_AVAILABLE', True)
     def test_load_yaml_file(self, clean_env, temp_yaml_file):
         """Test loading from YAML file."""
         with patch('yaml.safe_load') as mock_yaml:
@@ -88,11 +95,24 @@ class TestConfig:
             assert os.getenv('TEST_VAR') == 'yaml_value'
             assert os.getenv('YAML_SPECIFIC') == 'yaml_only'
     
-    @patch('mealplanner.config.YAML_AVAILABLE', False)
     def test_load_yaml_file_unavailable(self, clean_env, temp_yaml_file):
         """Test loading YAML file when PyYAML is not available."""
-        with pytest.raises(ImportError, match="PyYAML is required"):
-            Config(config_file=str(temp_yaml_file))
+        with patch.dict(sys.modules, {'yaml': None}):
+            with pytest.raises(ImportError, match="PyYAML is required"):
+                Config(config_file=str(temp_yaml_file))
+    
+    def test_dotenv_not_imported_without_env_file(self, clean_env, tmp_path, monkeypatch):
+        """Test that python-dotenv is only imported when a dotenv file is loaded."""
+        monkeypatch.chdir(tmp_path)
+        with patch.dict(sys.modules, {'dotenv': None}):
+            config = Config()
+        assert config.config_file is None
+    
+    def test_yaml_not_imported_for_env_files(self, clean_env, temp_env_file):
+        """Test that PyYAML is only imported when a YAML config file is loaded."""
+        with patch.dict(sys.modules, {'yaml': None}):
+            config = Config(config_file=str(temp_env_file))
+        assert config.config_file == str(temp_env_file)
     
     def test_load_nonexistent_file(self, clean_env):
         """Test loading non-existent config file."""
@@ -134,6 +154,22 @@ class TestConfig:
         config = Config()
         with pytest.raises(ValueError, match="Required environment variable not set"):
             config.get_required('MISSING_REQUIRED_VAR')
+    
+    def test_get_is_cached_until_invalidated(self, clean_env):
+        """Test that environment values are read once until invalidated."""
+        os.environ['CACHED_VAR'] = 'first'
+        config = Config()
+        assert config.get('CACHED_VAR') == 'first'
+
+        os.environ['CACHED_VAR'] = 'second'
+        assert config.get('CACHED_VAR') == 'first'
+
+        config.invalidate('CACHED_VAR')
+        assert config.get('CACHED_VAR') == 'second'
+
+        del os.environ['CACHED_VAR']
+        config.invalidate()
+        assert config.get('CACHED_VAR', 'default') == 'default'
 
 
 class TestLogging:
@@ -236,6 +272,28 @@ class TestJSONFormatter:
         assert parsed["message"] == "Test message"
 
 
+    def test_json_formatter_is_shared_and_compact(self, clean_env):
+        """Test that Config installs the module-level formatter with compact output."""
+        from mealplanner.config import Config, JSONFormatter
+
+        Config()
+        formatter = logging.getLogger().handlers[0].formatter
+        assert type(formatter) is JSONFormatter
+
+        record = logging.LogRecord("test", logging.INFO, "test.py", 1, "hello", (), None)
+        assert ", " not in formatter.format(record)
+
+    def test_console_handler_reused_across_configs(self, clean_env):
+        """Test that re-creating Config keeps a single, reused console handler."""
+        from mealplanner.config import Config
+
+        Config()
+        first = logging.getLogger().handlers[0]
+        Config(debug=True)
+
+        assert logging.getLogger().handlers == [first]
+        assert logging.getLogger().level == logging.DEBUG
+
 class TestConfigEdgeCases:
     """Test edge cases in configuration."""
 
@@ -250,14 +308,13 @@ nested_value: "string_value"
 """
         yaml_file.write_text(yaml_content)
 
-        with patch('mealplanner.config.YAML_AVAILABLE', True):
-            with patch('yaml.safe_load') as mock_yaml:
-                mock_yaml.return_value = {
-                    'database': {'host': 'localhost', 'port': 5432},
-                    'nested_value': 'string_value'
-                }
-
-                config = Config(config_file=str(yaml_file))
-                # Should convert complex values to strings
-                assert os.getenv('database') == "{'host': 'localhost', 'port': 5432}"
-                assert os.getenv('nested_value') == 'string_value'
+        with patch('yaml.safe_load') as mock_yaml:
+            mock_yaml.return_value = {
+                'database': {'host': 'localhost', 'port': 5432},
+                'nested_value': 'string_value'
+            }
+
+            config = Config(config_file=str(yaml_file))
+            # Should convert complex values to strings
+            assert os.getenv('database') == "{'host': 'localhost', 'port': 5432}"
+            assert os.getenv('nested_value') == 'string_value'
@@ -66,7 +66,7 @@ class TestEmailNotificationManager:
         """Test successful SMTP connection test."""
         mock_get_config.return_value = self.mock_config
         mock_server = Mock()
-        mock_smtp.return_value.__enter__.return_value = mock_server
+        mock_smtp.return_value = mock_server
         
         manager = EmailNotificationManager()
         result = manager.test_connection()
@@ -111,7 +111,7 @@ class TestEmailNotificationManager:
         """Test successful email sending."""
         mock_get_config.return_value = self.mock_config
         mock_server = Mock()
-        mock_smtp.return_value.__enter__.return_value = mock_server
+        mock_smtp.return_value = mock_server
         
         manager = EmailNotificationManager()
         
@@ -127,6 +127,10 @@ class TestEmailNotificationManager:
         mock_server.starttls.assert_called_once()
         mock_server.login.assert_called_once_with('test@test.com', 'testpass')
         mock_server.send_message.assert_called_once()
+        
+        msg = mock_server.send_message.call_args[0][0]
+        assert msg.get_content_type() == 'multipart/alternative'
+        assert msg.policy.linesep == '\r\n'
     
     @patch('mealplanner.email_notifications.get_config')
     @patch('mealplanner.email_notifications.smtplib.SMTP')
@@ -134,7 +138,7 @@ class TestEmailNotificationManager:
         """Test email sending with attachments."""
         mock_get_config.return_value = self.mock_config
         mock_server = Mock()
-        mock_smtp.return_value.__enter__.return_value = mock_server
+        mock_smtp.return_value = mock_server
         
         manager = EmailNotificationManager()
         
@@ -152,6 +156,12 @@ class TestEmailNotificationManager:
         
         assert result is True
         mock_server.send_message.assert_called_once()
+        
+        msg = mock_server.send_message.call_args[0][0]
+        assert msg.get_content_type() == 'multipart/mixed'
+        attached = list(msg.iter_attachments())
+        assert [part.get_filename() for part in attached] == ['test.txt', 'test.csv']
+        assert attached[0].get_content() == b'test content'
     
     @patch('mealplanner.email_notifications.get_config')
     @patch('mealplanner.email_notifications.smtplib.SMTP')
@@ -159,7 +169,7 @@ class TestEmailNotificationManager:
         """Test email sending with CC and BCC recipients."""
         mock_get_config.return_value = self.mock_config
         mock_server = Mock()
-        mock_smtp.return_value.__enter__.return_value = mock_server
+        mock_smtp.return_value = mock_server
         
         manager = EmailNotificationManager()
         
@@ -213,6 +223,49 @@ class TestEmailNotificationManager:
                 html_content="<h1>Test HTML</h1>"
             )
     
+    @patch('mealplanner.email_notifications.get_config')
+    @patch('mealplanner.email_notifications.smtplib.SMTP')
+    def test_send_email_reuses_connection(self, mock_smtp, mock_get_config):
+        """Test that consecutive sends share one authenticated connection."""
+        mock_get_config.return_value = self.mock_config
+        mock_server = Mock()
+        mock_smtp.return_value = mock_server
+        
+        with EmailNotificationManager() as manager:
+            for subject in ("First", "Second"):
+                manager.send_email(
+                    to_email="recipient@test.com",
+                    subject=subject,
+                    html_content="<h1>Test HTML</h1>"
+                )
+        
+        mock_smtp.assert_called_once_with('smtp.test.com', 587)
+        mock_server.login.assert_called_once()
+        mock_server.rset.assert_called_once()
+        assert mock_server.send_message.call_count == 2
+        mock_server.quit.assert_called_once()
+    
+    @patch('mealplanner.email_notifications.get_config')
+    @patch('mealplanner.email_notifications.smtplib.SMTP')
+    def test_send_email_reconnects_after_disconnect(self, mock_smtp, mock_get_config):
+        """Test that a dropped connection is replaced before the next send."""
+        mock_get_config.return_value = self.mock_config
+        stale_server, fresh_server = Mock(), Mock()
+        stale_server.rset.side_effect = smtplib.SMTPServerDisconnected("gone")
+        mock_smtp.side_effect = [stale_server, fresh_server]
+        
+        manager = EmailNotificationManager()
+        for subject in ("First", "Second"):
+            manager.send_email(
+                to_email="recipient@test.com",
+                subject=subject,
+                html_content="<h1>Test HTML</h1>"
+            )
+        
+        assert mock_smtp.call_count == 2
+        stale_server.close.assert_called_once()
+        fresh_server.send_message.assert_called_once()
+    
     @patch('mealplanner.email_notifications.get_config')
     @patch('mealplanner.email_notifications.MealPlanner')
     @patch('mealplanner.email_notifications.EmailTemplateManager')
@@ -303,3 +356,74 @@ class TestEmailNotificationManager:
         )
         
         assert result is False
+    
+    @patch('mealplanner.email_notifications.get_config')
+    def test_calculate_nutrition_summary(self, mock_get_config):
+        """Test nutrition totals are scaled by servings and skip plans without recipes."""
+        mock_get_config.return_value = self.mock_config
+        
+        recipe = Mock(calories=400, protein=20, carbs=50, fat=10, fiber=None, sodium=300)
+        plans = [Mock(recipe=recipe, servings=2), Mock(recipe=None, servings=1)]
+        
+        manager = EmailNotificationManager()
+        summary = manager._calculate_nutrition_summary(plans)
+        
+        assert summary['total'] == {
+            'calories': 800, 'protein': 40, 'carbs': 100,
+            'fat': 20, 'fiber': 0, 'sodium': 600
+        }
+        assert summary['average']['avg_calories'] == 400
+        assert summary['meal_count'] == 2
+        assert summary['recipe_count'] == 1
+    
+    @patch('mealplanner.email_notifications.get_config')
+    @patch('mealplanner.email_notifications.ShoppingListGenerator')
+    @patch.object(EmailNotificationManager, 'send_email')
+    def test_send_shopping_list_with_provided_list(self, mock_send_email, mock_generator, mock_get_config):
+        """Test that a caller-supplied shopping list is not regenerated."""
+        mock_get_config.return_value = self.mock_config
+        mock_send_email.return_value = True
+        
+        shopping_list = Mock()
+        shopping_list.items = [Mock()]
+        
+        manager = EmailNotificationManager()
+        with patch.object(manager, '_get_template_manager') as mock_templates:
+            mock_templates.return_value.render_shopping_list.return_value = ("<html/>", "text")
+            result = manager.send_shopping_list(
+                to_email="test@test.com",
+                start_date=date(2024, 1, 15),
+                include_attachment=False,
+                shopping_list=shopping_list
+            )
+        
+        assert result is True
+        mock_generator.generate_from_date_range.assert_not_called()
+        mock_templates.return_value.render_shopping_list.assert_called_once_with(shopping_list=shopping_list)
+    
+    @patch('mealplanner.email_notifications.get_config')
+    @patch('mealplanner.email_notifications.MealPlanner')
+    @patch.object(EmailNotificationManager, 'send_email')
+    def test_send_nutrition_summary_with_provided_data(self, mock_send_email, mock_meal_planner, mock_get_config):
+        """Test that supplied plans and totals skip the fetch and the recalculation."""
+        mock_get_config.return_value = self.mock_config
+        mock_send_email.return_value = True
+        
+        meal_plans = [Mock()]
+        nutrition_data = {'total': {}, 'average': {}, 'meal_count': 1, 'recipe_count': 1}
+        
+        manager = EmailNotificationManager()
+        with patch.object(manager, '_get_template_manager') as mock_templates, \
+             patch.object(manager, '_calculate_nutrition_summary') as mock_calculate:
+            mock_templates.return_value.render_nutrition_summary.return_value = ("<html/>", "text")
+            result = manager.send_nutrition_summary(
+                to_email="test@test.com",
+                target_date=date(2024, 1, 15),
+                meal_plans=meal_plans,
+                nutrition_data=nutrition_data
+            )
+        
+        assert result is True
+        mock_meal_planner.get_plans_for_date_range.assert_not_called()
+        mock_calculate.assert_not_called()
+        assert mock_templates.return_value.render_nutrition_summary.call_args[1]['nutrition_data'] is nutrition_data
@@ -3,7 +3,7 @@ Tests for the ingredient management module.
 """
 
 import pytest
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 from unittest.mock import patch, MagicMock
@@ -219,6 +219,27 @@ class TestIngredientManager:
             assert ingredient.name == "Updated Chicken"
             mock_session_obj.commit.assert_called_once()
     
+    def test_update_ingredient_issues_single_update(self, engine, session, sample_ingredients):
+        """Test that a multi-field update is written as one UPDATE statement."""
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            with patch('mealplanner.ingredient_management.get_db_session') as mock_session:
+                mock_session.return_value.__enter__.return_value = session
+                IngredientManager.update_ingredient(
+                    sample_ingredients[0].id,
+                    {"calories_per_100g": 170, "protein_per_100g": 32.0, "fat_per_100g": 4.0}
+                )
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        updates = [sql for sql in statements if sql.lstrip().upper().startswith("UPDATE")]
+        assert len(updates) == 1
+
     def test_update_ingredient_not_found(self):
         """Test updating non-existent ingredient."""
         with patch('mealplanner.ingredient_management.get_db_session') as mock_session:
@@ -240,6 +261,18 @@ class TestIngredientManager:
             mock_session_obj.delete.assert_called_once()
             mock_session_obj.commit.assert_called_once()
     
+    def test_delete_ingredient_clears_statistics_cache(self, sample_ingredients):
+        """Test that deleting an ingredient drops cached statistics."""
+        with patch('mealplanner.ingredient_management.get_db_session') as mock_session, \
+             patch('mealplanner.ingredient_management.invalidate_statistics_cache') as mock_invalidate:
+            mock_session_obj = MagicMock()
+            mock_session_obj.query.return_value.filter.return_value.first.return_value = sample_ingredients[0]
+            mock_session_obj.query.return_value.filter.return_value.count.return_value = 0
+            mock_session.return_value.__enter__.return_value = mock_session_obj
+            
+            IngredientManager.delete_ingredient(1)
+            mock_invalidate.assert_called_once_with()
+    
     def test_delete_ingredient_not_found(self):
         """Test deleting non-existent ingredient."""
         with patch('mealplanner.ingredient_management.get_db_session') as mock_session:
@@ -269,6 +302,20 @@ class TestIngredientManager:
             assert stats['avg_calories_per_100g'] == 103.3
             assert 'most_used' in stats
     
+    def test_get_extended_statistics(self, session, sample_ingredients):
+        """Test the single-query nutrition group counts against a real database."""
+        with patch('mealplanner.ingredient_management.get_db_session') as mock_session:
+            mock_session.return_value.__enter__.return_value = session
+
+            stats = IngredientManager.get_extended_statistics()
+
+            assert stats == {'high_protein': 1, 'low_calorie': 1, 'high_fiber': 0, 'categories': 3}
+
+            stats = IngredientManager.get_extended_statistics(min_protein=2.7, max_calories=120, min_fiber=2)
+            assert stats['high_protein'] == 2
+            assert stats['low_calorie'] == 2
+            assert stats['high_fiber'] == 1
+
     def test_bulk_import_ingredients_success(self):
         """Test successful bulk ingredient import."""
         ingredients_data = [
@@ -357,3 +404,10 @@ class TestIngredientFormatter:
         assert "Minimal Ingredient" in details
         assert "ID: 1" in details
         # Should not contain optional fields that are None
+    
+    def test_iter_ingredient_details_matches_formatted_string(self, sample_ingredients):
+        """Test that the line iterator yields exactly the formatted details."""
+        for ingredient in sample_ingredients:
+            lines = list(IngredientFormatter.iter_ingredient_details(ingredient))
+            assert "\n".join(lines) == IngredientFormatter.format_ingredient_details(ingredient)
+            assert not any("\n" in line for line in lines)
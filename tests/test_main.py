@@ -0,0 +1,80 @@
+"""
+Tests for the package entry point.
+"""
+
+import os
+import subprocess
+import sys
+from unittest.mock import patch
+
+from mealplanner import __version__
+from mealplanner.__main__ import main
+
+
+class TestEntryPoint:
+    """Test the python -m mealplanner front door."""
+
+    def test_version_answered_without_cli(self, capsys):
+        """Test that a bare --version prints the version without running the CLI."""
+        with patch.object(sys, 'argv', ['mealplanner', '--version']), \
+             patch('mealplanner.cli.cli_main') as mock_cli_main:
+            main()
+
+        assert capsys.readouterr().out.strip() == f"Smart Meal Planner version {__version__}"
+        mock_cli_main.assert_not_called()
+
+    def test_other_arguments_delegate_to_cli(self):
+        """Test that commands and help are handed to the Typer CLI."""
+        for argv in (['mealplanner', 'hello'], ['mealplanner', '--help'], ['mealplanner', '--debug', '--version']):
+            with patch.object(sys, 'argv', argv), \
+                 patch('mealplanner.cli.cli_main') as mock_cli_main:
+                main()
+
+            mock_cli_main.assert_called_once_with()
+
+    def test_version_does_not_import_typer(self):
+        """Test that the --version path never imports Typer, Click or the CLI module."""
+        script = (
+            "import sys; sys.argv = ['mealplanner', '--version']; "
+            "from mealplanner.__main__ import main; main(); "
+            "print(sorted(m for m in ('typer', 'click', 'rich', 'mealplanner.cli') if m in sys.modules))"
+        )
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+        result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, env=env, check=True)
+
+        assert result.stdout.splitlines() == [f"Smart Meal Planner version {__version__}", "[]"]
+
+
+class TestStartupImportCost:
+    """Guard the import cost of `mealplanner --help` against regressions."""
+
+    # Generous ceiling for the cumulative import of mealplanner.cli, in microseconds
+    CLI_IMPORT_BUDGET_US = 1_500_000
+
+    # Dependencies that commands import lazily and --help must never load
+    DEFERRED_MODULES = ("sqlalchemy", "requests", "yaml", "dotenv", "smtplib")
+
+    def _import_times(self):
+        """Run --help under -X importtime and return {module: cumulative microseconds}."""
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-m", "mealplanner", "--help"],
+            capture_output=True, text=True, env=env
+        )
+        assert result.returncode == 0, result.stderr
+
+        times = {}
+        for line in result.stderr.splitlines():
+            if not line.startswith("import time:") or "cumulative" in line:
+                continue
+            _, cumulative, name = line[len("import time:"):].split("|")
+            times[name.strip()] = int(cumulative)
+        return times
+
+    def test_help_stays_within_import_budget(self):
+        """Test that --help defers heavy dependencies and keeps the CLI import cheap."""
+        times = self._import_times()
+
+        loaded = sorted(m for m in times if m.split(".")[0] in self.DEFERRED_MODULES)
+        assert loaded == []
+        assert times["mealplanner.cli"] < self.CLI_IMPORT_BUDGET_US
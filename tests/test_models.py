@@ -272,6 +272,12 @@ class TestRecipeIngredientRelationship:
         assert recipe in ingredient1.recipes
         assert recipe in ingredient2.recipes
 
+    def test_ingredient_id_is_indexed(self, engine):
+        """Test that usage lookups by ingredient have their own index."""
+        from sqlalchemy import inspect
+        indexes = inspect(engine).get_indexes('recipe_ingredients')
+        assert any(index['column_names'] == ['ingredient_id'] for index in indexes)
+
 
 class TestModelUtilityFunctions:
     """Test utility functions for model operations."""
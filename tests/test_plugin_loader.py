@@ -7,7 +7,7 @@ import pytest
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
-from mealplanner.plugin_loader import PluginLoader, get_plugin_loader, load_plugins
+from mealplanner.plugin_loader import PluginLoader, get_plugin_loader, load_plugins, clear_plugin_cache
 
 
 @pytest.fixture
@@ -202,6 +202,22 @@ class TestGlobalPluginLoader:
         plugins = load_plugins()
         assert "sample_plugin" in plugins
     
+    def test_load_plugins_is_memoized(self, temp_plugins_dir, sample_plugin_file):
+        """Test that repeated calls reuse results until the directory changes."""
+        loader = PluginLoader(str(temp_plugins_dir))
+        clear_plugin_cache()
+
+        with patch('mealplanner.plugin_loader._plugin_loader', loader), \
+             patch.object(loader, 'load_all_plugins', wraps=loader.load_all_plugins) as mock_load:
+            first = load_plugins()
+            second = load_plugins()
+            assert first is second
+            assert mock_load.call_count == 1
+
+            clear_plugin_cache()
+            load_plugins()
+            assert mock_load.call_count == 2
+
     @patch('mealplanner.plugin_loader._plugin_loader')
     def test_load_plugins_with_mock(self, mock_loader):
         """Test load_plugins function with mocked loader."""
@@ -208,6 +208,28 @@ class TestRecipeImporter:
         with pytest.raises(RecipeImportError, match="Invalid JSON file"):
             importer.import_from_json(invalid_json)
     
+    def test_import_from_json_stdlib_fallback(self, tmp_path):
+        """Test that JSON files parse with the standard library when orjson is absent."""
+        recipe_file = tmp_path / "recipes.json"
+        recipe_file.write_text('[{"title": "Crème brûlée"}]', encoding="utf-8")
+
+        with patch('mealplanner.recipe_import.ORJSON_AVAILABLE', False), \
+             patch.object(RecipeImporter, '_import_recipes', return_value=(1, 0, [])) as mock_import:
+            RecipeImporter().import_from_json(recipe_file)
+
+        assert mock_import.call_args[0][0] == [{"title": "Crème brûlée"}]
+
+    def test_import_from_json_with_orjson(self, tmp_path):
+        """Test that orjson is used for JSON files when installed."""
+        pytest.importorskip("orjson")
+        recipe_file = tmp_path / "recipes.json"
+        recipe_file.write_text('{"title": "Soup"}', encoding="utf-8")
+
+        with patch.object(RecipeImporter, '_import_recipes', return_value=(1, 0, [])) as mock_import:
+            RecipeImporter().import_from_json(recipe_file)
+
+        assert mock_import.call_args[0][0] == [{"title": "Soup"}]
+    
     def test_import_from_csv(self, sample_csv_file):
         """Test importing from CSV file."""
         with patch('mealplanner.recipe_import.get_db_session') as mock_session:
@@ -315,3 +337,19 @@ class TestRecipeImporter:
             assert skipped == 0
             assert len(errors) == 1
             assert "Missing required field: title" in errors[0]
+    
+    def test_import_recipes_reports_progress(self):
+        """Test that progress is reported every PROGRESS_INTERVAL rows and at the end."""
+        recipes_data = [{"title": f"Recipe {i}"} for i in range(5)]
+        calls = []
+
+        with patch('mealplanner.recipe_import.get_db_session') as mock_session, \
+             patch('mealplanner.recipe_import.PROGRESS_INTERVAL', 2):
+            mock_session.return_value.__enter__.return_value = MagicMock()
+
+            importer = RecipeImporter()
+            importer._import_recipes(
+                recipes_data, skip_duplicates=False, progress=lambda *args: calls.append(args)
+            )
+
+        assert calls == [(2, 2, 0), (4, 4, 0), (5, 5, 0)]
@@ -113,6 +113,34 @@ class TestRecipeManager:
             assert total_count == 3
             assert total_pages == 1
     
+    def test_iter_recipes_streams_and_detaches(self, sample_recipes):
+        """Test that iter_recipes yields recipes in batches and detaches each one."""
+        with patch('mealplanner.recipe_management.get_db_session') as mock_session:
+            mock_session_obj = MagicMock()
+            mock_query = MagicMock()
+            mock_query.order_by.return_value = mock_query
+            mock_query.offset.return_value.limit.return_value.yield_per.return_value = iter(sample_recipes)
+            mock_session_obj.query.return_value = mock_query
+            mock_session.return_value.__enter__.return_value = mock_session_obj
+
+            recipes = list(RecipeManager.iter_recipes(page=2, per_page=3))
+
+            assert [r.title for r in recipes] == [r.title for r in sample_recipes]
+            mock_query.offset.assert_called_once_with(3)
+            mock_query.offset.return_value.limit.assert_called_once_with(3)
+            assert mock_session_obj.expunge.call_count == 3
+
+    def test_count_recipes(self):
+        """Test counting recipes without fetching them."""
+        with patch('mealplanner.recipe_management.get_db_session') as mock_session:
+            mock_query = MagicMock()
+            mock_query.filter.return_value = mock_query
+            mock_query.order_by.return_value = mock_query
+            mock_query.count.return_value = 7
+            mock_session.return_value.__enter__.return_value.query.return_value = mock_query
+
+            assert RecipeManager.count_recipes(cuisine="Italian") == 7
+
     def test_list_recipes_with_cuisine_filter(self, sample_recipes):
         """Test recipe listing with cuisine filter."""
         with patch('mealplanner.recipe_management.get_db_session') as mock_session:
@@ -232,6 +260,18 @@ class TestRecipeManager:
             success = RecipeManager.delete_recipe(1)
             assert success is True
     
+    def test_delete_recipe_clears_statistics_cache(self, sample_recipes):
+        """Test that deleting a recipe drops usage-derived ingredient statistics."""
+        with patch('mealplanner.recipe_management.get_db_session') as mock_session, \
+             patch('mealplanner.recipe_management.invalidate_statistics_cache') as mock_invalidate:
+            mock_session_obj = MagicMock()
+            mock_session_obj.query.return_value.filter.return_value.first.return_value = sample_recipes[0]
+            mock_session_obj.query.return_value.filter.return_value.count.return_value = 0
+            mock_session.return_value.__enter__.return_value = mock_session_obj
+            
+            RecipeManager.delete_recipe(1)
+            mock_invalidate.assert_called_once_with()
+    
     def test_delete_recipe_not_found(self):
         """Test deleting non-existent recipe."""
         with patch('mealplanner.recipe_management.get_db_session') as mock_session:
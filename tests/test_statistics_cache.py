@@ -0,0 +1,51 @@
+"""
+Tests for the statistics cache module.
+"""
+
+import pytest
+from unittest.mock import patch, MagicMock
+
+from mealplanner.statistics_cache import cached_statistics, invalidate_statistics_cache
+
+
+@pytest.fixture(autouse=True)
+def mock_engine():
+    """Key the cache on a fake engine and start each test with it empty."""
+    invalidate_statistics_cache()
+    with patch('mealplanner.statistics_cache.get_engine') as mock_get_engine:
+        mock_get_engine.return_value.url = "sqlite:///first.db"
+        yield mock_get_engine
+    invalidate_statistics_cache()
+
+
+class TestStatisticsCache:
+    """Test the in-process statistics cache."""
+
+    def test_reused_until_invalidated(self):
+        """Test that statistics are computed once until a write invalidates them."""
+        compute = MagicMock(return_value={'total_ingredients': 3})
+
+        assert cached_statistics("stats", compute) == {'total_ingredients': 3}
+        assert cached_statistics("stats", compute) == {'total_ingredients': 3}
+        assert compute.call_count == 1
+
+        invalidate_statistics_cache()
+        cached_statistics("stats", compute)
+        assert compute.call_count == 2
+
+    def test_keyed_on_database_url(self, mock_engine):
+        """Test that statistics cached for one database are not served for another."""
+        compute = MagicMock(return_value={})
+
+        cached_statistics("stats", compute)
+        mock_engine.return_value.url = "sqlite:///second.db"
+        cached_statistics("stats", compute)
+        assert compute.call_count == 2
+
+    def test_expires_after_ttl(self):
+        """Test that a zero TTL always recomputes."""
+        compute = MagicMock(return_value={})
+
+        cached_statistics("stats", compute, ttl=0)
+        cached_statistics("stats", compute, ttl=0)
+        assert compute.call_count == 2